@@ -0,0 +1,35 @@
+"""Replace the audit session_id index with a (session_id, timestamp) composite.
+
+Staff audit queries filter by session and time window together. The
+composite index serves both and its leading column still covers
+session-only lookups, so the single-column index is dropped.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_events_session_id_timestamp",
+        "audit_events",
+        ["session_id", "timestamp"],
+    )
+    op.drop_index("ix_audit_events_session_id", table_name="audit_events")
+
+
+def downgrade() -> None:
+    op.create_index("ix_audit_events_session_id", "audit_events", ["session_id"])
+    op.drop_index("ix_audit_events_session_id_timestamp", table_name="audit_events")
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from municipal.core.types import SessionType
 
@@ -25,6 +25,10 @@ class AuthResult(BaseModel):
 
 
 class TokenValidation(BaseModel):
+    # Frozen: MockAuthProvider hands the same instance to every caller
+    # validating a given token.
+    model_config = ConfigDict(frozen=True)
+
     valid: bool
     user_id: str | None = None
     tier: SessionType = SessionType.ANONYMOUS
@@ -7,10 +7,9 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
-import yaml
-
 from municipal.auth.models import AuthCredentials, AuthResult, TokenValidation
 from municipal.core.types import SessionType
+from municipal.core.yaml_io import safe_load
 
 _DEFAULT_FIXTURES_PATH = Path(__file__).resolve().parents[3] / "config" / "auth_fixtures.yml"
 
@@ -49,7 +48,7 @@ class MockAuthProvider:
         if not path.exists():
             return
         with open(path) as fh:
-            data = yaml.safe_load(fh) or {}
+            data = safe_load(fh) or {}
         for user in data.get("users", []):
             self._users[user["username"]] = user
 
@@ -96,12 +95,18 @@ class MockAuthProvider:
             del self._tokens[token]
             return TokenValidation(valid=False)
 
-        return TokenValidation(
-            valid=True,
-            user_id=info["user_id"],
-            tier=info["tier"],
-            expires_at=info["expires_at"],
-        )
+        # The result only depends on the token record, so build it once and
+        # keep it on the record. Revoking, refreshing or expiring the token
+        # drops the record and the memoized result with it.
+        validation = info.get("validation")
+        if validation is None:
+            validation = info["validation"] = TokenValidation(
+                valid=True,
+                user_id=info["user_id"],
+                tier=info["tier"],
+                expires_at=info["expires_at"],
+            )
+        return validation
 
     def refresh_token(self, token: str) -> AuthResult:
         info = self._tokens.get(token)
@@ -112,7 +117,9 @@ class MockAuthProvider:
         del self._tokens[token]
         new_token = str(uuid.uuid4())
         self._tokens[new_token] = {
-            **info,
+            "user_id": info["user_id"],
+            "tier": info["tier"],
+            "display_name": info["display_name"],
             "expires_at": datetime.now(timezone.utc) + self._token_expiry,
         }
         return AuthResult(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 from municipal.bridge.base import BaseBridgeAdapter
@@ -104,6 +105,17 @@ class MockPermitStatusAdapter(BaseBridgeAdapter):
             )
         super().__init__(config, **kwargs)
         self._permits = list(_FIXTURE_PERMITS)
+        # Indexes built once so lookups don't scan the permit list.
+        self._by_id: dict[str, dict[str, Any]] = {p["permit_id"]: p for p in self._permits}
+        by_parcel: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        for p in self._permits:
+            by_parcel[p["parcel_id"]].append(p)
+        self._by_parcel: dict[str, list[dict[str, Any]]] = dict(by_parcel)
+        # Applicant search is a case-insensitive substring match, so keep
+        # pre-lowered names rather than an exact-key index.
+        self._applicants_lower: list[tuple[str, dict[str, Any]]] = [
+            (p["applicant"].lower(), p) for p in self._permits
+        ]
 
     def _get_operations(self) -> list[str]:
         return [
@@ -118,19 +130,19 @@ class MockPermitStatusAdapter(BaseBridgeAdapter):
 
         if op == Operation.LOOKUP_BY_ID:
             permit_id = params.get("permit_id", "")
-            result = [p for p in self._permits if p["permit_id"] == permit_id]
-            if result:
-                return NormalizedResponse(success=True, data=result[0])
+            permit = self._by_id.get(permit_id)
+            if permit is not None:
+                return NormalizedResponse(success=True, data=permit)
             return NormalizedResponse(success=False, error=f"Permit {permit_id!r} not found")
 
         if op == Operation.LOOKUP_BY_PARCEL:
             parcel_id = params.get("parcel_id", "")
-            results = [p for p in self._permits if p["parcel_id"] == parcel_id]
+            results = list(self._by_parcel.get(parcel_id, ()))
             return NormalizedResponse(success=True, data=results)
 
         if op == Operation.LOOKUP_BY_APPLICANT:
             applicant = params.get("applicant", "").lower()
-            results = [p for p in self._permits if applicant in p["applicant"].lower()]
+            results = [p for name, p in self._applicants_lower if applicant in name]
             return NormalizedResponse(success=True, data=results)
 
         return NormalizedResponse(
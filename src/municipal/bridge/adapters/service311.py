@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import uuid
+from collections import defaultdict
+from collections.abc import Callable
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
@@ -125,42 +127,53 @@ class Mock311Adapter(BaseBridgeAdapter):
             )
         super().__init__(config, **kwargs)
         self._tickets: dict[str, Ticket] = {}
+        # Secondary indexes for list_tickets filters. Inner dicts keep
+        # insertion order so filtered results match the unfiltered order.
+        self._by_status: defaultdict[str, dict[str, Ticket]] = defaultdict(dict)
+        self._by_category: defaultdict[str, dict[str, Ticket]] = defaultdict(dict)
+        self._handlers: dict[str, Callable[[dict[str, Any]], NormalizedResponse]] = {
+            Operation.LIST_TICKETS: self._list_tickets,
+            Operation.GET_TICKET: self._get_ticket,
+            Operation.CREATE_TICKET: self._create_ticket,
+            Operation.ADD_NOTE: self._add_note,
+        }
         self._load_fixtures()
 
     def _load_fixtures(self) -> None:
         for data in _FIXTURE_TICKETS:
-            ticket = Ticket(**data)
-            self._tickets[ticket.ticket_id] = ticket
+            self._store(Ticket(**data))
+
+    def _store(self, ticket: Ticket) -> None:
+        self._tickets[ticket.ticket_id] = ticket
+        self._by_status[ticket.status.value][ticket.ticket_id] = ticket
+        self._by_category[ticket.category][ticket.ticket_id] = ticket
 
     def _get_operations(self) -> list[str]:
-        return [
-            Operation.LIST_TICKETS,
-            Operation.GET_TICKET,
-            Operation.CREATE_TICKET,
-            Operation.ADD_NOTE,
-        ]
+        return list(self._handlers)
 
     def _do_query(self, request: NormalizedRequest) -> NormalizedResponse:
-        op = request.operation
-        params = request.params
-
-        if op == Operation.LIST_TICKETS:
-            return self._list_tickets(params)
-        if op == Operation.GET_TICKET:
-            return self._get_ticket(params)
-        if op == Operation.CREATE_TICKET:
-            return self._create_ticket(params)
-        if op == Operation.ADD_NOTE:
-            return self._add_note(params)
-
-        return NormalizedResponse(success=False, error=f"Unknown operation: {op}")
+        handler = self._handlers.get(request.operation)
+        if handler is None:
+            return NormalizedResponse(
+                success=False, error=f"Unknown operation: {request.operation}"
+            )
+        return handler(request.params)
 
     def _list_tickets(self, params: dict[str, Any]) -> NormalizedResponse:
-        tickets = list(self._tickets.values())
+        indexes: list[dict[str, Ticket]] = []
         if "status" in params:
-            tickets = [t for t in tickets if t.status == params["status"]]
+            indexes.append(self._by_status.get(params["status"], {}))
         if "category" in params:
-            tickets = [t for t in tickets if t.category == params["category"]]
+            indexes.append(self._by_category.get(params["category"], {}))
+        if not indexes:
+            tickets = list(self._tickets.values())
+        else:
+            # Walk the smallest index and probe the others by ticket id.
+            indexes.sort(key=len)
+            smallest, rest = indexes[0], indexes[1:]
+            tickets = [
+                t for tid, t in smallest.items() if all(tid in idx for idx in rest)
+            ]
         return NormalizedResponse(
             success=True,
             data=[t.model_dump(mode="json") for t in tickets],
@@ -182,7 +195,7 @@ class Mock311Adapter(BaseBridgeAdapter):
             contact_email=params.get("contact_email", ""),
             contact_phone=params.get("contact_phone", ""),
         )
-        self._tickets[ticket.ticket_id] = ticket
+        self._store(ticket)
         return NormalizedResponse(success=True, data=ticket.model_dump(mode="json"))
 
     def _add_note(self, params: dict[str, Any]) -> NormalizedResponse:
@@ -2,19 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
+
 from municipal.bridge.base import BridgeAdapter
 from municipal.bridge.models import AdapterSchema, ConnectionStatus
 
+logger = logging.getLogger(__name__)
+
 
 class AdapterRegistry:
     """Registry for bridge adapters. Provides register/get/list and health checking."""
 
     def __init__(self) -> None:
         self._adapters: dict[str, BridgeAdapter] = {}
+        self._health_cache: tuple[float, dict[str, ConnectionStatus]] | None = None
 
     def register(self, adapter: BridgeAdapter) -> None:
         """Register a bridge adapter."""
         self._adapters[adapter.name] = adapter
+        self._health_cache = None
 
     def get(self, name: str) -> BridgeAdapter | None:
         """Get an adapter by name."""
@@ -28,6 +36,41 @@ class AdapterRegistry:
         """Run health checks on all adapters."""
         return {name: adapter.health_check() for name, adapter in self._adapters.items()}
 
+    def cached_health_check_all(self, ttl: float = 5.0) -> dict[str, ConnectionStatus]:
+        """Return :meth:`health_check_all`, reusing the last result for *ttl* seconds.
+
+        Intended for frequently polled summaries where probing every
+        adapter on each call would dominate. Registering an adapter
+        discards the cached result.
+        """
+        cached = self._health_cache
+        now = time.monotonic()
+        if cached is None or now - cached[0] >= ttl:
+            cached = (now, self.health_check_all())
+            self._health_cache = cached
+        return dict(cached[1])
+
+    async def health_check_all_async(self) -> dict[str, ConnectionStatus]:
+        """Run health checks on all adapters concurrently.
+
+        Each (synchronous, possibly network-bound) check runs in a worker
+        thread, so total latency is that of the slowest adapter rather than
+        the sum. An adapter whose check raises is reported as DISCONNECTED.
+        """
+        names = list(self._adapters)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._adapters[name].health_check) for name in names),
+            return_exceptions=True,
+        )
+        health: dict[str, ConnectionStatus] = {}
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                logger.warning("Health check failed for adapter %r", name, exc_info=result)
+                health[name] = ConnectionStatus.DISCONNECTED
+            else:
+                health[name] = result
+        return health
+
     @property
     def adapter_names(self) -> list[str]:
         return list(self._adapters.keys())
@@ -8,6 +8,7 @@ deployment).
 from __future__ import annotations
 
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
@@ -52,6 +53,10 @@ class ChatSession(BaseModel):
     )
 
 
+SessionSnapshot = tuple[list[str], list[SessionType], list[datetime], list[datetime], list[int]]
+"""Parallel columns: session_id, session_type, created_at, last_active, message_count."""
+
+
 class SessionManager:
     """In-memory session store.
 
@@ -61,7 +66,9 @@ class SessionManager:
     """
 
     def __init__(self) -> None:
-        self._sessions: dict[str, ChatSession] = {}
+        # Kept in most-recently-active-first order: new sessions and sessions
+        # that receive a message move to the front, so listing needs no sort.
+        self._sessions: OrderedDict[str, ChatSession] = OrderedDict()
 
     def create_session(
         self, session_type: SessionType = SessionType.ANONYMOUS
@@ -76,6 +83,7 @@ class SessionManager:
         """
         session = ChatSession(session_type=session_type)
         self._sessions[session.session_id] = session
+        self._sessions.move_to_end(session.session_id, last=False)
         return session
 
     def get_session(self, session_id: str) -> ChatSession | None:
@@ -104,6 +112,7 @@ class SessionManager:
             raise KeyError(f"Session {session_id!r} not found")
         session.messages.append(message)
         session.last_active = datetime.now(timezone.utc)
+        self._sessions.move_to_end(session_id, last=False)
 
     def list_active_sessions(self) -> list[ChatSession]:
         """Return all sessions, ordered by most recently active first.
@@ -111,8 +120,35 @@ class SessionManager:
         Returns:
             List of all ChatSession instances.
         """
-        return sorted(
-            self._sessions.values(),
-            key=lambda s: s.last_active,
-            reverse=True,
+        return list(self._sessions.values())
+
+    def count_active(self) -> int:
+        """Return the number of sessions without materializing them.
+
+        Returns:
+            The session count.
+        """
+        return len(self._sessions)
+
+    def list_active_snapshot(self) -> SessionSnapshot:
+        """Return session summaries as parallel columns, most recently active first.
+
+        Lets listing views read summary fields without handling full
+        ChatSession objects or their message lists.
+
+        Returns:
+            A SessionSnapshot of (session_ids, session_types, created_ats,
+            last_actives, message_counts).
+        """
+        sessions = self.list_active_sessions()
+        return (
+            [s.session_id for s in sessions],
+            [s.session_type for s in sessions],
+            [s.created_at for s in sessions],
+            [s.last_active for s in sessions],
+            [len(s.messages) for s in sessions],
         )
+
+    def clear(self) -> None:
+        """Remove all sessions (useful for testing)."""
+        self._sessions.clear()
@@ -9,9 +9,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from municipal.core.types import DataClassification
+from municipal.core.yaml_io import load_config_file
 
 # Default path to the classification rules config
 _DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[3] / "config" / "data_classification.yml"
@@ -56,20 +55,33 @@ class ClassificationEngine:
 
     Loads rules from a YAML config file and evaluates them in order.
     First matching rule wins. Falls back to the configured default
-    classification (Sensitive) when no rule matches.
+    classification (Sensitive) when no rule matches. Use :meth:`from_dict`
+    to build an engine from an already-parsed config.
     """
 
-    def __init__(self, config_path: str | Path | None = None) -> None:
-        self._config_path = Path(config_path) if config_path else _DEFAULT_CONFIG_PATH
+    def __init__(
+        self,
+        config_path: str | Path | None = None,
+        *,
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        # A config dict takes precedence and leaves no file to read.
+        self._config_path: Path | None = None
+        if config is None:
+            self._config_path = Path(config_path) if config_path else _DEFAULT_CONFIG_PATH
+            config = load_config_file(self._config_path)
+        self._apply_config(config)
+
+    @classmethod
+    def from_dict(cls, config: dict[str, Any]) -> ClassificationEngine:
+        """Build an engine from a config dict, skipping the YAML file."""
+        return cls(config=config)
+
+    def _apply_config(self, config: dict[str, Any]) -> None:
+        """Parse rules, default and context overrides from a config dict."""
         self._rules: list[ClassificationRule] = []
-        self._default: DataClassification = DataClassification.SENSITIVE
-        self._context_overrides: list[dict[str, str]] = []
-        self._load_config()
-
-    def _load_config(self) -> None:
-        """Load and parse the YAML configuration file."""
-        with open(self._config_path) as fh:
-            config = yaml.safe_load(fh)
+        # resource_type -> first rule listing it, so lookups skip the rule scan
+        self._rule_by_resource: dict[str, ClassificationRule] = {}
 
         for rule_data in config.get("rules", []):
             self._rules.append(
@@ -84,9 +96,14 @@ class ClassificationEngine:
                 )
             )
 
+        for rule in self._rules:
+            for resource_type in rule.resource_types:
+                # setdefault keeps the earliest rule: first match wins
+                self._rule_by_resource.setdefault(resource_type, rule)
+
         default_raw = config.get("default_classification", "sensitive")
-        self._default = DataClassification(default_raw)
-        self._context_overrides = config.get("context_overrides", [])
+        self._default: DataClassification = DataClassification(default_raw)
+        self._context_overrides: list[dict[str, str]] = config.get("context_overrides", [])
 
     def classify(self, resource_type: str, context: dict[str, Any] | None = None) -> DataClassification:
         """Determine classification level for a resource type and context.
@@ -100,13 +117,8 @@ class ClassificationEngine:
             The appropriate DataClassification level.
         """
         context = context or {}
-        classification = self._default
-
-        # Evaluate rules in order; first match wins
-        for rule in self._rules:
-            if rule.matches(resource_type):
-                classification = rule.classification
-                break
+        rule = self._rule_by_resource.get(resource_type)
+        classification = rule.classification if rule is not None else self._default
 
         # Apply context-based overrides
         classification = self._apply_context_overrides(classification, context)
@@ -136,10 +148,7 @@ class ClassificationEngine:
 
     def get_rule(self, resource_type: str) -> ClassificationRule | None:
         """Return the first matching rule for a resource type, or None."""
-        for rule in self._rules:
-            if rule.matches(resource_type):
-                return rule
-        return None
+        return self._rule_by_resource.get(resource_type)
 
     @property
     def rules(self) -> list[ClassificationRule]:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -40,6 +42,9 @@ class AuditConfig(BaseSettings):
     log_dir: str = "data/audit"
     hash_algorithm: str = "sha256"
     secondary_location: str | None = None
+    # "memory" keeps the hash-chained log in process instead of on disk
+    # (for tests and ephemeral runs).
+    backend: Literal["file", "memory"] = "file"
 
 
 class EvalConfig(BaseSettings):
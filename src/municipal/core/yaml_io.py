@@ -0,0 +1,61 @@
+"""YAML load/dump helpers that use libyaml's C implementation when available."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+HAS_LIBYAML: bool = SafeLoader is not yaml.SafeLoader
+
+# path -> (mtime_ns, size, JSON snapshot of the parsed document)
+_snapshots: dict[Path, tuple[int, int, str]] = {}
+_snapshots_lock = threading.Lock()
+
+
+def safe_load(stream: str | bytes | IO[Any]) -> Any:
+    """Drop-in replacement for :func:`yaml.safe_load`."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: IO[Any] | None = None, **kwargs: Any) -> Any:
+    """Drop-in replacement for :func:`yaml.safe_dump`."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def load_config_file(path: str | Path) -> Any:
+    """Parse a YAML config file, reusing a JSON snapshot on repeat loads.
+
+    The first load parses the YAML and keeps a JSON encoding of the result
+    in memory. Later loads of the same unchanged file (same mtime and size)
+    decode that snapshot instead, which is much cheaper than YAML parsing
+    and still hands each caller its own objects. Documents that do not
+    survive a JSON round-trip unchanged (dates, non-string keys) are
+    simply not snapshotted.
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    with _snapshots_lock:
+        cached = _snapshots.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return json.loads(cached[2])
+
+    with open(path) as fh:
+        data = safe_load(fh)
+    try:
+        snapshot = json.dumps(data)
+    except (TypeError, ValueError):
+        return data
+    if json.loads(snapshot) == data:
+        with _snapshots_lock:
+            _snapshots[path] = (stat.st_mtime_ns, stat.st_size, snapshot)
+    return data
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import copy
 from typing import Any
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -12,6 +15,23 @@ from sqlalchemy.ext.asyncio import (
 )
 
 
+def _enable_sqlite_transactions(engine: AsyncEngine) -> None:
+    """Let SQLAlchemy, not the sqlite3 driver, issue BEGIN.
+
+    The driver's implicit transaction handling defers BEGIN until the
+    first write, which breaks SAVEPOINT and rolling back an outer
+    transaction. This is the recipe from the SQLAlchemy SQLite dialect docs.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_begin(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn: Any) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+
 class DatabaseManager:
     """Manages the async SQLAlchemy engine and session factory.
 
@@ -34,19 +54,43 @@ class DatabaseManager:
             kwargs["pool_size"] = pool_size
             kwargs["pool_pre_ping"] = True
         self._engine: AsyncEngine = create_async_engine(database_url, **kwargs)
+        if "sqlite" in database_url:
+            _enable_sqlite_transactions(self._engine)
         self._session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
             self._engine,
             expire_on_commit=False,
         )
+        self._bind: AsyncConnection | None = None
 
     @property
     def engine(self) -> AsyncEngine:
         return self._engine
 
-    def session(self) -> AsyncSession:
-        """Create a new async session."""
+    def session(self, bind: AsyncConnection | None = None) -> AsyncSession:
+        """Create a new async session.
+
+        If *bind* is given, the session runs on that connection and its
+        commits become savepoints inside the connection's open
+        transaction, so the caller can roll everything back (used by tests).
+        """
+        bind = bind if bind is not None else self._bind
+        if bind is not None:
+            return self._session_factory(
+                bind=bind, join_transaction_mode="create_savepoint"
+            )
         return self._session_factory()
 
+    def bound_to(self, conn: AsyncConnection) -> DatabaseManager:
+        """Return a view of this manager whose sessions all run on *conn*.
+
+        The view shares the engine, so repositories built on it see the same
+        schema; see :meth:`session` for how commits behave. Close the
+        original manager, not the view.
+        """
+        view = copy.copy(self)
+        view._bind = conn
+        return view
+
     async def close(self) -> None:
         """Dispose of the engine connection pool."""
         await self._engine.dispose()
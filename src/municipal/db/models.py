@@ -265,7 +265,7 @@ class AuditEventRow(Base):
     entry_hash: Mapped[str] = mapped_column(String(128), default="")
 
     __table_args__ = (
-        Index("ix_audit_events_session_id", "session_id"),
+        Index("ix_audit_events_session_id_timestamp", "session_id", "timestamp"),
         Index("ix_audit_events_timestamp", "timestamp"),
     )
 
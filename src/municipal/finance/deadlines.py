@@ -6,8 +6,7 @@ from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from municipal.core.yaml_io import safe_load
 from municipal.finance.models import DeadlineInfo
 
 
@@ -24,7 +23,7 @@ class DeadlineEngine:
 
     def _load_config(self) -> None:
         with open(self._config_path) as fh:
-            raw = yaml.safe_load(fh) or {}
+            raw = safe_load(fh) or {}
 
         for wizard_type, rule_data in raw.get("deadlines", {}).items():
             wizard_type = str(wizard_type)  # YAML may parse numeric keys as int
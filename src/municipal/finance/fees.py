@@ -5,8 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from municipal.core.yaml_io import safe_load
 from municipal.finance.models import FeeEstimate, FeeLineItem, FeeScheduleEntry
 
 
@@ -24,7 +23,7 @@ class FeeEngine:
 
     def _load_config(self) -> None:
         with open(self._config_path) as fh:
-            self._raw = yaml.safe_load(fh) or {}
+            self._raw = safe_load(fh) or {}
 
         for wizard_type, entries in self._raw.get("schedules", {}).items():
             wizard_type = str(wizard_type)  # YAML may parse numeric keys as int
@@ -12,10 +12,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field
 
 from municipal.core.types import ApprovalStatus
+from municipal.core.yaml_io import safe_load
 
 
 # Default path to the approval policies config
@@ -62,13 +62,15 @@ class ApprovalGate:
         self._config_path = Path(config_path) if config_path else _DEFAULT_CONFIG_PATH
         self._gates: dict[str, GateDefinition] = {}
         self._requests: dict[str, ApprovalRequest] = {}
+        # Side index of PENDING requests so the queue view skips settled history
+        self._pending: dict[str, ApprovalRequest] = {}
         self._policy: dict[str, Any] = {}
         self._load_config()
 
     def _load_config(self) -> None:
         """Load gate definitions from YAML config."""
         with open(self._config_path) as fh:
-            config = yaml.safe_load(fh)
+            config = safe_load(fh)
 
         for gate_id, gate_data in config.get("gates", {}).items():
             self._gates[gate_id] = GateDefinition(
@@ -116,6 +118,7 @@ class ApprovalGate:
             requestor=requestor,
         )
         self._requests[request.request_id] = request
+        self._pending[request.request_id] = request
         return request
 
     def approve(self, request_id: str, approver: str) -> ApprovalRequest:
@@ -149,6 +152,7 @@ class ApprovalGate:
         if len(request.approvals) >= gate.min_approvals:
             request.status = ApprovalStatus.APPROVED
             request.approver = approver
+            self._pending.pop(request_id, None)
 
         request.updated_at = datetime.now(timezone.utc)
         return request
@@ -177,6 +181,7 @@ class ApprovalGate:
         request.status = ApprovalStatus.DENIED
         request.approver = approver
         request.deny_reason = reason
+        self._pending.pop(request_id, None)
         request.updated_at = datetime.now(timezone.utc)
         return request
 
@@ -214,7 +219,7 @@ class ApprovalGate:
     @property
     def pending_requests(self) -> list[ApprovalRequest]:
         """All requests currently in PENDING status."""
-        return [r for r in self._requests.values() if r.status == ApprovalStatus.PENDING]
+        return list(self._pending.values())
 
     def list_all_requests(self) -> list[ApprovalRequest]:
         """All approval requests."""
@@ -1,6 +1,7 @@
 """Immutable audit logger for Munici-Pal.
 
-Writes append-only, hash-chained log entries to JSONL files.
+Writes append-only, hash-chained log entries to JSONL files (or, with the
+``memory`` backend, to an in-process list of JSONL lines).
 Each entry's SHA-256 hash includes the previous entry's hash, forming a
 tamper-evident chain. Altering any entry breaks the chain for all
 subsequent entries.
@@ -10,7 +11,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import threading
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -18,6 +21,21 @@ from typing import Any
 from municipal.core.config import AuditConfig
 from municipal.core.types import AuditEvent
 
+# Filter keys with a secondary index mapping value -> line positions.
+_INDEXED_FIELDS = ("session_id", "action")
+
+
+def coerce_utc_datetime(value: str | datetime) -> datetime:
+    """Return *value* as a timezone-aware datetime, assuming UTC if naive.
+
+    Accepts either an ISO-8601 string or an already-parsed datetime so
+    callers that parse query parameters up front skip re-parsing here.
+    """
+    dt = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
 
 class AuditEntry:
     """Wrapper around an AuditEvent with chain hash metadata."""
@@ -52,10 +70,15 @@ class AuditLogger:
     Each log entry's hash = SHA-256(previous_hash + entry_json), creating a
     tamper-evident chain. Entries are written to JSONL files (one line per entry).
 
+    Queries by ``session_id`` or ``action`` use an in-memory index holding
+    one position per matching log line. It is never trimmed, so its memory
+    grows with the log for the lifetime of the logger.
+
     Args:
         config: AuditConfig instance. Defaults to AuditConfig() which reads
             from environment variables.
         log_file: Override the log file name (default: ``audit.jsonl``).
+            Ignored by the ``memory`` backend.
     """
 
     def __init__(
@@ -65,32 +88,82 @@ class AuditLogger:
     ) -> None:
         self._config = config or AuditConfig()
         self._log_dir = Path(self._config.log_dir)
-        self._log_dir.mkdir(parents=True, exist_ok=True)
         self._log_path = self._log_dir / log_file
         self._lock = threading.Lock()
         self._last_hash: str = self._compute_genesis_hash()
+        # JSONL lines for the memory backend; None when writing to disk.
+        self._lines: list[str] | None = None
+        # field -> value -> positions of matching lines, where a position is
+        # an index into _lines or a byte offset into the log file. The file
+        # index covers the first _indexed_to bytes and is caught up lazily,
+        # so entries appended by other processes are still found.
+        self._index: dict[str, dict[str, list[int]]] = {f: {} for f in _INDEXED_FIELDS}
+        self._indexed_to = 0
+
+        if self._config.backend == "memory":
+            self._lines = []
+            return
 
-        # If the log file already exists, recover the last hash from the chain
+        self._log_dir.mkdir(parents=True, exist_ok=True)
+        # If the log file already exists, index it and recover the last hash
+        # from the chain in the same pass.
         if self._log_path.exists():
-            self._recover_last_hash()
+            last_hash = self._sync_index()
+            if last_hash is not None:
+                self._last_hash = last_hash
 
     @staticmethod
     def _compute_genesis_hash() -> str:
         """Return the genesis (seed) hash for the first entry in a chain."""
         return hashlib.sha256(b"municipal-genesis").hexdigest()
 
-    def _recover_last_hash(self) -> None:
-        """Read the existing log file and recover the last entry's hash."""
-        last_line: str | None = None
+    def _iter_lines(self) -> Iterator[str]:
+        """Yield the raw JSONL lines of the log from whichever backend is in use."""
+        if self._lines is not None:
+            yield from self._lines
+            return
+        if not self._log_path.exists():
+            return
         with open(self._log_path) as fh:
+            yield from fh
+
+    def _index_event(self, raw: dict[str, Any], position: int) -> None:
+        for field in _INDEXED_FIELDS:
+            value = raw.get(field)
+            if value is not None:
+                self._index[field].setdefault(value, []).append(position)
+
+    def _sync_index(self) -> str | None:
+        """Index complete lines appended to the log file since the last sync.
+
+        Must be called with ``_lock`` held. If the file shrank (it was
+        rewritten), the index is rebuilt from the start. Returns the
+        ``entry_hash`` of the last line indexed, or None if none were new.
+        """
+        try:
+            size = os.path.getsize(self._log_path)
+        except FileNotFoundError:
+            size = 0
+        if size < self._indexed_to:
+            self._index = {f: {} for f in _INDEXED_FIELDS}
+            self._indexed_to = 0
+        if size == self._indexed_to:
+            return None
+        last_hash: str | None = None
+        with open(self._log_path, "rb") as fh:
+            fh.seek(self._indexed_to)
+            offset = self._indexed_to
             for line in fh:
+                if not line.endswith(b"\n"):
+                    break  # another writer is mid-append; pick it up next time
                 stripped = line.strip()
                 if stripped:
-                    last_line = stripped
-
-        if last_line:
-            data = json.loads(last_line)
-            self._last_hash = data["entry_hash"]
+                    record = json.loads(stripped)
+                    self._index_event(record["event"], offset)
+                    last_hash = record["entry_hash"]
+                offset += len(line)
+        self._indexed_to = offset
+        return last_hash
 
     def _compute_hash(self, previous_hash: str, entry_json: str) -> str:
         """Compute SHA-256(previous_hash + entry_json)."""
@@ -119,9 +192,22 @@ class AuditLogger:
                 entry_hash=entry_hash,
             )
 
-            # Append to JSONL file
-            with open(self._log_path, "a") as fh:
-                fh.write(json.dumps(entry.to_dict()) + "\n")
+            record = entry.to_dict()
+            line = json.dumps(record) + "\n"
+            if self._lines is not None:
+                self._index_event(record["event"], len(self._lines))
+                self._lines.append(line)
+            else:
+                # Append to JSONL file
+                data = line.encode("utf-8")
+                with open(self._log_path, "ab") as fh:
+                    offset = fh.tell()
+                    fh.write(data)
+                # Only extend the index directly if nothing else appended
+                # since the last sync; otherwise the next query catches up.
+                if offset == self._indexed_to:
+                    self._index_event(record["event"], offset)
+                    self._indexed_to = offset + len(data)
 
             self._last_hash = entry_hash
             return entry
@@ -133,34 +219,31 @@ class AuditLogger:
         Returns True if the chain is intact, False if any entry has been
         tampered with.
         """
-        if not self._log_path.exists():
-            return True  # Empty chain is trivially valid
-
+        # An empty chain is trivially valid
         previous_hash = self._compute_genesis_hash()
 
-        with open(self._log_path) as fh:
-            for line_number, line in enumerate(fh, start=1):
-                stripped = line.strip()
-                if not stripped:
-                    continue
+        for line in self._iter_lines():
+            stripped = line.strip()
+            if not stripped:
+                continue
 
-                data = json.loads(stripped)
-                stored_previous = data["previous_hash"]
-                stored_hash = data["entry_hash"]
+            data = json.loads(stripped)
+            stored_previous = data["previous_hash"]
+            stored_hash = data["entry_hash"]
 
-                # Verify previous hash linkage
-                if stored_previous != previous_hash:
-                    return False
+            # Verify previous hash linkage
+            if stored_previous != previous_hash:
+                return False
 
-                # Recompute hash from the event data
-                event = AuditEvent(**data["event"])
-                event_json = event.model_dump_json()
-                expected_hash = self._compute_hash(previous_hash, event_json)
+            # Recompute hash from the event data
+            event = AuditEvent(**data["event"])
+            event_json = event.model_dump_json()
+            expected_hash = self._compute_hash(previous_hash, event_json)
 
-                if stored_hash != expected_hash:
-                    return False
+            if stored_hash != expected_hash:
+                return False
 
-                previous_hash = stored_hash
+            previous_hash = stored_hash
 
         return True
 
@@ -173,8 +256,8 @@ class AuditLogger:
             - ``resource``: exact match on resource field
             - ``classification``: exact match on classification field
             - ``session_id``: exact match on session_id field
-            - ``after``: ISO datetime string; only events after this time
-            - ``before``: ISO datetime string; only events before this time
+            - ``after``: datetime or ISO string; only events after this time
+            - ``before``: datetime or ISO string; only events before this time
 
         Args:
             filters: Optional dict of filter criteria.
@@ -182,51 +265,77 @@ class AuditLogger:
         Returns:
             List of matching AuditEvent instances.
         """
-        filters = filters or {}
-        results: list[AuditEvent] = []
+        return list(self.iter_query(filters))
 
-        if not self._log_path.exists():
-            return results
-
-        after_dt = None
-        before_dt = None
-        if "after" in filters:
-            after_dt = datetime.fromisoformat(filters["after"])
-            if after_dt.tzinfo is None:
-                after_dt = after_dt.replace(tzinfo=timezone.utc)
-        if "before" in filters:
-            before_dt = datetime.fromisoformat(filters["before"])
-            if before_dt.tzinfo is None:
-                before_dt = before_dt.replace(tzinfo=timezone.utc)
+    def iter_query(self, filters: dict[str, Any] | None = None) -> Iterator[AuditEvent]:
+        """Lazily yield audit events matching *filters*.
 
-        with open(self._log_path) as fh:
-            for line in fh:
-                stripped = line.strip()
-                if not stripped:
-                    continue
-
-                data = json.loads(stripped)
-                event = AuditEvent(**data["event"])
-
-                # Apply filters
-                if "actor" in filters and event.actor != filters["actor"]:
-                    continue
-                if "action" in filters and event.action != filters["action"]:
-                    continue
-                if "resource" in filters and event.resource != filters["resource"]:
-                    continue
-                if "classification" in filters and event.classification != filters["classification"]:
-                    continue
-                if "session_id" in filters and event.session_id != filters["session_id"]:
-                    continue
-                if after_dt and event.timestamp <= after_dt:
-                    continue
-                if before_dt and event.timestamp >= before_dt:
-                    continue
-
-                results.append(event)
-
-        return results
+        Accepts the same filters as :meth:`query` but reads the log one
+        line at a time, so callers can stream results without holding the
+        whole match set in memory. Filters are validated immediately; the
+        file is only opened once iteration starts. ``session_id`` and
+        ``action`` filters read only the lines listed in a secondary index
+        instead of the whole log.
+        """
+        filters = filters or {}
+        after_dt = coerce_utc_datetime(filters["after"]) if "after" in filters else None
+        before_dt = coerce_utc_datetime(filters["before"]) if "before" in filters else None
+
+        # Exact-match filters are checked against the raw JSON fields so that
+        # only matching lines pay for AuditEvent construction.
+        exact: list[tuple[str, Any]] = [
+            (key, filters[key])
+            for key in ("actor", "action", "resource", "classification", "session_id")
+            if key in filters
+        ]
+        indexed = [(key, value) for key, value in exact if key in self._index]
+        lines = self._iter_indexed(indexed) if indexed else self._iter_lines()
+        return self._scan(lines, exact, after_dt, before_dt)
+
+    def _iter_indexed(self, indexed: list[tuple[str, Any]]) -> Iterator[str | bytes]:
+        """Yield only the lines listed under the smallest matching index entry."""
+        with self._lock:
+            if self._lines is None:
+                self._sync_index()
+            # Snapshot the shortest candidate list; _scan re-checks every
+            # exact filter, so the other indexed keys need no intersection.
+            positions = min(
+                (self._index[key].get(value, []) for key, value in indexed), key=len
+            )[:]
+        if self._lines is not None:
+            for pos in positions:
+                yield self._lines[pos]
+            return
+        if not positions:
+            return
+        with open(self._log_path, "rb") as fh:
+            for pos in positions:
+                fh.seek(pos)
+                yield fh.readline()
+
+    def _scan(
+        self,
+        lines: Iterator[str | bytes],
+        exact: list[tuple[str, Any]],
+        after_dt: datetime | None,
+        before_dt: datetime | None,
+    ) -> Iterator[AuditEvent]:
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
+                continue
+
+            raw = json.loads(stripped)["event"]
+            if any(raw.get(key) != value for key, value in exact):
+                continue
+
+            event = AuditEvent(**raw)
+            if after_dt and event.timestamp <= after_dt:
+                continue
+            if before_dt and event.timestamp >= before_dt:
+                continue
+
+            yield event
 
     @property
     def log_path(self) -> Path:
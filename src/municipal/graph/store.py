@@ -11,29 +11,42 @@ class GraphStore:
     def __init__(self) -> None:
         self._nodes: dict[str, Node] = {}
         self._adjacency: dict[str, list[Edge]] = {}
+        # (node_id, relationship) -> neighbour ids, mirroring _adjacency
+        # (both directions) for constant-time has_edge checks.
+        self._neighbor_ids: dict[tuple[str, RelationshipType], set[str]] = {}
 
     def add_node(self, node: Node) -> None:
         self._nodes[node.id] = node
-        if node.id not in self._adjacency:
-            self._adjacency[node.id] = []
+        self._adjacency.setdefault(node.id, [])
 
     def get_node(self, node_id: str) -> Node | None:
         return self._nodes.get(node_id)
 
     def add_edge(self, edge: Edge) -> None:
-        if edge.source_id not in self._adjacency:
-            self._adjacency[edge.source_id] = []
-        self._adjacency[edge.source_id].append(edge)
+        self._adjacency.setdefault(edge.source_id, []).append(edge)
         # Also store reverse for undirected traversal
-        if edge.target_id not in self._adjacency:
-            self._adjacency[edge.target_id] = []
         reverse = Edge(
             source_id=edge.target_id,
             target_id=edge.source_id,
             relationship=edge.relationship,
             properties=edge.properties,
         )
-        self._adjacency[edge.target_id].append(reverse)
+        self._adjacency.setdefault(edge.target_id, []).append(reverse)
+        self._neighbor_ids.setdefault(
+            (edge.source_id, edge.relationship), set()
+        ).add(edge.target_id)
+        self._neighbor_ids.setdefault(
+            (edge.target_id, edge.relationship), set()
+        ).add(edge.source_id)
+
+    def has_edge(
+        self, source_id: str, relationship: RelationshipType, target_id: str
+    ) -> bool:
+        """Return True if the two nodes are linked by *relationship*.
+
+        Like :meth:`get_neighbors`, edges are treated as undirected.
+        """
+        return target_id in self._neighbor_ids.get((source_id, relationship), ())
 
     def get_neighbors(
         self, node_id: str, relationship: RelationshipType | None = None
@@ -74,3 +87,9 @@ class GraphStore:
         # Each edge stored twice (forward + reverse), so divide by 2
         total = sum(len(edges) for edges in self._adjacency.values())
         return total // 2
+
+    def clear(self) -> None:
+        """Remove all nodes and edges (useful for testing)."""
+        self._nodes.clear()
+        self._adjacency.clear()
+        self._neighbor_ids.clear()
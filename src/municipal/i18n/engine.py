@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
+from municipal.core.yaml_io import safe_load
 
 _DEFAULT_BUNDLES_DIR = Path(__file__).resolve().parents[3] / "config" / "i18n"
 
@@ -33,7 +33,7 @@ class I18nEngine:
         for path in sorted(self._bundles_dir.glob("*.yml")):
             locale = path.stem
             with open(path) as fh:
-                data = yaml.safe_load(fh) or {}
+                data = safe_load(fh) or {}
             self._bundles[locale] = data
 
     @property
@@ -6,9 +6,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from municipal.core.types import AuditEvent, DataClassification, SessionType
+from municipal.core.yaml_io import safe_load
 from municipal.governance.approval import ApprovalGate
 from municipal.governance.audit import AuditLogger
 from municipal.graph.models import Edge, EntityType, Node, RelationshipType
@@ -65,7 +64,7 @@ def _parse_step(data: dict[str, Any]) -> StepDefinition:
 
 def _load_wizard(path: Path) -> WizardDefinition:
     with open(path) as fh:
-        data = yaml.safe_load(fh)
+        data = safe_load(fh)
     steps = [_parse_step(s) for s in data.get("steps", [])]
     return WizardDefinition(
         id=data["id"],
@@ -99,6 +98,7 @@ class WizardEngine:
         self._approval = approval_gate
         self._graph = graph_store
         self._wizards: dict[str, WizardDefinition] = {}
+        self._classification_index: dict[str, dict[str, str]] = {}
         self._load_wizards(Path(wizards_dir) if wizards_dir else _DEFAULT_WIZARDS_DIR)
 
     def _load_wizards(self, wizards_dir: Path) -> None:
@@ -107,11 +107,24 @@ class WizardEngine:
         for path in sorted(wizards_dir.glob("*.yml")):
             defn = _load_wizard(path)
             self._wizards[defn.id] = defn
+            self._classification_index[defn.id] = {
+                field.id: field.classification.value
+                for step in defn.steps
+                for field in step.fields
+            }
 
     @property
     def wizard_definitions(self) -> dict[str, WizardDefinition]:
         return dict(self._wizards)
 
+    def field_classifications(self, wizard_id: str) -> dict[str, str]:
+        """Return ``{field_id: classification}`` for a wizard, built at load time.
+
+        Unknown wizards yield an empty mapping. The returned dict is shared
+        and must not be mutated.
+        """
+        return self._classification_index.get(wizard_id, {})
+
     def start_wizard(
         self, wizard_id: str, session_id: str, session_type: SessionType = SessionType.ANONYMOUS
     ) -> WizardState:
@@ -345,15 +358,14 @@ class WizardEngine:
         # PERSON node (via session_id or applicant_name)
         applicant_name = data.get("applicant_name", "")
         person_id = f"person:{case.session_id}"
-        person_node = Node(
-            id=person_id,
-            entity_type=EntityType.PERSON,
-            label=applicant_name or case.session_id,
-            properties={"session_id": case.session_id},
-        )
-        # Only add if not already present
+        # Only build and add the node if not already present
         if self._graph.get_node(person_id) is None:
-            self._graph.add_node(person_node)
+            self._graph.add_node(Node(
+                id=person_id,
+                entity_type=EntityType.PERSON,
+                label=applicant_name or case.session_id,
+                properties={"session_id": case.session_id},
+            ))
 
         # SUBMITTED edge: person -> case
         self._graph.add_edge(Edge(
@@ -14,6 +14,7 @@ class IntakeStore:
     def __init__(self) -> None:
         self._wizard_states: dict[str, WizardState] = {}
         self._cases: dict[str, Case] = {}
+        self._case_version = 0
 
     # -- Wizard states --
 
@@ -33,6 +34,7 @@ class IntakeStore:
 
     def save_case(self, case: Case) -> None:
         self._cases[case.id] = case
+        self._case_version += 1
 
     def get_case(self, case_id: str) -> Case | None:
         return self._cases.get(case_id)
@@ -55,3 +57,14 @@ class IntakeStore:
     @property
     def case_count(self) -> int:
         return len(self._cases)
+
+    def clear(self) -> None:
+        """Remove all wizard states and cases (useful for testing)."""
+        self._wizard_states.clear()
+        self._cases.clear()
+        self._case_version += 1
+
+    @property
+    def case_version(self) -> int:
+        """Counter bumped on every case write, for cheap change detection."""
+        return self._case_version
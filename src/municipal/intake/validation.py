@@ -2,12 +2,31 @@
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Callable
 
 from municipal.intake.models import FieldDefinition, StepDefinition, ValidationResult
 from municipal.intake.validators.common import VALIDATORS
 
 
+@functools.cache
+def _parse_validator_spec(spec: str) -> tuple[str, Mapping[str, str]]:
+    """Split a spec like ``"numeric:min_val=0"`` into its name and params.
+
+    Specs come from wizard definitions, so the set is small and fixed and
+    each one is parsed once.
+    """
+    name, _, raw_params = spec.partition(":")
+    params: dict[str, str] = {}
+    if raw_params:
+        for pair in raw_params.split(","):
+            k, _, v = pair.partition("=")
+            params[k.strip()] = v.strip()
+    return name, MappingProxyType(params)
+
+
 class ValidationEngine:
     """Registry-based validation engine.
 
@@ -39,13 +58,7 @@ class ValidationEngine:
 
         for validator_name in field.validators:
             # Validator name may include params like "numeric:min_val=0"
-            parts = validator_name.split(":", 1)
-            name = parts[0]
-            extra_params: dict[str, Any] = {}
-            if len(parts) > 1:
-                for pair in parts[1].split(","):
-                    k, _, v = pair.partition("=")
-                    extra_params[k.strip()] = v.strip()
+            name, extra_params = _parse_validator_spec(validator_name)
 
             fn = self._validators.get(name)
             if fn is None:
@@ -2,15 +2,45 @@
 
 from __future__ import annotations
 
+import operator
+import re
+from calendar import monthrange
+from collections.abc import Callable
 from datetime import date, datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-import yaml
+from municipal.core.yaml_io import load_config_file
 
 
 _DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[4] / "config" / "cross_field_rules.yml"
 
+# A compiled rule: takes the wizard data and returns (field_id, message)
+# when the rule is violated, else None.
+RuleCheck = Callable[[dict[str, Any]], "tuple[str, str] | None"]
+
+# Format gates so malformed input is rejected without raising. _ISO_DATE
+# accepts what strptime("%Y-%m-%d") does; _DECIMAL is float()'s decimal
+# grammar and _FLOAT_WORDS its other spellings (compared stripped and
+# lowercased). Anything else is rejected without calling float().
+_ISO_DATE = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+_DECIMAL = re.compile(
+    r"\s*[+-]?(?:\d(?:_?\d)*(?:\.(?:\d(?:_?\d)*)?)?|\.\d(?:_?\d)*)"
+    r"(?:[eE][+-]?\d(?:_?\d)*)?\s*",
+    re.ASCII,
+)
+_FLOAT_WORDS = frozenset(
+    sign + word for sign in ("", "+", "-") for word in ("inf", "infinity", "nan")
+)
+
+_NUMERIC_OPERATORS: dict[str, Callable[[float, float], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
 
 class CrossFieldValidator:
     """Validates relationships between fields across a wizard's data.
@@ -20,19 +50,44 @@ class CrossFieldValidator:
     - conditional_required: if field_a == value then field_b is required
     - mutual_exclusion: field_a and field_b cannot both be set
     - numeric_relationship: field_a < field_b (or <=, >, >=)
-    """
 
-    def __init__(self, config_path: str | Path | None = None) -> None:
-        self._config_path = Path(config_path) if config_path else _DEFAULT_CONFIG_PATH
-        self._rules: dict[str, list[dict[str, Any]]] = {}
-        self._load_config()
+    Rules are compiled once at load time into per-wizard lists of bound
+    check functions; rules with an unknown type or operator are dropped
+    there rather than re-examined on every ``validate`` call.
+    """
 
-    def _load_config(self) -> None:
-        if not self._config_path.exists():
-            return
-        with open(self._config_path) as fh:
-            data = yaml.safe_load(fh) or {}
-        self._rules = data.get("wizards", {})
+    def __init__(
+        self,
+        config_path: str | Path | None = None,
+        *,
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        # A config dict takes precedence and leaves no file to read.
+        self._config_path: Path | None = None
+        if config is None:
+            self._config_path = Path(config_path) if config_path else _DEFAULT_CONFIG_PATH
+        self._plans: dict[str, list[RuleCheck]] = {}
+        self._compile(config if config is not None else self._load_config())
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CrossFieldValidator:
+        """Build a validator from a config dict, skipping the YAML file."""
+        return cls(config=data)
+
+    def _load_config(self) -> dict[str, Any]:
+        if self._config_path is None or not self._config_path.exists():
+            return {}
+        return load_config_file(self._config_path) or {}
+
+    def _compile(self, data: dict[str, Any]) -> None:
+        for wizard_id, rules in data.get("wizards", {}).items():
+            plan = []
+            for rule in rules or []:
+                compile_rule = _RULE_COMPILERS.get(rule.get("type"))
+                check = compile_rule(rule) if compile_rule else None
+                if check is not None:
+                    plan.append(check)
+            self._plans[wizard_id] = plan
 
     def validate(self, wizard_id: str, data: dict[str, Any]) -> dict[str, list[str]]:
         """Validate cross-field rules for a wizard's merged data.
@@ -40,121 +95,138 @@ class CrossFieldValidator:
         Returns:
             Dict mapping field IDs to lists of error messages. Empty dict means valid.
         """
-        rules = self._rules.get(wizard_id, [])
         errors: dict[str, list[str]] = {}
 
-        for rule in rules:
-            rule_type = rule.get("type")
-            rule_errors = self._check_rule(rule_type, rule, data)
-            for field_id, msgs in rule_errors.items():
-                errors.setdefault(field_id, []).extend(msgs)
+        for check in self._plans.get(wizard_id, ()):
+            failure = check(data)
+            if failure is not None:
+                field_id, msg = failure
+                errors.setdefault(field_id, []).append(msg)
 
         return errors
 
-    def _check_rule(
-        self, rule_type: str | None, rule: dict[str, Any], data: dict[str, Any]
-    ) -> dict[str, list[str]]:
-        if rule_type == "date_order":
-            return self._check_date_order(rule, data)
-        elif rule_type == "conditional_required":
-            return self._check_conditional_required(rule, data)
-        elif rule_type == "mutual_exclusion":
-            return self._check_mutual_exclusion(rule, data)
-        elif rule_type == "numeric_relationship":
-            return self._check_numeric_relationship(rule, data)
-        return {}
-
-    def _check_date_order(
-        self, rule: dict[str, Any], data: dict[str, Any]
-    ) -> dict[str, list[str]]:
-        field_a = rule.get("field_a", "")
-        field_b = rule.get("field_b", "")
-        val_a = data.get(field_a)
-        val_b = data.get(field_b)
-
-        if not val_a or not val_b:
-            return {}
-
-        try:
-            date_a = self._parse_date(val_a)
-            date_b = self._parse_date(val_b)
-        except (ValueError, TypeError):
-            return {}
-
-        if date_a > date_b:
-            msg = rule.get("message", f"{field_a} must be on or before {field_b}.")
-            return {field_b: [msg]}
-        return {}
-
-    def _check_conditional_required(
-        self, rule: dict[str, Any], data: dict[str, Any]
-    ) -> dict[str, list[str]]:
-        field_a = rule.get("field_a", "")
-        value = rule.get("value")
-        field_b = rule.get("field_b", "")
-
-        actual = data.get(field_a)
-        if actual != value:
-            return {}
-
-        val_b = data.get(field_b)
-        if val_b is None or (isinstance(val_b, str) and not val_b.strip()):
-            msg = rule.get("message", f"{field_b} is required when {field_a} is {value}.")
-            return {field_b: [msg]}
-        return {}
-
-    def _check_mutual_exclusion(
-        self, rule: dict[str, Any], data: dict[str, Any]
-    ) -> dict[str, list[str]]:
-        field_a = rule.get("field_a", "")
-        field_b = rule.get("field_b", "")
-
-        val_a = data.get(field_a)
-        val_b = data.get(field_b)
-
-        a_set = val_a is not None and (not isinstance(val_a, str) or val_a.strip())
-        b_set = val_b is not None and (not isinstance(val_b, str) or val_b.strip())
-
-        if a_set and b_set:
-            msg = rule.get("message", f"{field_a} and {field_b} cannot both be set.")
-            return {field_b: [msg]}
-        return {}
-
-    def _check_numeric_relationship(
-        self, rule: dict[str, Any], data: dict[str, Any]
-    ) -> dict[str, list[str]]:
-        field_a = rule.get("field_a", "")
-        field_b = rule.get("field_b", "")
-        operator = rule.get("operator", "<")
-
-        val_a = data.get(field_a)
-        val_b = data.get(field_b)
-
-        if val_a is None or val_b is None:
-            return {}
-
-        try:
-            num_a = float(val_a)
-            num_b = float(val_b)
-        except (TypeError, ValueError):
-            return {}
 
-        ops = {
-            "<": lambda a, b: a < b,
-            "<=": lambda a, b: a <= b,
-            ">": lambda a, b: a > b,
-            ">=": lambda a, b: a >= b,
-        }
-        check = ops.get(operator)
-        if check and not check(num_a, num_b):
-            msg = rule.get("message", f"{field_a} must be {operator} {field_b}.")
-            return {field_b: [msg]}
-        return {}
-
-    @staticmethod
-    def _parse_date(value: Any) -> date:
-        if isinstance(value, date):
-            return value
-        if isinstance(value, datetime):
-            return value.date()
-        return datetime.strptime(str(value), "%Y-%m-%d").date()
+def _try_date(value: Any) -> date | None:
+    """Return *value* as a date, or None if it is not a YYYY-MM-DD date."""
+    if isinstance(value, date):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    match = _ISO_DATE.fullmatch(str(value))
+    if match is None:
+        return None
+    year, month, day = map(int, match.groups())
+    if year < 1 or not 1 <= month <= 12 or not 1 <= day <= monthrange(year, month)[1]:
+        return None
+    return date(year, month, day)
+
+
+def _try_float(value: Any) -> float | None:
+    """Return *value* as a float, or None if it is not a number or numeric string."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        return None
+    if _DECIMAL.fullmatch(value) or value.strip().lower() in _FLOAT_WORDS:
+        return float(value)
+    return None
+
+
+def _is_set(value: Any) -> bool:
+    return value is not None and (not isinstance(value, str) or bool(value.strip()))
+
+
+def _check_date_order(
+    field_a: str, field_b: str, message: str, data: dict[str, Any]
+) -> tuple[str, str] | None:
+    val_a = data.get(field_a)
+    val_b = data.get(field_b)
+    if not val_a or not val_b:
+        return None
+    date_a = _try_date(val_a)
+    date_b = _try_date(val_b)
+    if date_a is None or date_b is None:
+        return None
+    if date_a > date_b:
+        return field_b, message
+    return None
+
+
+def _check_conditional_required(
+    field_a: str, value: Any, field_b: str, message: str, data: dict[str, Any]
+) -> tuple[str, str] | None:
+    if data.get(field_a) != value:
+        return None
+    val_b = data.get(field_b)
+    if val_b is None or (isinstance(val_b, str) and not val_b.strip()):
+        return field_b, message
+    return None
+
+
+def _check_mutual_exclusion(
+    field_a: str, field_b: str, message: str, data: dict[str, Any]
+) -> tuple[str, str] | None:
+    if _is_set(data.get(field_a)) and _is_set(data.get(field_b)):
+        return field_b, message
+    return None
+
+
+def _check_numeric_relationship(
+    field_a: str,
+    field_b: str,
+    compare: Callable[[float, float], bool],
+    message: str,
+    data: dict[str, Any],
+) -> tuple[str, str] | None:
+    val_a = data.get(field_a)
+    val_b = data.get(field_b)
+    if val_a is None or val_b is None:
+        return None
+    num_a = _try_float(val_a)
+    num_b = _try_float(val_b)
+    if num_a is None or num_b is None:
+        return None
+    if not compare(num_a, num_b):
+        return field_b, message
+    return None
+
+
+def _compile_date_order(rule: dict[str, Any]) -> RuleCheck:
+    field_a = rule.get("field_a", "")
+    field_b = rule.get("field_b", "")
+    message = rule.get("message", f"{field_a} must be on or before {field_b}.")
+    return partial(_check_date_order, field_a, field_b, message)
+
+
+def _compile_conditional_required(rule: dict[str, Any]) -> RuleCheck:
+    field_a = rule.get("field_a", "")
+    value = rule.get("value")
+    field_b = rule.get("field_b", "")
+    message = rule.get("message", f"{field_b} is required when {field_a} is {value}.")
+    return partial(_check_conditional_required, field_a, value, field_b, message)
+
+
+def _compile_mutual_exclusion(rule: dict[str, Any]) -> RuleCheck:
+    field_a = rule.get("field_a", "")
+    field_b = rule.get("field_b", "")
+    message = rule.get("message", f"{field_a} and {field_b} cannot both be set.")
+    return partial(_check_mutual_exclusion, field_a, field_b, message)
+
+
+def _compile_numeric_relationship(rule: dict[str, Any]) -> RuleCheck | None:
+    field_a = rule.get("field_a", "")
+    field_b = rule.get("field_b", "")
+    op = rule.get("operator", "<")
+    compare = _NUMERIC_OPERATORS.get(op)
+    if compare is None:
+        return None  # unknown operator: the rule never fires
+    message = rule.get("message", f"{field_a} must be {op} {field_b}.")
+    return partial(_check_numeric_relationship, field_a, field_b, compare, message)
+
+
+_RULE_COMPILERS: dict[str, Callable[[dict[str, Any]], RuleCheck | None]] = {
+    "date_order": _compile_date_order,
+    "conditional_required": _compile_conditional_required,
+    "mutual_exclusion": _compile_mutual_exclusion,
+    "numeric_relationship": _compile_numeric_relationship,
+}
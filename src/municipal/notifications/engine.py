@@ -5,9 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from municipal.core.types import AuditEvent, DataClassification
+from municipal.core.yaml_io import safe_load
 from municipal.governance.audit import AuditLogger
 from municipal.notifications.models import (
     Notification,
@@ -38,7 +37,7 @@ class NotificationEngine:
         if not path.exists():
             return
         with open(path) as fh:
-            data = yaml.safe_load(fh) or {}
+            data = safe_load(fh) or {}
         for tmpl_id, tmpl_data in data.get("templates", {}).items():
             self._templates[tmpl_id] = NotificationTemplate(
                 id=tmpl_id,
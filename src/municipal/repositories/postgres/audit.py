@@ -5,16 +5,16 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
-from datetime import datetime, timezone
+from collections.abc import AsyncIterator
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 
 from municipal.core.config import AuditConfig
 from municipal.core.types import AuditEvent, DataClassification
 from municipal.db.engine import DatabaseManager
 from municipal.db.models import AuditEventRow
-from municipal.governance.audit import AuditEntry
+from municipal.governance.audit import AuditEntry, coerce_utc_datetime
 
 
 class PostgresAuditRepository:
@@ -104,50 +104,60 @@ class PostgresAuditRepository:
 
         return True
 
+    @staticmethod
+    def _build_query(filters: dict[str, Any]) -> Select[AuditEventRow]:
+        stmt = select(AuditEventRow)
+        if "actor" in filters:
+            stmt = stmt.where(AuditEventRow.actor == filters["actor"])
+        if "action" in filters:
+            stmt = stmt.where(AuditEventRow.action == filters["action"])
+        if "resource" in filters:
+            stmt = stmt.where(AuditEventRow.resource == filters["resource"])
+        if "classification" in filters:
+            stmt = stmt.where(AuditEventRow.classification == filters["classification"])
+        if "session_id" in filters:
+            stmt = stmt.where(AuditEventRow.session_id == filters["session_id"])
+        if "after" in filters:
+            after_dt = coerce_utc_datetime(filters["after"])
+            stmt = stmt.where(AuditEventRow.timestamp > after_dt)
+        if "before" in filters:
+            before_dt = coerce_utc_datetime(filters["before"])
+            stmt = stmt.where(AuditEventRow.timestamp < before_dt)
+        return stmt
+
+    @staticmethod
+    def _row_to_event(r: AuditEventRow) -> AuditEvent:
+        return AuditEvent(
+            event_id=r.event_id,
+            timestamp=r.timestamp,
+            session_id=r.session_id,
+            actor=r.actor,
+            action=r.action,
+            resource=r.resource,
+            classification=DataClassification(r.classification),
+            details=r.details or {},
+            prompt_version=r.prompt_version,
+            tool_calls=r.tool_calls or [],
+            data_sources=r.data_sources or [],
+            approval_chain=r.approval_chain or [],
+        )
+
     async def query(self, filters: dict[str, Any] | None = None) -> list[AuditEvent]:
-        filters = filters or {}
+        stmt = self._build_query(filters or {})
         async with self._db.session() as db:
-            stmt = select(AuditEventRow)
-
-            if "actor" in filters:
-                stmt = stmt.where(AuditEventRow.actor == filters["actor"])
-            if "action" in filters:
-                stmt = stmt.where(AuditEventRow.action == filters["action"])
-            if "resource" in filters:
-                stmt = stmt.where(AuditEventRow.resource == filters["resource"])
-            if "classification" in filters:
-                stmt = stmt.where(AuditEventRow.classification == filters["classification"])
-            if "session_id" in filters:
-                stmt = stmt.where(AuditEventRow.session_id == filters["session_id"])
-            if "after" in filters:
-                after_dt = datetime.fromisoformat(filters["after"])
-                if after_dt.tzinfo is None:
-                    after_dt = after_dt.replace(tzinfo=timezone.utc)
-                stmt = stmt.where(AuditEventRow.timestamp > after_dt)
-            if "before" in filters:
-                before_dt = datetime.fromisoformat(filters["before"])
-                if before_dt.tzinfo is None:
-                    before_dt = before_dt.replace(tzinfo=timezone.utc)
-                stmt = stmt.where(AuditEventRow.timestamp < before_dt)
-
             result = await db.execute(stmt)
-            return [
-                AuditEvent(
-                    event_id=r.event_id,
-                    timestamp=r.timestamp,
-                    session_id=r.session_id,
-                    actor=r.actor,
-                    action=r.action,
-                    resource=r.resource,
-                    classification=DataClassification(r.classification),
-                    details=r.details or {},
-                    prompt_version=r.prompt_version,
-                    tool_calls=r.tool_calls or [],
-                    data_sources=r.data_sources or [],
-                    approval_chain=r.approval_chain or [],
-                )
-                for r in result.scalars().all()
-            ]
+            return [self._row_to_event(r) for r in result.scalars().all()]
+
+    def iter_query(self, filters: dict[str, Any] | None = None) -> AsyncIterator[AuditEvent]:
+        """Stream matching events from a server-side cursor."""
+        stmt = self._build_query(filters or {})
+        return self._stream(stmt)
+
+    async def _stream(self, stmt: Select[AuditEventRow]) -> AsyncIterator[AuditEvent]:
+        async with self._db.session() as db:
+            result = await db.stream_scalars(stmt)
+            async for r in result:
+                yield self._row_to_event(r)
 
     @property
     def log_path(self) -> None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from sqlalchemy import delete, func, select
 
 from municipal.db.engine import DatabaseManager
@@ -17,35 +19,48 @@ class PostgresFeedbackRepository:
 
     async def add(self, entry: FeedbackEntry) -> FeedbackEntry:
         async with self._db.session() as db:
-            row = FeedbackEntryRow(
-                feedback_id=entry.feedback_id,
-                timestamp=entry.timestamp,
-                staff_id=entry.staff_id,
-                session_id=entry.session_id,
-                message_index=entry.message_index,
-                flag_type=entry.flag_type.value,
-                note=entry.note,
-            )
-            db.add(row)
+            db.add(self._entry_to_row(entry))
             await db.commit()
         return entry
 
-    async def list_all(self) -> list[FeedbackEntry]:
+    async def add_many(self, entries: list[FeedbackEntry]) -> list[FeedbackEntry]:
         async with self._db.session() as db:
-            result = await db.execute(
-                select(FeedbackEntryRow).order_by(FeedbackEntryRow.timestamp.desc())
-            )
+            db.add_all([self._entry_to_row(e) for e in entries])
+            await db.commit()
+        return entries
+
+    async def list_all(self, after: datetime | None = None) -> list[FeedbackEntry]:
+        stmt = select(FeedbackEntryRow).order_by(FeedbackEntryRow.timestamp.desc())
+        if after is not None:
+            stmt = stmt.where(FeedbackEntryRow.timestamp > after)
+        async with self._db.session() as db:
+            result = await db.execute(stmt)
             return [self._row_to_entry(r) for r in result.scalars().all()]
 
-    async def get_for_session(self, session_id: str) -> list[FeedbackEntry]:
+    async def list_page(self, limit: int, offset: int = 0) -> list[FeedbackEntry]:
         async with self._db.session() as db:
             result = await db.execute(
-                select(FeedbackEntryRow).where(
-                    FeedbackEntryRow.session_id == session_id
-                )
+                select(FeedbackEntryRow)
+                .order_by(FeedbackEntryRow.timestamp.desc())
+                .limit(limit)
+                .offset(offset)
             )
             return [self._row_to_entry(r) for r in result.scalars().all()]
 
+    async def get_for_session(
+        self, session_id: str, after: datetime | None = None
+    ) -> list[FeedbackEntry]:
+        stmt = (
+            select(FeedbackEntryRow)
+            .where(FeedbackEntryRow.session_id == session_id)
+            .order_by(FeedbackEntryRow.timestamp)
+        )
+        if after is not None:
+            stmt = stmt.where(FeedbackEntryRow.timestamp > after)
+        async with self._db.session() as db:
+            result = await db.execute(stmt)
+            return [self._row_to_entry(r) for r in result.scalars().all()]
+
     async def get_by_id(self, feedback_id: str) -> FeedbackEntry | None:
         async with self._db.session() as db:
             row = await db.get(FeedbackEntryRow, feedback_id)
@@ -65,6 +80,18 @@ class PostgresFeedbackRepository:
             await db.execute(delete(FeedbackEntryRow))
             await db.commit()
 
+    @staticmethod
+    def _entry_to_row(entry: FeedbackEntry) -> FeedbackEntryRow:
+        return FeedbackEntryRow(
+            feedback_id=entry.feedback_id,
+            timestamp=entry.timestamp,
+            staff_id=entry.staff_id,
+            session_id=entry.session_id,
+            message_index=entry.message_index,
+            flag_type=entry.flag_type.value,
+            note=entry.note,
+        )
+
     @staticmethod
     def _row_to_entry(row: FeedbackEntryRow) -> FeedbackEntry:
         return FeedbackEntry(
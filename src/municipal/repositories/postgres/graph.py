@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import and_, exists, func, or_, select
 
 from municipal.db.engine import DatabaseManager
 from municipal.db.models import GraphEdgeRow, GraphNodeRow
@@ -56,6 +56,29 @@ class PostgresGraphRepository:
             db.add(row)
             await db.commit()
 
+    async def has_edge(
+        self, source_id: str, relationship: RelationshipType, target_id: str
+    ) -> bool:
+        async with self._db.session() as db:
+            result = await db.execute(
+                select(
+                    exists().where(
+                        GraphEdgeRow.relationship == relationship.value,
+                        or_(
+                            and_(
+                                GraphEdgeRow.source_id == source_id,
+                                GraphEdgeRow.target_id == target_id,
+                            ),
+                            and_(
+                                GraphEdgeRow.source_id == target_id,
+                                GraphEdgeRow.target_id == source_id,
+                            ),
+                        ),
+                    )
+                )
+            )
+            return bool(result.scalar())
+
     async def get_neighbors(
         self, node_id: str, relationship: RelationshipType | None = None
     ) -> list[Node]:
@@ -15,6 +15,7 @@ class PostgresIntakeRepository:
 
     def __init__(self, db: DatabaseManager) -> None:
         self._db = db
+        self._case_version = 0
 
     async def save_wizard_state(self, state: WizardState) -> None:
         async with self._db.session() as db:
@@ -77,6 +78,7 @@ class PostgresIntakeRepository:
                 )
                 db.add(row)
             await db.commit()
+        self._case_version += 1
 
     async def get_case(self, case_id: str) -> Case | None:
         async with self._db.session() as db:
@@ -108,6 +110,11 @@ class PostgresIntakeRepository:
     def case_count(self) -> int:
         raise NotImplementedError("Use async_case_count() instead for Postgres")
 
+    @property
+    def case_version(self) -> int:
+        """Counter bumped on every case write made through this instance."""
+        return self._case_version
+
     async def async_case_count(self) -> int:
         async with self._db.session() as db:
             result = await db.execute(select(func.count()).select_from(CaseRow))
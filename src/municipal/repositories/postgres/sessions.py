@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 
-from municipal.chat.session import ChatMessage, ChatSession, MessageRole
+from municipal.chat.session import ChatMessage, ChatSession, MessageRole, SessionSnapshot
 from municipal.core.types import SessionType
 from municipal.db.engine import DatabaseManager
 from municipal.db.models import MessageRow, SessionRow
@@ -125,3 +125,31 @@ class PostgresSessionRepository:
                     )
                 )
         return sessions
+
+    async def count_active(self) -> int:
+        async with self._db.session() as db:
+            result = await db.execute(select(func.count()).select_from(SessionRow))
+            return result.scalar_one()
+
+    async def list_active_snapshot(self) -> SessionSnapshot:
+        async with self._db.session() as db:
+            result = await db.execute(
+                select(
+                    SessionRow.session_id,
+                    SessionRow.session_type,
+                    SessionRow.created_at,
+                    SessionRow.last_active,
+                    func.count(MessageRow.id),
+                )
+                .outerjoin(MessageRow, MessageRow.session_id == SessionRow.session_id)
+                .group_by(SessionRow.session_id)
+                .order_by(SessionRow.last_active.desc())
+            )
+            rows = result.all()
+        return (
+            [r[0] for r in rows],
+            [SessionType(r[1]) for r in rows],
+            [r[2] for r in rows],
+            [r[3] for r in rows],
+            [r[4] for r in rows],
+        )
@@ -5,6 +5,7 @@ Uses the `taken_over_by` column on the sessions table.
 
 from __future__ import annotations
 
+import hashlib
 from typing import Any
 
 from sqlalchemy import select
@@ -19,6 +20,24 @@ class PostgresTakeoverRepository:
     def __init__(self, db: DatabaseManager) -> None:
         self._db = db
 
+    async def etag(self) -> str:
+        """Quoted HTTP entity tag derived from the stored takeover set.
+
+        Computed from the database rather than a local counter, so it
+        reflects takeovers committed by any process and agrees across
+        instances.
+        """
+        async with self._db.session() as db:
+            result = await db.execute(
+                select(SessionRow.session_id, SessionRow.taken_over_by)
+                .where(SessionRow.taken_over_by.isnot(None))
+                .order_by(SessionRow.session_id)
+            )
+            digest = hashlib.sha256()
+            for session_id, staff_id in result:
+                digest.update(f"{session_id}\0{staff_id}\n".encode())
+        return f'"{digest.hexdigest()}"'
+
     async def takeover(self, session_id: str, staff_id: str) -> dict[str, Any]:
         async with self._db.session() as db:
             row = await db.get(SessionRow, session_id)
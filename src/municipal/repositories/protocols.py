@@ -7,9 +7,11 @@ implementations to satisfy the same interface.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator, Mapping
+from datetime import datetime
 from typing import Any, Protocol, runtime_checkable
 
-from municipal.chat.session import ChatMessage, ChatSession
+from municipal.chat.session import ChatMessage, ChatSession, SessionSnapshot
 from municipal.core.types import ApprovalStatus, AuditEvent, SessionType
 from municipal.finance.models import PaymentRecord
 from municipal.governance.approval import ApprovalRequest, GateDefinition
@@ -34,6 +36,10 @@ class SessionRepository(Protocol):
 
     def list_active_sessions(self) -> list[ChatSession]: ...
 
+    def count_active(self) -> int: ...
+
+    def list_active_snapshot(self) -> SessionSnapshot: ...
+
 
 @runtime_checkable
 class IntakeRepository(Protocol):
@@ -58,6 +64,9 @@ class IntakeRepository(Protocol):
     @property
     def case_count(self) -> int: ...
 
+    @property
+    def case_version(self) -> int: ...
+
 
 @runtime_checkable
 class ApprovalRepository(Protocol):
@@ -102,6 +111,10 @@ class GraphRepository(Protocol):
 
     def add_edge(self, edge: Edge) -> None: ...
 
+    def has_edge(
+        self, source_id: str, relationship: RelationshipType, target_id: str
+    ) -> bool: ...
+
     def get_neighbors(
         self, node_id: str, relationship: RelationshipType | None = None
     ) -> list[Node]: ...
@@ -142,9 +155,15 @@ class FeedbackRepository(Protocol):
 
     def add(self, entry: FeedbackEntry) -> FeedbackEntry: ...
 
-    def list_all(self) -> list[FeedbackEntry]: ...
+    def add_many(self, entries: list[FeedbackEntry]) -> list[FeedbackEntry]: ...
 
-    def get_for_session(self, session_id: str) -> list[FeedbackEntry]: ...
+    def list_all(self, after: datetime | None = None) -> list[FeedbackEntry]: ...
+
+    def list_page(self, limit: int, offset: int = 0) -> list[FeedbackEntry]: ...
+
+    def get_for_session(
+        self, session_id: str, after: datetime | None = None
+    ) -> list[FeedbackEntry]: ...
 
     def get_by_id(self, feedback_id: str) -> FeedbackEntry | None: ...
 
@@ -191,6 +210,10 @@ class AuditRepository(Protocol):
 
     def query(self, filters: dict[str, Any] | None = None) -> list[AuditEvent]: ...
 
+    def iter_query(
+        self, filters: dict[str, Any] | None = None
+    ) -> Iterator[AuditEvent] | AsyncIterator[AuditEvent]: ...
+
 
 @runtime_checkable
 class AuthTokenRepository(Protocol):
@@ -209,6 +232,8 @@ class AuthTokenRepository(Protocol):
 class TakeoverRepository(Protocol):
     """Protocol for session takeover management."""
 
+    def etag(self) -> str: ...
+
     def takeover(self, session_id: str, staff_id: str) -> dict[str, Any]: ...
 
     def release(self, session_id: str) -> dict[str, Any]: ...
@@ -217,4 +242,4 @@ class TakeoverRepository(Protocol):
 
     def get_controller(self, session_id: str) -> str | None: ...
 
-    def list_takeovers(self) -> dict[str, str]: ...
+    def list_takeovers(self) -> Mapping[str, str]: ...
@@ -6,8 +6,7 @@ from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from municipal.core.yaml_io import safe_load
 from municipal.review.models import InconsistencyFinding, InconsistencyReport
 
 
@@ -33,7 +32,7 @@ class InconsistencyDetector:
         if not self._config_path.exists():
             return
         with open(self._config_path) as fh:
-            data = yaml.safe_load(fh) or {}
+            data = safe_load(fh) or {}
         self._rules = data.get("wizards", {})
 
     def detect(self, case_id: str, wizard_id: str, data: dict[str, Any]) -> InconsistencyReport:
@@ -7,9 +7,8 @@ import re
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from municipal.core.types import DataClassification
+from municipal.core.yaml_io import safe_load
 from municipal.review.models import Confidence, RedactionReport, RedactionSuggestion
 
 logger = logging.getLogger(__name__)
@@ -52,7 +51,7 @@ class RedactionEngine:
         if not self._config_path.exists():
             return
         with open(self._config_path) as fh:
-            data = yaml.safe_load(fh) or {}
+            data = safe_load(fh) or {}
 
         self._pattern_rules = data.get("pattern_rules", [])
         self._field_rules = data.get("field_rules", [])
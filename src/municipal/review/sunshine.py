@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 from municipal.core.types import ApprovalStatus
@@ -16,6 +17,11 @@ class SunshineReportGenerator:
     """Collects stats from stores and produces a Sunshine Report.
 
     Deterministic aggregation only — no LLM dependency.
+
+    The last report is reused while the intake store's ``case_version`` is
+    unchanged and it is younger than ``ttl_s`` seconds. The TTL bounds how
+    stale the approval and notification figures can get. ``ttl_s=0``
+    disables reuse.
     """
 
     def __init__(
@@ -23,13 +29,26 @@ class SunshineReportGenerator:
         intake_store: IntakeStore,
         approval_gate: Any | None = None,
         notification_store: Any | None = None,
+        ttl_s: float = 5.0,
     ) -> None:
         self._store = intake_store
         self._approval = approval_gate
         self._notifications = notification_store
+        self._ttl_s = ttl_s
+        self._last: tuple[int, float, SunshineReportData] | None = None
 
     def generate(self) -> SunshineReportData:
         """Generate the Sunshine Report data."""
+        version = self._store.case_version
+        now = time.monotonic()
+        last = self._last
+        if last is not None and last[0] == version and now - last[1] < self._ttl_s:
+            return last[2]
+        report = self._build()
+        self._last = (version, now, report)
+        return report
+
+    def _build(self) -> SunshineReportData:
         cases = self._store.list_all_cases()
 
         # Cases by type
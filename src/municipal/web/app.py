@@ -62,6 +62,7 @@ from municipal.web.mission_control_v1 import (
     SessionTakeoverManager,
 )
 from municipal.web.notification_router import router as notification_router
+from municipal.web.review_router import SunshinePdfCache
 from municipal.web.review_router import router as review_router
 from municipal.review.redaction import RedactionEngine
 from municipal.review.inconsistency import InconsistencyDetector
@@ -379,6 +380,7 @@ def create_app(
     app.state.inconsistency_detector = inconsistency_detector
     app.state.summary_engine = summary_engine
     app.state.sunshine_generator = sunshine_generator
+    app.state.sunshine_pdf_cache = SunshinePdfCache()
 
     # Phase 3: Auth middleware
     app.add_middleware(AuthMiddleware)
@@ -501,16 +503,18 @@ def create_app(
         """List all active sessions (for Mission Control)."""
         from municipal.repositories import resolve
 
-        sessions = await resolve(session_manager.list_active_sessions())
+        ids, types, created, last_active, counts = await resolve(
+            session_manager.list_active_snapshot()
+        )
         return [
             SessionInfo(
-                session_id=s.session_id,
-                session_type=s.session_type.value,
-                created_at=s.created_at.isoformat(),
-                last_active=s.last_active.isoformat(),
-                message_count=len(s.messages),
+                session_id=sid,
+                session_type=stype.value,
+                created_at=ca.isoformat(),
+                last_active=la.isoformat(),
+                message_count=mc,
             )
-            for s in sessions
+            for sid, stype, ca, la, mc in zip(ids, types, created, last_active, counts)
         ]
 
     @app.get("/api/health", response_model=HealthResponse)
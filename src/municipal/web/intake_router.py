@@ -331,9 +331,10 @@ async def export_case(case_id: str, request: Request, format: str = "json") -> R
     )
 
     if format == "pdf":
-        pdf_bytes = renderer.render_pdf(packet)
+        # fpdf2 returns a bytearray; a memoryview hands it to Starlette
+        # without copying.
         return Response(
-            content=pdf_bytes,
+            content=memoryview(renderer.render_pdf(packet)),
             media_type="application/pdf",
             headers={"Content-Disposition": f"attachment; filename=case-{case_id}.pdf"},
         )
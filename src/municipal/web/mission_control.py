@@ -8,25 +8,46 @@ Per ROADMAP.md Section 5.1.
 
 from __future__ import annotations
 
-import uuid
+import bisect
+import functools
+import hashlib
+import itertools
+import secrets
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator, KeysView
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
+from municipal.bridge.models import ConnectionStatus
+from municipal.chat.session import ChatMessage, MessageRole
 from municipal.core.config import LLMConfig
-from municipal.core.types import SessionType
+from municipal.core.types import ApprovalStatus, AuditEvent, SessionType
+from municipal.governance.approval import ApprovalRequest
+from municipal.governance.audit import coerce_utc_datetime
+from municipal.repositories import resolve
+
+if TYPE_CHECKING:
+    from municipal.llm.registry import ModelRegistry
+    from municipal.web.mission_control_v1 import SessionTakeoverManager
 
 _WEB_DIR = Path(__file__).parent
 _TEMPLATES_DIR = _WEB_DIR / "templates"
 
 templates = Jinja2Templates(directory=str(_TEMPLATES_DIR))
 
+# Every staff page is the same context-free shell, so render it once at
+# import and let browsers revalidate via ETag.
+_STAFF_PAGE_BODY = templates.get_template("mission_control.html").render({}).encode("utf-8")
+_STAFF_PAGE_ETAG = f'"{hashlib.sha256(_STAFF_PAGE_BODY).hexdigest()}"'
+_STAFF_PAGE_HEADERS = {"ETag": _STAFF_PAGE_ETAG, "Cache-Control": "private, max-age=60"}
+
 router = APIRouter()
 
 
@@ -42,6 +63,16 @@ def _require_staff(request: Request) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Bound once so model defaults call straight into C rather than through a
+# per-instance lambda frame.
+_utcnow = functools.partial(datetime.now, timezone.utc)
+
+
+def _new_id() -> str:
+    """Return a new random 128-bit identifier as 32 hex chars."""
+    return secrets.token_hex(16)
+
+
 class FlagType(str, Enum):
     """Types of flags staff can apply to messages."""
 
@@ -54,8 +85,8 @@ class FlagType(str, Enum):
 class FeedbackEntry(BaseModel):
     """A single feedback/flag entry submitted by staff."""
 
-    feedback_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    feedback_id: str = Field(default_factory=_new_id)
+    timestamp: datetime = Field(default_factory=_utcnow)
     staff_id: str = "staff"
     session_id: str
     message_index: int
@@ -68,7 +99,7 @@ class FeedbackRequest(BaseModel):
 
     session_id: str
     message_index: int
-    flag_type: str
+    flag_type: FlagType
     note: str = ""
     staff_id: str = "staff"
 
@@ -85,31 +116,106 @@ class ShadowToggleRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 
+def _entry_timestamp(entry: FeedbackEntry) -> datetime:
+    return entry.timestamp
+
+
+def _merge_sorted(
+    entries: tuple[FeedbackEntry, ...], new: Iterable[FeedbackEntry]
+) -> tuple[FeedbackEntry, ...]:
+    """Return a new timestamp-sorted tuple with *new* merged into *entries*."""
+    merged = list(entries)
+    for entry in new:
+        # New entries almost always belong at the end, so only fall back to a
+        # binary insert when a timestamp arrives out of order.
+        if not merged or entry.timestamp >= merged[-1].timestamp:
+            merged.append(entry)
+        else:
+            bisect.insort(merged, entry, key=_entry_timestamp)
+    return tuple(merged)
+
+
+def _entries_after(
+    entries: tuple[FeedbackEntry, ...], after: datetime | None
+) -> tuple[FeedbackEntry, ...]:
+    """Slice a timestamp-sorted tuple to the entries strictly after *after*."""
+    if after is None:
+        return entries
+    return entries[bisect.bisect_right(entries, after, key=_entry_timestamp):]
+
+
 class FeedbackStore:
-    """In-memory store for staff feedback entries."""
+    """In-memory store for staff feedback entries.
+
+    Entry sequences are immutable tuples that writers replace wholesale, so
+    readers work on whatever snapshot they picked up without locking.
+    Feedback is written far less often than it is read, which keeps the
+    O(N) copy per write cheap in practice.
+    """
+
+    __slots__ = ("_entries", "_by_session", "_by_id")
 
     def __init__(self) -> None:
-        self._entries: list[FeedbackEntry] = []
+        self._entries: tuple[FeedbackEntry, ...] = ()
+        self._by_session: dict[str, tuple[FeedbackEntry, ...]] = {}
+        self._by_id: dict[str, FeedbackEntry] = {}
+
+    def _insert(self, entries: list[FeedbackEntry]) -> None:
+        # _entries and every per-session tuple stay sorted oldest-first.
+        by_session: dict[str, list[FeedbackEntry]] = {}
+        for entry in entries:
+            by_session.setdefault(entry.session_id, []).append(entry)
+        for session_id, session_entries in by_session.items():
+            self._by_session[session_id] = _merge_sorted(
+                self._by_session.get(session_id, ()), session_entries
+            )
+        for entry in entries:
+            self._by_id[entry.feedback_id] = entry
+        self._entries = _merge_sorted(self._entries, entries)
 
     def add(self, entry: FeedbackEntry) -> FeedbackEntry:
         """Add a feedback entry and return it."""
-        self._entries.append(entry)
+        self._insert([entry])
         return entry
 
-    def list_all(self) -> list[FeedbackEntry]:
-        """Return all feedback entries, newest first."""
-        return sorted(self._entries, key=lambda e: e.timestamp, reverse=True)
-
-    def get_for_session(self, session_id: str) -> list[FeedbackEntry]:
-        """Return feedback entries for a specific session."""
-        return [e for e in self._entries if e.session_id == session_id]
+    def add_many(self, entries: list[FeedbackEntry]) -> list[FeedbackEntry]:
+        """Add several feedback entries in one operation and return them."""
+        self._insert(entries)
+        return entries
+
+    def list_all(self, after: datetime | None = None) -> list[FeedbackEntry]:
+        """Return all feedback entries, newest first.
+
+        Args:
+            after: If given, only entries with a timestamp strictly after it.
+        """
+        return list(reversed(_entries_after(self._entries, after)))
+
+    def list_page(self, limit: int, offset: int = 0) -> list[FeedbackEntry]:
+        """Return one page of feedback entries, newest first.
+
+        Entries are kept sorted by timestamp, so the page is sliced from
+        the tail without sorting the whole list.
+        """
+        entries = self._entries
+        end = max(0, len(entries) - offset)
+        start = max(0, end - limit)
+        return list(reversed(entries[start:end]))
+
+    def get_for_session(
+        self, session_id: str, after: datetime | None = None
+    ) -> list[FeedbackEntry]:
+        """Return feedback entries for a specific session, oldest first.
+
+        Args:
+            session_id: The session to look up.
+            after: If given, only entries with a timestamp strictly after it.
+        """
+        return list(_entries_after(self._by_session.get(session_id, ()), after))
 
     def get_by_id(self, feedback_id: str) -> FeedbackEntry | None:
         """Return a single feedback entry by ID."""
-        for e in self._entries:
-            if e.feedback_id == feedback_id:
-                return e
-        return None
+        return self._by_id.get(feedback_id)
 
     def count(self) -> int:
         """Return the number of feedback entries."""
@@ -117,24 +223,28 @@ class FeedbackStore:
 
     def clear(self) -> None:
         """Remove all entries (useful for testing)."""
-        self._entries.clear()
+        self._entries = ()
+        self._by_session = {}
+        self._by_id = {}
 
 
 class ShadowComparisonResult(BaseModel):
     """Result of a shadow mode comparison between production and candidate models."""
 
-    comparison_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    comparison_id: str = Field(default_factory=_new_id)
     session_id: str
     user_message: str
     production_response: str
     candidate_response: str
     diverged: bool = False
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utcnow)
 
 
 class ShadowComparisonStore:
     """In-memory store for shadow comparison results."""
 
+    __slots__ = ("_comparisons",)
+
     def __init__(self) -> None:
         self._comparisons: list[ShadowComparisonResult] = []
 
@@ -161,33 +271,49 @@ class ShadowComparisonStore:
         self._comparisons.clear()
 
 
+_DEFAULT_MAX_SHADOW_SESSIONS = 10_000
+
+
 class ShadowModeManager:
-    """In-memory tracker for shadow mode on sessions."""
+    """In-memory tracker for shadow mode on sessions.
 
-    def __init__(self) -> None:
-        self._shadow_sessions: set[str] = set()
+    Sessions are kept in least-recently-enabled order and the oldest is
+    evicted once ``max_sessions`` is exceeded, so sessions that expire
+    without an explicit disable do not accumulate forever.
+    """
+
+    __slots__ = ("_shadow_sessions", "_max_sessions", "shadow_llm_config")
+
+    def __init__(self, max_sessions: int = _DEFAULT_MAX_SHADOW_SESSIONS) -> None:
+        self._shadow_sessions: OrderedDict[str, None] = OrderedDict()
+        self._max_sessions = max_sessions
         self.shadow_llm_config: LLMConfig | None = None
 
     def enable(self, session_id: str) -> None:
         """Enable shadow mode for a session."""
-        self._shadow_sessions.add(session_id)
+        self._shadow_sessions[session_id] = None
+        self._shadow_sessions.move_to_end(session_id)
+        if len(self._shadow_sessions) > self._max_sessions:
+            self._shadow_sessions.popitem(last=False)
 
     def disable(self, session_id: str) -> None:
         """Disable shadow mode for a session."""
-        self._shadow_sessions.discard(session_id)
+        self._shadow_sessions.pop(session_id, None)
 
     def toggle(self, session_id: str, enabled: bool) -> bool:
         """Set shadow mode state. Returns the new state."""
-        if enabled:
-            self.enable(session_id)
-        else:
-            self.disable(session_id)
+        (self.enable if enabled else self.disable)(session_id)
         return enabled
 
     def is_active(self, session_id: str) -> bool:
         """Check if shadow mode is active for a session."""
         return session_id in self._shadow_sessions
 
+    @property
+    def active_ids(self) -> KeysView[str]:
+        """Live read-only view of shadow-mode session IDs for bulk membership checks."""
+        return self._shadow_sessions.keys()
+
     def list_active(self) -> list[str]:
         """Return all session IDs with active shadow mode."""
         return list(self._shadow_sessions)
@@ -197,51 +323,213 @@ class ShadowModeManager:
         self._shadow_sessions.clear()
 
 
+# Single-item responses format datetimes through this adapter so they match
+# the list endpoints below (pydantic's ISO 8601, with "Z" for UTC).
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+
+def _json_datetime(value: datetime) -> str:
+    return _DATETIME_ADAPTER.dump_python(value, mode="json")
+
+
+# List endpoints serialize whole result lists in a single pydantic-core call.
+_FEEDBACK_LIST_ADAPTER = TypeAdapter(list[FeedbackEntry])
+_COMPARISON_LIST_ADAPTER = TypeAdapter(list[ShadowComparisonResult])
+_AUDIT_LIST_ADAPTER = TypeAdapter(list[AuditEvent])
+_AUDIT_SUMMARY_FIELDS = {
+    "__all__": {
+        "event_id",
+        "timestamp",
+        "session_id",
+        "actor",
+        "action",
+        "resource",
+        "classification",
+        "details",
+    }
+}
+_APPROVAL_LIST_ADAPTER = TypeAdapter(list[ApprovalRequest])
+_APPROVAL_SUMMARY_FIELDS = {
+    "__all__": {
+        "request_id",
+        "gate_type",
+        "resource",
+        "requestor",
+        "status",
+        "created_at",
+        "approver",
+        "deny_reason",
+    }
+}
+
+
+# Enum member -> wire value, looked up per row in the list endpoints.
+_SESSION_TYPE_VALUES = {t: t.value for t in SessionType}
+_CONNECTION_STATUS_VALUES = {c: c.value for c in ConnectionStatus}
+
+# Pre-encoded bodies for the "dependency not configured" short-circuits.
+_EMPTY_LIST_JSON = b"[]"
+_EMPTY_ADAPTERS_JSON = b'{"adapters":[]}'
+
+
+def _raw_json_response(body: bytes) -> Response:
+    """Wrap already-encoded JSON bytes in a fresh response."""
+    return Response(body, media_type="application/json")
+
+
+def _json_list_response(
+    adapter: TypeAdapter[Any], items: list[Any], include: dict[str, Any] | None = None
+) -> Response:
+    """Encode a list straight to JSON bytes in pydantic-core."""
+    return _raw_json_response(adapter.dump_json(items, include=include))
+
+
+_STREAM_BATCH_SIZE = 256
+
+
+def _json_array_chunks(
+    adapter: TypeAdapter[Any], batches: Iterable[list[Any]], include: dict[str, Any] | None
+) -> Iterator[bytes]:
+    # Each batch is encoded as a list and its brackets dropped, so the
+    # chunks concatenate into a single JSON array.
+    yield b"["
+    sep = b""
+    for batch in batches:
+        yield sep + adapter.dump_json(batch, include=include)[1:-1]
+        sep = b","
+    yield b"]"
+
+
+async def _ajson_array_chunks(
+    adapter: TypeAdapter[Any], batches: AsyncIterator[list[Any]], include: dict[str, Any] | None
+) -> AsyncIterator[bytes]:
+    yield b"["
+    sep = b""
+    async for batch in batches:
+        yield sep + adapter.dump_json(batch, include=include)[1:-1]
+        sep = b","
+    yield b"]"
+
+
+def _batched(items: Iterable[Any]) -> Iterator[list[Any]]:
+    it = iter(items)
+    while batch := list(itertools.islice(it, _STREAM_BATCH_SIZE)):
+        yield batch
+
+
+async def _abatched(items: AsyncIterator[Any]) -> AsyncIterator[list[Any]]:
+    batch: list[Any] = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) == _STREAM_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _stream_json_list_response(
+    adapter: TypeAdapter[Any],
+    items: Iterable[Any] | AsyncIterator[Any],
+    include: dict[str, Any] | None = None,
+) -> StreamingResponse:
+    """Stream a lazily produced list as one JSON array, a batch at a time.
+
+    Sync iterables are drained in Starlette's threadpool, so blocking reads
+    such as the JSONL audit log stay off the event loop.
+    """
+    if isinstance(items, AsyncIterator):
+        chunks: Iterable[bytes] | AsyncIterator[bytes] = _ajson_array_chunks(
+            adapter, _abatched(items), include
+        )
+    else:
+        chunks = _json_array_chunks(adapter, _batched(items), include)
+    return StreamingResponse(chunks, media_type="application/json")
+
+
 def get_feedback_store(request: Request) -> FeedbackStore:
-    """Get the FeedbackStore from app state."""
-    store = getattr(request.app.state, "feedback_store", None)
-    if store is None:
-        raise HTTPException(status_code=503, detail="Feedback store not available")
-    return store
+    """Get the FeedbackStore from app state.
+
+    ``create_app`` always installs one, so this is a plain attribute read.
+    """
+    return request.app.state.feedback_store
 
 
 def get_shadow_manager(request: Request) -> ShadowModeManager:
-    """Get the ShadowModeManager from app state."""
-    manager = getattr(request.app.state, "shadow_manager", None)
+    """Get the ShadowModeManager from app state.
+
+    ``create_app`` always installs one, so this is a plain attribute read.
+    """
+    return request.app.state.shadow_manager
+
+
+def _invalidate_metrics(request: Request) -> None:
+    # Staff actions should be visible on the next dashboard poll rather
+    # than after the metrics cache expires.
+    metrics_service = getattr(request.app.state, "metrics_service", None)
+    if metrics_service is not None:
+        metrics_service.invalidate()
+
+
+def _get_approval_gate(request: Request) -> Any:
+    gate = getattr(request.app.state, "approval_gate", None)
+    if gate is None:
+        raise HTTPException(status_code=503, detail="Approval gate not available")
+    return gate
+
+
+def _get_takeover_manager(request: Request) -> SessionTakeoverManager:
+    manager = getattr(request.app.state, "takeover_manager", None)
     if manager is None:
-        raise HTTPException(status_code=503, detail="Shadow manager not available")
+        raise HTTPException(status_code=503, detail="Takeover manager not available")
     return manager
 
 
+def _get_model_registry(request: Request) -> ModelRegistry:
+    registry = getattr(request.app.state, "model_registry", None)
+    if registry is None:
+        raise HTTPException(status_code=503, detail="Model registry not available")
+    return registry
+
+
 # ---------------------------------------------------------------------------
 # Template routes (HTML pages)
 # ---------------------------------------------------------------------------
 
 
+def _cached_staff_page(request: Request) -> Response:
+    """Serve the pre-rendered dashboard, or 304 if the client copy is current."""
+    if request.headers.get("if-none-match") == _STAFF_PAGE_ETAG:
+        return Response(status_code=304, headers=_STAFF_PAGE_HEADERS)
+    return HTMLResponse(_STAFF_PAGE_BODY, headers=_STAFF_PAGE_HEADERS)
+
+
 @router.get("/staff/", response_class=HTMLResponse)
-async def staff_dashboard(request: Request) -> HTMLResponse:
+async def staff_dashboard(request: Request) -> Response:
     """Render the Mission Control dashboard."""
-    return templates.TemplateResponse(request, "mission_control.html")
+    return _cached_staff_page(request)
 
 
 @router.get("/staff/sessions", response_class=HTMLResponse)
-async def staff_sessions_page(request: Request) -> HTMLResponse:
+async def staff_sessions_page(request: Request) -> Response:
     """Render the sessions list page (redirects to dashboard)."""
-    return templates.TemplateResponse(request, "mission_control.html")
+    return _cached_staff_page(request)
 
 
 @router.get("/staff/sessions/{session_id}", response_class=HTMLResponse)
-async def staff_session_detail_page(request: Request, session_id: str) -> HTMLResponse:
-    """Render the session detail page (redirects to dashboard with session pre-selected)."""
-    return templates.TemplateResponse(
-        request, "mission_control.html", {"selected_session_id": session_id}
-    )
+async def staff_session_detail_page(request: Request, session_id: str) -> Response:
+    """Render the session detail page (redirects to dashboard with session pre-selected).
+
+    The template takes no per-session context, so this serves the same
+    pre-rendered shell as the other staff routes.
+    """
+    return _cached_staff_page(request)
 
 
 @router.get("/staff/audit", response_class=HTMLResponse)
-async def staff_audit_page(request: Request) -> HTMLResponse:
+async def staff_audit_page(request: Request) -> Response:
     """Render the audit log viewer page."""
-    return templates.TemplateResponse(request, "mission_control.html")
+    return _cached_staff_page(request)
 
 
 # ---------------------------------------------------------------------------
@@ -254,19 +542,21 @@ async def api_staff_sessions(request: Request) -> list[dict[str, Any]]:
     """Return all active sessions with shadow mode status."""
     _require_staff(request)
     session_manager = request.app.state.session_manager
-    shadow_manager = get_shadow_manager(request)
-    sessions = session_manager.list_active_sessions()
+    active_shadow_ids = get_shadow_manager(request).active_ids
+    ids, types, created, last_active, counts = await resolve(
+        session_manager.list_active_snapshot()
+    )
 
     return [
         {
-            "session_id": s.session_id,
-            "session_type": s.session_type.value,
-            "created_at": s.created_at.isoformat(),
-            "last_active": s.last_active.isoformat(),
-            "message_count": len(s.messages),
-            "shadow_mode": shadow_manager.is_active(s.session_id),
+            "session_id": sid,
+            "session_type": _SESSION_TYPE_VALUES[stype],
+            "created_at": _json_datetime(ca),
+            "last_active": _json_datetime(la),
+            "message_count": mc,
+            "shadow_mode": sid in active_shadow_ids,
         }
-        for s in sessions
+        for sid, stype, ca, la, mc in zip(ids, types, created, last_active, counts)
     ]
 
 
@@ -276,15 +566,15 @@ async def api_staff_audit(
     actor: str | None = None,
     action: str | None = None,
     classification: str | None = None,
-    after: str | None = None,
-    before: str | None = None,
+    after: datetime | None = None,
+    before: datetime | None = None,
     session_id: str | None = None,
-) -> list[dict[str, Any]]:
+) -> Response:
     """Query audit log entries with optional filters."""
     _require_staff(request)
     audit_logger = getattr(request.app.state, "audit_logger", None)
     if audit_logger is None:
-        return []
+        return _raw_json_response(_EMPTY_LIST_JSON)
 
     filters: dict[str, Any] = {}
     if actor:
@@ -300,39 +590,18 @@ async def api_staff_audit(
     if session_id:
         filters["session_id"] = session_id
 
-    events = audit_logger.query(filters)
-    return [
-        {
-            "event_id": e.event_id,
-            "timestamp": e.timestamp.isoformat(),
-            "session_id": e.session_id,
-            "actor": e.actor,
-            "action": e.action,
-            "resource": e.resource,
-            "classification": e.classification.value,
-            "details": e.details,
-        }
-        for e in events
-    ]
+    return _stream_json_list_response(
+        _AUDIT_LIST_ADAPTER, audit_logger.iter_query(filters), include=_AUDIT_SUMMARY_FIELDS
+    )
 
 
 @router.post("/api/staff/feedback")
 async def api_submit_feedback(request: Request, body: FeedbackRequest) -> dict[str, Any]:
     """Submit feedback/flag on a message."""
     _require_staff(request)
-    # Validate flag_type
-    try:
-        flag_type = FlagType(body.flag_type)
-    except ValueError:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid flag_type: {body.flag_type!r}. "
-            f"Must be one of: {', '.join(f.value for f in FlagType)}",
-        )
-
     # Validate session exists
     session_manager = request.app.state.session_manager
-    session = session_manager.get_session(body.session_id)
+    session = await resolve(session_manager.get_session(body.session_id))
     if session is None:
         raise HTTPException(
             status_code=404,
@@ -347,20 +616,82 @@ async def api_submit_feedback(request: Request, body: FeedbackRequest) -> dict[s
             f"(session has {len(session.messages)} messages)",
         )
 
+    # The request model already validated every field.
     feedback_store = get_feedback_store(request)
-    entry = FeedbackEntry(
+    entry = FeedbackEntry.model_construct(
+        feedback_id=_new_id(),
+        timestamp=_utcnow(),
         session_id=body.session_id,
         message_index=body.message_index,
-        flag_type=flag_type,
+        flag_type=body.flag_type,
         note=body.note,
         staff_id=body.staff_id,
     )
-    feedback_store.add(entry)
+    await resolve(feedback_store.add(entry))
 
     return {
         "status": "created",
         "feedback_id": entry.feedback_id,
-        "timestamp": entry.timestamp.isoformat(),
+        "timestamp": _json_datetime(entry.timestamp),
+    }
+
+
+@router.post("/api/staff/feedback/batch")
+async def api_submit_feedback_batch(
+    request: Request, body: list[FeedbackRequest]
+) -> dict[str, Any]:
+    """Submit several feedback entries at once.
+
+    Each distinct session is looked up once. The batch is all-or-nothing:
+    if any entry is invalid, nothing is stored and every error is reported.
+    """
+    _require_staff(request)
+    session_manager = request.app.state.session_manager
+
+    by_session: dict[str, list[int]] = {}
+    for i, item in enumerate(body):
+        by_session.setdefault(item.session_id, []).append(i)
+
+    errors: list[dict[str, Any]] = []
+    for session_id, indices in by_session.items():
+        session = await resolve(session_manager.get_session(session_id))
+        message_count = len(session.messages) if session is not None else 0
+        for i in indices:
+            item = body[i]
+            if session is None:
+                errors.append({"index": i, "detail": f"Session {session_id!r} not found"})
+            elif item.message_index < 0 or item.message_index >= message_count:
+                errors.append({
+                    "index": i,
+                    "detail": f"message_index {item.message_index} out of range "
+                    f"(session has {message_count} messages)",
+                })
+    if errors:
+        errors.sort(key=lambda e: e["index"])
+        raise HTTPException(status_code=400, detail=errors)
+
+    # Every field was validated above, so skip re-validation and share a
+    # single timestamp across the batch.
+    feedback_store = get_feedback_store(request)
+    now = _utcnow()
+    entries = [
+        FeedbackEntry.model_construct(
+            feedback_id=_new_id(),
+            timestamp=now,
+            session_id=item.session_id,
+            message_index=item.message_index,
+            flag_type=item.flag_type,
+            note=item.note,
+            staff_id=item.staff_id,
+        )
+        for item in body
+    ]
+    await resolve(feedback_store.add_many(entries))
+
+    return {
+        "status": "created",
+        "count": len(entries),
+        "feedback_ids": [e.feedback_id for e in entries],
     }
 
 
@@ -368,28 +699,27 @@ async def api_submit_feedback(request: Request, body: FeedbackRequest) -> dict[s
 async def api_list_feedback(
     request: Request,
     session_id: str | None = None,
-) -> list[dict[str, Any]]:
-    """List all feedback entries, optionally filtered by session."""
+    limit: int | None = Query(default=None, ge=1),
+    offset: int = Query(default=0, ge=0),
+    after: datetime | None = None,
+) -> Response:
+    """List feedback entries, optionally filtered by session and time, and paginated."""
     _require_staff(request)
     feedback_store = get_feedback_store(request)
+    if after is not None:
+        after = coerce_utc_datetime(after)
 
     if session_id:
-        entries = feedback_store.get_for_session(session_id)
+        entries = await resolve(feedback_store.get_for_session(session_id, after=after))
+    elif after is None and limit is not None:
+        entries = await resolve(feedback_store.list_page(limit, offset))
+        limit = None
     else:
-        entries = feedback_store.list_all()
+        entries = await resolve(feedback_store.list_all(after=after))
+    if limit is not None:
+        entries = entries[offset:offset + limit]
 
-    return [
-        {
-            "feedback_id": e.feedback_id,
-            "timestamp": e.timestamp.isoformat(),
-            "staff_id": e.staff_id,
-            "session_id": e.session_id,
-            "message_index": e.message_index,
-            "flag_type": e.flag_type.value,
-            "note": e.note,
-        }
-        for e in entries
-    ]
+    return _json_list_response(_FEEDBACK_LIST_ADAPTER, entries)
 
 
 @router.post("/api/staff/shadow")
@@ -410,36 +740,26 @@ async def api_toggle_shadow(request: Request, body: ShadowToggleRequest) -> dict
 
 
 @router.get("/api/staff/approvals")
-async def api_list_approvals(request: Request) -> list[dict[str, Any]]:
-    """List pending approval requests."""
+async def api_list_approvals(request: Request, status: str | None = None) -> Response:
+    """List approval requests; ``?status=pending`` returns only the open queue."""
     _require_staff(request)
     approval_gate = getattr(request.app.state, "approval_gate", None)
     if approval_gate is None:
-        return []
-    from municipal.core.types import ApprovalStatus
-    requests = approval_gate.list_all_requests()
-    return [
-        {
-            "request_id": r.request_id,
-            "gate_type": r.gate_type,
-            "resource": r.resource,
-            "requestor": r.requestor,
-            "status": r.status,
-            "created_at": r.created_at.isoformat(),
-            "approver": r.approver,
-            "deny_reason": r.deny_reason,
-        }
-        for r in requests
-    ]
+        return _raw_json_response(_EMPTY_LIST_JSON)
+    if status == ApprovalStatus.PENDING.value:
+        requests = await resolve(approval_gate.pending_requests)
+    else:
+        requests = await resolve(approval_gate.list_all_requests())
+        if status is not None:
+            requests = [r for r in requests if r.status == status]
+    return _json_list_response(_APPROVAL_LIST_ADAPTER, requests, include=_APPROVAL_SUMMARY_FIELDS)
 
 
 @router.get("/api/staff/approvals/{request_id}")
 async def api_get_approval(request_id: str, request: Request) -> dict[str, Any]:
     """Get approval request detail."""
     _require_staff(request)
-    approval_gate = getattr(request.app.state, "approval_gate", None)
-    if approval_gate is None:
-        raise HTTPException(status_code=503, detail="Approval gate not available")
+    approval_gate = _get_approval_gate(request)
     try:
         r = approval_gate.get_request(request_id)
     except KeyError:
@@ -450,8 +770,8 @@ async def api_get_approval(request_id: str, request: Request) -> dict[str, Any]:
         "resource": r.resource,
         "requestor": r.requestor,
         "status": r.status,
-        "created_at": r.created_at.isoformat(),
-        "updated_at": r.updated_at.isoformat(),
+        "created_at": _json_datetime(r.created_at),
+        "updated_at": _json_datetime(r.updated_at),
         "approver": r.approver,
         "deny_reason": r.deny_reason,
         "approvals": r.approvals,
@@ -470,9 +790,7 @@ async def api_approve_request(
 ) -> dict[str, Any]:
     """Approve an approval request."""
     _require_staff(request)
-    approval_gate = getattr(request.app.state, "approval_gate", None)
-    if approval_gate is None:
-        raise HTTPException(status_code=503, detail="Approval gate not available")
+    approval_gate = _get_approval_gate(request)
     approver = body.approver if body else "staff"
     try:
         r = approval_gate.approve(request_id, approver)
@@ -480,6 +798,7 @@ async def api_approve_request(
         raise HTTPException(status_code=404, detail=f"Approval request {request_id!r} not found")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    _invalidate_metrics(request)
     return {"request_id": r.request_id, "status": r.status, "approver": r.approver}
 
 
@@ -489,15 +808,14 @@ async def api_deny_request(
 ) -> dict[str, Any]:
     """Deny an approval request."""
     _require_staff(request)
-    approval_gate = getattr(request.app.state, "approval_gate", None)
-    if approval_gate is None:
-        raise HTTPException(status_code=503, detail="Approval gate not available")
+    approval_gate = _get_approval_gate(request)
     try:
         r = approval_gate.deny(request_id, body.approver, body.reason)
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Approval request {request_id!r} not found")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    _invalidate_metrics(request)
     return {"request_id": r.request_id, "status": r.status, "deny_reason": r.deny_reason}
 
 
@@ -512,17 +830,17 @@ async def api_metrics(request: Request) -> dict[str, Any]:
     return snapshot.model_dump(mode="json")
 
 
-@router.get("/api/staff/metrics/adapters")
-async def api_adapter_metrics(request: Request) -> dict[str, Any]:
+@router.get("/api/staff/metrics/adapters", response_model=None)
+async def api_adapter_metrics(request: Request) -> dict[str, Any] | Response:
     """Adapter health and usage metrics."""
     _require_staff(request)
     registry = getattr(request.app.state, "adapter_registry", None)
     if registry is None:
-        return {"adapters": []}
-    health = registry.health_check_all()
+        return _raw_json_response(_EMPTY_ADAPTERS_JSON)
+    health = await registry.health_check_all_async()
     return {
         "adapters": [
-            {"name": name, "status": status.value}
+            {"name": name, "status": _CONNECTION_STATUS_VALUES[status]}
             for name, status in health.items()
         ]
     }
@@ -532,15 +850,34 @@ class TakeoverRequest(BaseModel):
     staff_id: str = "staff"
 
 
+@router.get("/api/staff/takeovers", response_model=None)
+async def api_list_takeovers(request: Request) -> dict[str, Any] | Response:
+    """List active takeovers; 304 if the client's ETag is current."""
+    _require_staff(request)
+    takeover_mgr = _get_takeover_manager(request)
+    etag = await resolve(takeover_mgr.etag())
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    takeovers = await resolve(takeover_mgr.list_takeovers())
+    return JSONResponse(
+        {
+            "takeovers": [
+                {"session_id": session_id, "staff_id": staff_id}
+                for session_id, staff_id in takeovers.items()
+            ]
+        },
+        headers=headers,
+    )
+
+
 @router.post("/api/staff/sessions/{session_id}/takeover")
 async def api_takeover_session(
     session_id: str, request: Request, body: TakeoverRequest | None = None
 ) -> dict[str, Any]:
     """Staff takes over a session."""
     _require_staff(request)
-    takeover_mgr = getattr(request.app.state, "takeover_manager", None)
-    if takeover_mgr is None:
-        raise HTTPException(status_code=503, detail="Takeover manager not available")
+    takeover_mgr = _get_takeover_manager(request)
     staff_id = body.staff_id if body else "staff"
     return takeover_mgr.takeover(session_id, staff_id)
 
@@ -549,9 +886,7 @@ async def api_takeover_session(
 async def api_release_session(session_id: str, request: Request) -> dict[str, Any]:
     """Release a taken-over session."""
     _require_staff(request)
-    takeover_mgr = getattr(request.app.state, "takeover_manager", None)
-    if takeover_mgr is None:
-        raise HTTPException(status_code=503, detail="Takeover manager not available")
+    takeover_mgr = _get_takeover_manager(request)
     return takeover_mgr.release(session_id)
 
 
@@ -568,11 +903,11 @@ def _get_comparison_store(request: Request) -> ShadowComparisonStore:
 
 
 @router.get("/api/staff/shadow/comparisons")
-async def api_shadow_comparisons(request: Request) -> list[dict[str, Any]]:
+async def api_shadow_comparisons(request: Request) -> Response:
     """List all shadow comparison results."""
     _require_staff(request)
     store = _get_comparison_store(request)
-    return [c.model_dump(mode="json") for c in store.list_all()]
+    return _json_list_response(_COMPARISON_LIST_ADAPTER, store.list_all())
 
 
 @router.get("/api/staff/shadow/stats")
@@ -602,9 +937,7 @@ class CandidateModelRequest(BaseModel):
 async def api_set_candidate(body: CandidateModelRequest, request: Request) -> dict[str, Any]:
     """Register a candidate model for shadow testing."""
     _require_staff(request)
-    model_registry = getattr(request.app.state, "model_registry", None)
-    if model_registry is None:
-        raise HTTPException(status_code=503, detail="Model registry not available")
+    model_registry = _get_model_registry(request)
 
     config = LLMConfig(
         provider=body.provider,
@@ -626,9 +959,7 @@ async def api_set_candidate(body: CandidateModelRequest, request: Request) -> di
 async def api_list_models(request: Request) -> dict[str, Any]:
     """List production and candidate model configurations."""
     _require_staff(request)
-    model_registry = getattr(request.app.state, "model_registry", None)
-    if model_registry is None:
-        raise HTTPException(status_code=503, detail="Model registry not available")
+    model_registry = _get_model_registry(request)
     return model_registry.summary()
 
 
@@ -636,9 +967,7 @@ async def api_list_models(request: Request) -> dict[str, Any]:
 async def api_promote_candidate(request: Request) -> dict[str, Any]:
     """Promote the candidate model to production."""
     _require_staff(request)
-    model_registry = getattr(request.app.state, "model_registry", None)
-    if model_registry is None:
-        raise HTTPException(status_code=503, detail="Model registry not available")
+    model_registry = _get_model_registry(request)
     try:
         promoted = model_registry.promote_candidate()
     except ValueError as e:
@@ -669,8 +998,6 @@ async def api_staff_message(
     if session is None:
         raise HTTPException(status_code=404, detail=f"Session {session_id!r} not found")
 
-    from municipal.chat.session import ChatMessage, MessageRole
-
     msg = ChatMessage(
         role=MessageRole.ASSISTANT,
         content=f"[Staff: {body.staff_id}] {body.message}",
@@ -681,5 +1008,5 @@ async def api_staff_message(
         "session_id": session_id,
         "staff_id": body.staff_id,
         "message": body.message,
-        "timestamp": msg.timestamp.isoformat(),
+        "timestamp": _json_datetime(msg.timestamp),
     }
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
-from collections import deque
+import bisect
+import functools
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -12,13 +19,25 @@ from municipal.bridge.models import ConnectionStatus
 
 
 class LLMLatencyTracker:
-    """Rolling window tracker for LLM response latencies (p50/p95)."""
+    """Rolling window tracker for LLM response latencies (p50/p95).
+
+    A sorted copy of the window is maintained alongside the deque, so each
+    percentile is an index lookup instead of a full sort.
+    """
+
+    __slots__ = ("_latencies", "_sorted")
 
     def __init__(self, window_size: int = 100) -> None:
         self._latencies: deque[float] = deque(maxlen=window_size)
+        self._sorted: list[float] = []
 
     def record(self, latency_ms: float) -> None:
+        if len(self._latencies) == self._latencies.maxlen:
+            if not self._latencies:
+                return  # a zero-size window keeps nothing
+            del self._sorted[bisect.bisect_left(self._sorted, self._latencies[0])]
         self._latencies.append(latency_ms)
+        bisect.insort(self._sorted, latency_ms)
 
     def p50(self) -> float | None:
         if not self._latencies:
@@ -31,7 +50,7 @@ class LLMLatencyTracker:
         return self._percentile(95)
 
     def _percentile(self, pct: float) -> float:
-        sorted_vals = sorted(self._latencies)
+        sorted_vals = self._sorted
         n = len(sorted_vals)
         idx = (pct / 100.0) * (n - 1)
         lower = int(idx)
@@ -45,6 +64,7 @@ class LLMLatencyTracker:
 
     def clear(self) -> None:
         self._latencies.clear()
+        self._sorted.clear()
 
 
 class MetricsSnapshot(BaseModel):
@@ -60,11 +80,17 @@ class MetricsSnapshot(BaseModel):
     llm_latency_p50_ms: float | None = None
     llm_latency_p95_ms: float | None = None
     shadow_divergence_rate: float | None = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=functools.partial(datetime.now, timezone.utc))
 
 
 class MetricsService:
-    """Computes live metrics from in-memory stores."""
+    """Computes live metrics from in-memory stores.
+
+    Snapshots are cached for ``ttl_s`` seconds so that several dashboards
+    polling at once share one computation. Call :meth:`invalidate` after a
+    staff action that should show up immediately; ``ttl_s=0`` disables
+    caching.
+    """
 
     def __init__(
         self,
@@ -74,6 +100,7 @@ class MetricsService:
         adapter_registry: Any = None,
         llm_tracker: LLMLatencyTracker | None = None,
         comparison_store: Any = None,
+        ttl_s: float = 0.5,
     ) -> None:
         self._sessions = session_manager
         self._intake = intake_store
@@ -81,32 +108,44 @@ class MetricsService:
         self._registry = adapter_registry
         self._llm_tracker = llm_tracker
         self._comparison_store = comparison_store
+        self._ttl_s = ttl_s
+        self._cache: tuple[float, MetricsSnapshot] | None = None
+        self._lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next call recomputes it."""
+        self._cache = None
 
     def snapshot(self) -> MetricsSnapshot:
-        sessions = self._sessions.list_active_sessions() if self._sessions else []
-        total_sessions = len(sessions)
+        cached = self._cache
+        if cached is not None and time.monotonic() - cached[0] < self._ttl_s:
+            return cached[1]
+        with self._lock:
+            # Another caller may have refreshed the cache while we waited.
+            cached = self._cache
+            now = time.monotonic()
+            if cached is not None and now - cached[0] < self._ttl_s:
+                return cached[1]
+            snap = self._compute()
+            self._cache = (now, snap)
+            return snap
+
+    def _compute(self) -> MetricsSnapshot:
+        total_sessions = self._sessions.count_active() if self._sessions else 0
 
         total_cases = 0
         if self._intake:
             total_cases = self._intake.case_count
 
-        pending = 0
-        approved = 0
-        denied = 0
+        status_counts: Counter[str] = Counter()
         if self._approval:
-            for req in self._approval.list_all_requests():
-                if req.status == "pending":
-                    pending += 1
-                elif req.status == "approved":
-                    approved += 1
-                elif req.status == "denied":
-                    denied += 1
+            status_counts.update(req.status for req in self._approval.list_all_requests())
 
         adapter_health: dict[str, str] = {}
         if self._registry:
             adapter_health = {
                 name: status.value
-                for name, status in self._registry.health_check_all().items()
+                for name, status in self._registry.cached_health_check_all().items()
             }
 
         llm_p50 = self._llm_tracker.p50() if self._llm_tracker else None
@@ -122,9 +161,9 @@ class MetricsService:
             total_sessions=total_sessions,
             active_sessions=total_sessions,
             total_cases=total_cases,
-            pending_approvals=pending,
-            approved_count=approved,
-            denied_count=denied,
+            pending_approvals=status_counts["pending"],
+            approved_count=status_counts["approved"],
+            denied_count=status_counts["denied"],
             adapter_health=adapter_health,
             llm_latency_p50_ms=llm_p50,
             llm_latency_p95_ms=llm_p95,
@@ -133,13 +172,35 @@ class MetricsService:
 
 
 class SessionTakeoverManager:
-    """Manages staff session takeovers."""
+    """Manages staff session takeovers.
+
+    ``version`` is bumped on every takeover or release so callers can tell
+    whether the takeover set changed without comparing its contents. It is
+    only meaningful within this instance; :meth:`etag` pairs it with a
+    random per-instance nonce so it is safe to hand to clients.
+    """
 
     def __init__(self) -> None:
         self._takeovers: dict[str, str] = {}  # session_id -> staff_id
+        self._view = MappingProxyType(self._takeovers)
+        self._version = 0
+        self._nonce = uuid.uuid4().hex
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def etag(self) -> str:
+        """Quoted HTTP entity tag for the current takeover set.
+
+        The nonce keeps tags from a restarted process or another instance,
+        whose counters also start at 0, from matching this one's.
+        """
+        return f'"{self._nonce}-{self._version}"'
 
     def takeover(self, session_id: str, staff_id: str) -> dict[str, Any]:
         self._takeovers[session_id] = staff_id
+        self._version += 1
         return {
             "session_id": session_id,
             "staff_id": staff_id,
@@ -148,6 +209,7 @@ class SessionTakeoverManager:
 
     def release(self, session_id: str) -> dict[str, Any]:
         staff_id = self._takeovers.pop(session_id, None)
+        self._version += 1
         return {
             "session_id": session_id,
             "staff_id": staff_id,
@@ -160,5 +222,6 @@ class SessionTakeoverManager:
     def get_controller(self, session_id: str) -> str | None:
         return self._takeovers.get(session_id)
 
-    def list_takeovers(self) -> dict[str, str]:
-        return dict(self._takeovers)
+    def list_takeovers(self) -> Mapping[str, str]:
+        """Return a live, read-only view of session_id -> staff_id."""
+        return self._view
@@ -5,26 +5,41 @@ from __future__ import annotations
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
 
-from municipal.notifications.models import NotificationChannel, NotificationPriority
+from municipal.notifications.models import (
+    Notification,
+    NotificationChannel,
+    NotificationPriority,
+)
 
 router = APIRouter()
 
+# The list endpoint encodes notifications straight to JSON bytes in
+# pydantic-core, without building an intermediate dict per row.
+_NOTIFICATION_LIST_ADAPTER = TypeAdapter(list[Notification])
+_NOTIFICATION_SUMMARY_FIELDS = {
+    "__all__": {"id", "session_id", "channel", "recipient", "subject", "status", "created_at"}
+}
+_SEND_RESULT_FIELDS = {"id", "status", "channel", "recipient", "subject"}
+
 
 class SendNotificationRequest(BaseModel):
     session_id: str
     recipient: str
     subject: str
     body: str
-    channel: str = "email"
-    priority: str = "normal"
+    # Enum-typed so pydantic-core validates them and rejects bad values with
+    # a 422, instead of a Python-level conversion in the handler.
+    channel: NotificationChannel = NotificationChannel.EMAIL
+    priority: NotificationPriority = NotificationPriority.NORMAL
     template_id: str | None = None
     context: dict[str, Any] | None = None
 
 
 @router.post("/api/notifications/send")
-async def send_notification(body: SendNotificationRequest, request: Request) -> dict[str, Any]:
+async def send_notification(body: SendNotificationRequest, request: Request) -> Response:
     """Send a notification."""
     engine = getattr(request.app.state, "notification_engine", None)
     if engine is None:
@@ -43,17 +58,14 @@ async def send_notification(body: SendNotificationRequest, request: Request) ->
             recipient=body.recipient,
             subject=body.subject,
             body=body.body,
-            channel=NotificationChannel(body.channel),
-            priority=NotificationPriority(body.priority),
+            channel=body.channel,
+            priority=body.priority,
         )
 
-    return {
-        "id": notification.id,
-        "status": notification.status,
-        "channel": notification.channel,
-        "recipient": notification.recipient,
-        "subject": notification.subject,
-    }
+    return Response(
+        notification.model_dump_json(include=_SEND_RESULT_FIELDS),
+        media_type="application/json",
+    )
 
 
 @router.get("/api/notifications/{notification_id}")
@@ -73,7 +85,7 @@ async def get_notification(notification_id: str, request: Request) -> dict[str,
 async def list_notifications(
     request: Request,
     session_id: str | None = None,
-) -> list[dict[str, Any]]:
+) -> Response:
     """List notifications for a session."""
     service = getattr(request.app.state, "notification_service", None)
     if service is None:
@@ -84,15 +96,7 @@ async def list_notifications(
     else:
         notifications = service.store.list_all()
 
-    return [
-        {
-            "id": n.id,
-            "session_id": n.session_id,
-            "channel": n.channel,
-            "recipient": n.recipient,
-            "subject": n.subject,
-            "status": n.status,
-            "created_at": n.created_at.isoformat(),
-        }
-        for n in notifications
-    ]
+    return Response(
+        _NOTIFICATION_LIST_ADAPTER.dump_json(notifications, include=_NOTIFICATION_SUMMARY_FIELDS),
+        media_type="application/json",
+    )
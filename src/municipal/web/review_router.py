@@ -2,12 +2,64 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Request, Response
 
+from municipal.review.models import SunshineReportData
+
 router = APIRouter()
 
+# Rendered PDFs are served as-is; Starlette accepts either type without copying.
+PdfBytes = bytes | memoryview
+
+
+class SunshinePdfCache:
+    """Rendered Sunshine Report PDFs keyed by report content.
+
+    Rendering runs in a worker thread, and concurrent requests for the same
+    report share one render. Only the most recent ``max_entries`` PDFs are
+    kept.
+    """
+
+    def __init__(self, max_entries: int = 4) -> None:
+        self._max_entries = max_entries
+        self._pdfs: OrderedDict[str, PdfBytes] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[PdfBytes]] = {}
+
+    @staticmethod
+    def key_for(report: SunshineReportData) -> str:
+        """Content hash of *report*, ignoring when it was generated."""
+        payload = report.model_dump_json(exclude={"generated_at"}).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    async def get_or_render(self, key: str, render: Callable[[], PdfBytes]) -> PdfBytes:
+        """Return the cached PDF for *key*, rendering it once if missing."""
+        pdf = self._pdfs.get(key)
+        if pdf is not None:
+            self._pdfs.move_to_end(key)
+            return pdf
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(asyncio.to_thread(render))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+        # Shield so a disconnecting client does not cancel a render that
+        # other requests may be waiting on.
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task[PdfBytes]) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._pdfs[key] = task.result()
+        while len(self._pdfs) > self._max_entries:
+            self._pdfs.popitem(last=False)
+
 
 @router.post("/api/review/redact/{case_id}")
 async def redact_case(case_id: str, request: Request) -> dict[str, Any]:
@@ -23,18 +75,10 @@ async def redact_case(case_id: str, request: Request) -> dict[str, Any]:
     if case is None:
         raise HTTPException(status_code=404, detail=f"Case {case_id!r} not found")
 
-    # Build field classifications from wizard definition
-    field_classifications: dict[str, str] = {}
-    defn = wizard_engine.wizard_definitions.get(case.wizard_id)
-    if defn:
-        for step in defn.steps:
-            for field in step.fields:
-                field_classifications[field.id] = field.classification.value
-
     report = redaction_engine.scan(
         case_id=case_id,
         data=case.data,
-        field_classifications=field_classifications,
+        field_classifications=wizard_engine.field_classifications(case.wizard_id),
     )
     return report.model_dump(mode="json")
 
@@ -120,9 +164,16 @@ async def get_sunshine_report_pdf(request: Request) -> Response:
         raise HTTPException(status_code=503, detail="Sunshine report generator not available")
 
     report = generator.generate()
-    pdf_bytes = bytes(renderer.render_sunshine_pdf(report))
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={"Content-Disposition": "attachment; filename=sunshine-report.pdf"},
+    cache: SunshinePdfCache = request.app.state.sunshine_pdf_cache
+    etag = f'"{cache.key_for(report)}"'
+    headers = {
+        "ETag": etag,
+        "Content-Disposition": "attachment; filename=sunshine-report.pdf",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    pdf = await cache.get_or_render(
+        etag, lambda: memoryview(renderer.render_sunshine_pdf(report))
     )
+    return Response(content=pdf, media_type="application/pdf", headers=headers)
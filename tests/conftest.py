@@ -2,13 +2,133 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
 
+import pytest
+
+from municipal.auth.models import AuthCredentials
+from municipal.auth.provider import MockAuthProvider
 from municipal.core.types import SessionType
+from municipal.core.yaml_io import HAS_LIBYAML
+from municipal.db.base import Base
+from municipal.db.engine import DatabaseManager
+from municipal.rag.citation import CitedAnswer
 
 
 STAFF_TOKEN = "test-staff-token-for-tests"
 
+# Repository root, resolved once; production configs live under config/.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def pytest_report_header(config) -> str:
+    # Config fixtures round-trip YAML in almost every module; without
+    # libyaml that silently falls back to the much slower pure-Python codec.
+    return "libyaml: " + ("yes" if HAS_LIBYAML else "NO (pure-Python YAML fallback)")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item) -> dict[str, Any]:
+    """Run async tests on uvloop when it is installed (not available on Windows)."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def _session_auth_provider() -> tuple[MockAuthProvider, dict[str, str]]:
+    """One MockAuthProvider per run, with fixture users already logged in."""
+    provider = MockAuthProvider()
+    tokens = {
+        username: provider.authenticate(
+            AuthCredentials(username=username, code=code)
+        ).token
+        for username, code in (("jane.smith", "123456"), ("bob.johnson", "654321"))
+    }
+    return provider, tokens
+
+
+@pytest.fixture
+def auth_provider(
+    _session_auth_provider: tuple[MockAuthProvider, dict[str, str]],
+) -> Iterator[MockAuthProvider]:
+    """The shared MockAuthProvider, with its token table restored after each test."""
+    provider, _ = _session_auth_provider
+    tokens = dict(provider._tokens)
+    yield provider
+    provider._tokens = tokens
+
+
+@pytest.fixture
+def jane_token(
+    auth_provider: MockAuthProvider,
+    _session_auth_provider: tuple[MockAuthProvider, dict[str, str]],
+) -> str:
+    """A pre-issued token for jane.smith (authenticated tier)."""
+    return _session_auth_provider[1]["jane.smith"]
+
+
+@pytest.fixture
+def bob_token(
+    auth_provider: MockAuthProvider,
+    _session_auth_provider: tuple[MockAuthProvider, dict[str, str]],
+) -> str:
+    """A pre-issued token for bob.johnson (verified tier)."""
+    return _session_auth_provider[1]["bob.johnson"]
+
+
+@pytest.fixture(scope="session")
+def _configured_mappers() -> None:
+    """Configure every ORM mapper once per test process.
+
+    SQLAlchemy otherwise does it lazily on the first relationship access
+    or query, charging the whole mapper graph to whichever test gets there
+    first.
+    """
+    from sqlalchemy.orm import configure_mappers
+
+    import municipal.db.models  # noqa: F401  (registers the mapped classes)
+
+    configure_mappers()
+
+
+@pytest.fixture(scope="session")
+async def worker_db(_configured_mappers: None) -> AsyncIterator[DatabaseManager]:
+    """An in-memory SQLite DatabaseManager with the schema created once.
+
+    Session-scoped, so each test process (each xdist worker) builds the
+    schema exactly once. Tests should use ``test_db`` instead.
+    """
+    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
+    async with db.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield db
+    await db.close()
+
+
+@pytest.fixture
+async def test_db(worker_db: DatabaseManager) -> AsyncIterator[DatabaseManager]:
+    """``worker_db`` with every session joined to a per-test transaction.
+
+    Repository commits become savepoints, and the whole transaction is
+    rolled back after the test, so each test starts from empty tables.
+    """
+    async with worker_db.engine.connect() as conn:
+        trans = await conn.begin()
+        yield worker_db.bound_to(conn)
+        if trans.is_active:
+            await trans.rollback()
+
 
 def install_staff_token(app) -> str:
     """Register a staff auth token on the app's auth provider.
@@ -23,3 +143,22 @@ def install_staff_token(app) -> str:
         "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
     }
     return STAFF_TOKEN
+
+
+class StubRAGPipeline:
+    """Minimal stand-in for RAGPipeline.
+
+    ``ask`` returns the given answer, or raises *error* if one is set.
+    Cheaper than a spec'd MagicMock for tests that only need ``ask``.
+    """
+
+    def __init__(
+        self, answer: CitedAnswer | None = None, error: Exception | None = None
+    ) -> None:
+        self._answer = answer
+        self._error = error
+
+    async def ask(self, *args: Any, **kwargs: Any) -> CitedAnswer | None:
+        if self._error is not None:
+            raise self._error
+        return self._answer
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 from fastapi.testclient import TestClient
 
@@ -11,6 +9,7 @@ from municipal.bridge.adapters.service311 import Mock311Adapter, TicketStatus
 from municipal.bridge.models import NormalizedRequest
 from municipal.core.config import Settings
 from municipal.web.app import create_app
+from tests.conftest import StubRAGPipeline
 
 
 class TestMock311Adapter:
@@ -27,6 +26,11 @@ class TestMock311Adapter:
         assert "create_ticket" in ops
         assert "add_note" in ops
 
+    def test_unknown_operation(self) -> None:
+        resp = self.adapter.query(NormalizedRequest(operation="close_everything"))
+        assert not resp.success
+        assert resp.error == "Unknown operation: close_everything"
+
     def test_list_tickets(self) -> None:
         req = NormalizedRequest(operation="list_tickets", params={})
         resp = self.adapter.query(req)
@@ -45,6 +49,33 @@ class TestMock311Adapter:
         assert resp.success
         assert len(resp.data) == 1
 
+    def test_list_tickets_filter_status_and_category(self) -> None:
+        req = NormalizedRequest(
+            operation="list_tickets", params={"status": "open", "category": "water"}
+        )
+        resp = self.adapter.query(req)
+        assert [t["ticket_id"] for t in resp.data] == ["SR-2024-004"]
+
+    def test_list_tickets_filter_unknown_value(self) -> None:
+        req = NormalizedRequest(operation="list_tickets", params={"status": "bogus"})
+        resp = self.adapter.query(req)
+        assert resp.success
+        assert resp.data == []
+
+    def test_created_ticket_is_indexed(self) -> None:
+        self.adapter.query(
+            NormalizedRequest(
+                operation="create_ticket",
+                params={"category": "pothole", "description": "Another one"},
+            )
+        )
+        req = NormalizedRequest(
+            operation="list_tickets", params={"status": "open", "category": "pothole"}
+        )
+        resp = self.adapter.query(req)
+        assert len(resp.data) == 2
+        assert resp.data[0]["ticket_id"] == "SR-2024-001"
+
     def test_get_ticket_found(self) -> None:
         req = NormalizedRequest(operation="get_ticket", params={"ticket_id": "SR-2024-001"})
         resp = self.adapter.query(req)
@@ -96,11 +127,11 @@ class TestMock311Adapter:
         assert not resp.success
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client() -> TestClient:
-    mock_rag = MagicMock()
-    mock_rag.query.return_value = MagicMock(answer="test", sources=[], confidence=0.9)
-    app = create_app(settings=Settings(), rag_pipeline=mock_rag)
+    # Shared: created tickets and notes only add to the mock data, and the
+    # listing checks use lower bounds.
+    app = create_app(settings=Settings(), rag_pipeline=StubRAGPipeline())
     return TestClient(app)
 
 
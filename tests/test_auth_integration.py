@@ -2,20 +2,19 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 from fastapi.testclient import TestClient
 
 from municipal.core.config import Settings
 from municipal.web.app import create_app
+from tests.conftest import StubRAGPipeline
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client() -> TestClient:
-    mock_rag = MagicMock()
-    mock_rag.query.return_value = MagicMock(answer="test", sources=[], confidence=0.9)
-    app = create_app(settings=Settings(), rag_pipeline=mock_rag)
+    # Shared: each test logs in for its own token, so one test's refresh or
+    # logout never touches another's.
+    app = create_app(settings=Settings(), rag_pipeline=StubRAGPipeline())
     return TestClient(app)
 
 
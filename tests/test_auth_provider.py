@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import ValidationError
 
 from municipal.auth.models import AuthCredentials
 from municipal.auth.provider import MockAuthProvider
@@ -10,86 +11,96 @@ from municipal.core.types import SessionType
 
 
 class TestMockAuthProvider:
-    def setup_method(self) -> None:
-        self.provider = MockAuthProvider()
+    def test_fixtures_loaded(self, auth_provider: MockAuthProvider) -> None:
+        assert "jane.smith" in auth_provider.users
+        assert "bob.johnson" in auth_provider.users
 
-    def test_fixtures_loaded(self) -> None:
-        assert "jane.smith" in self.provider.users
-        assert "bob.johnson" in self.provider.users
-
-    def test_authenticate_success(self) -> None:
-        result = self.provider.authenticate(
+    def test_authenticate_success(self, auth_provider: MockAuthProvider) -> None:
+        authed = auth_provider.authenticate(
             AuthCredentials(username="jane.smith", code="123456")
         )
-        assert result.success
-        assert result.token is not None
-        assert result.tier == SessionType.AUTHENTICATED
-        assert result.user_id == "jane.smith"
-        assert result.display_name == "Jane Smith"
-
-    def test_authenticate_wrong_code(self) -> None:
-        result = self.provider.authenticate(
+        assert authed.success
+        assert authed.token is not None
+        assert authed.tier == SessionType.AUTHENTICATED
+        assert authed.user_id == "jane.smith"
+        assert authed.display_name == "Jane Smith"
+
+    def test_authenticate_wrong_code(self, auth_provider: MockAuthProvider) -> None:
+        result = auth_provider.authenticate(
             AuthCredentials(username="jane.smith", code="wrong")
         )
         assert not result.success
         assert "Invalid" in result.error
 
-    def test_authenticate_empty_code(self) -> None:
-        result = self.provider.authenticate(
+    def test_authenticate_empty_code(self, auth_provider: MockAuthProvider) -> None:
+        result = auth_provider.authenticate(
             AuthCredentials(username="jane.smith", code="")
         )
         assert not result.success
 
-    def test_authenticate_unknown_user(self) -> None:
-        result = self.provider.authenticate(
+    def test_authenticate_unknown_user(self, auth_provider: MockAuthProvider) -> None:
+        result = auth_provider.authenticate(
             AuthCredentials(username="nobody", code="123")
         )
         assert not result.success
         assert "not found" in result.error
 
-    def test_validate_token(self) -> None:
-        auth = self.provider.authenticate(
-            AuthCredentials(username="jane.smith", code="123456")
-        )
-        validation = self.provider.validate_token(auth.token)
+    def test_validate_token(self, auth_provider: MockAuthProvider, jane_token: str) -> None:
+        validation = auth_provider.validate_token(jane_token)
         assert validation.valid
         assert validation.user_id == "jane.smith"
         assert validation.tier == SessionType.AUTHENTICATED
 
-    def test_validate_invalid_token(self) -> None:
-        validation = self.provider.validate_token("bad-token")
+    def test_validate_token_reuses_result(
+        self, auth_provider: MockAuthProvider, jane_token: str
+    ) -> None:
+        assert auth_provider.validate_token(jane_token) is auth_provider.validate_token(jane_token)
+
+    def test_shared_validation_is_immutable(
+        self, auth_provider: MockAuthProvider, jane_token: str
+    ) -> None:
+        validation = auth_provider.validate_token(jane_token)
+        with pytest.raises(ValidationError):
+            validation.tier = SessionType.ANONYMOUS
+        assert auth_provider.validate_token(jane_token).tier == SessionType.AUTHENTICATED
+
+    def test_validate_token_after_refresh(
+        self, auth_provider: MockAuthProvider, jane_token: str
+    ) -> None:
+        old = auth_provider.validate_token(jane_token)
+        refreshed = auth_provider.refresh_token(jane_token)
+        new = auth_provider.validate_token(refreshed.token)
+        assert new.valid
+        assert new is not old
+        assert new.expires_at >= old.expires_at
+
+    def test_validate_invalid_token(self, auth_provider: MockAuthProvider) -> None:
+        validation = auth_provider.validate_token("bad-token")
         assert not validation.valid
 
-    def test_refresh_token(self) -> None:
-        auth = self.provider.authenticate(
-            AuthCredentials(username="bob.johnson", code="654321")
-        )
-        old_token = auth.token
-        refreshed = self.provider.refresh_token(old_token)
+    def test_refresh_token(self, auth_provider: MockAuthProvider, bob_token: str) -> None:
+        refreshed = auth_provider.refresh_token(bob_token)
         assert refreshed.success
-        assert refreshed.token != old_token
+        assert refreshed.token != bob_token
 
         # Old token should be invalid
-        assert not self.provider.validate_token(old_token).valid
+        assert not auth_provider.validate_token(bob_token).valid
         # New token should be valid
-        assert self.provider.validate_token(refreshed.token).valid
+        assert auth_provider.validate_token(refreshed.token).valid
 
-    def test_refresh_invalid_token(self) -> None:
-        result = self.provider.refresh_token("bad-token")
+    def test_refresh_invalid_token(self, auth_provider: MockAuthProvider) -> None:
+        result = auth_provider.refresh_token("bad-token")
         assert not result.success
 
-    def test_revoke_token(self) -> None:
-        auth = self.provider.authenticate(
-            AuthCredentials(username="jane.smith", code="123456")
-        )
-        assert self.provider.revoke_token(auth.token)
-        assert not self.provider.validate_token(auth.token).valid
+    def test_revoke_token(self, auth_provider: MockAuthProvider, jane_token: str) -> None:
+        assert auth_provider.revoke_token(jane_token)
+        assert not auth_provider.validate_token(jane_token).valid
 
-    def test_revoke_nonexistent_token(self) -> None:
-        assert not self.provider.revoke_token("nope")
+    def test_revoke_nonexistent_token(self, auth_provider: MockAuthProvider) -> None:
+        assert not auth_provider.revoke_token("nope")
 
-    def test_verified_tier_user(self) -> None:
-        result = self.provider.authenticate(
+    def test_verified_tier_user(self, auth_provider: MockAuthProvider) -> None:
+        result = auth_provider.authenticate(
             AuthCredentials(username="bob.johnson", code="654321")
         )
         assert result.success
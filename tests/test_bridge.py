@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from municipal.bridge.base import BaseBridgeAdapter
@@ -16,56 +18,77 @@ from municipal.bridge.registry import AdapterRegistry
 from municipal.bridge.adapters.permit_status import MockPermitStatusAdapter
 
 
-class TestMockPermitStatusAdapter:
-    def setup_method(self) -> None:
-        self.adapter = MockPermitStatusAdapter()
+@pytest.fixture(scope="module")
+def _shared_permit_adapter() -> MockPermitStatusAdapter:
+    return MockPermitStatusAdapter()
+
 
-    def test_name(self) -> None:
-        assert self.adapter.name == "permit_status"
+@pytest.fixture
+def adapter(_shared_permit_adapter: MockPermitStatusAdapter) -> MockPermitStatusAdapter:
+    # The fixture permits are read-only; only the session cache is mutated,
+    # so wipe it between tests instead of rebuilding the adapter.
+    _shared_permit_adapter.clear_cache()
+    return _shared_permit_adapter
+
+
+class TestMockPermitStatusAdapter:
+    def test_name(self, adapter: MockPermitStatusAdapter) -> None:
+        assert adapter.name == "permit_status"
 
-    def test_schema(self) -> None:
-        schema = self.adapter.schema
+    def test_schema(self, adapter: MockPermitStatusAdapter) -> None:
+        schema = adapter.schema
         assert schema.name == "permit_status"
         assert schema.classification == "sensitive"
         assert Operation.LOOKUP_BY_ID in schema.operations
 
-    def test_health_check(self) -> None:
-        assert self.adapter.health_check() == ConnectionStatus.CONNECTED
+    def test_health_check(self, adapter: MockPermitStatusAdapter) -> None:
+        assert adapter.health_check() == ConnectionStatus.CONNECTED
 
-    def test_lookup_by_id_found(self) -> None:
+    def test_lookup_by_id_found(self, adapter: MockPermitStatusAdapter) -> None:
         req = NormalizedRequest(operation="lookup_by_id", params={"permit_id": "BP-2024-001"})
-        resp = self.adapter.query(req)
+        resp = adapter.query(req)
         assert resp.success
         assert resp.data["permit_id"] == "BP-2024-001"
         assert resp.data["applicant"] == "Jane Smith"
 
-    def test_lookup_by_id_not_found(self) -> None:
+    def test_lookup_by_id_not_found(self, adapter: MockPermitStatusAdapter) -> None:
         req = NormalizedRequest(operation="lookup_by_id", params={"permit_id": "NONEXISTENT"})
-        resp = self.adapter.query(req)
+        resp = adapter.query(req)
         assert not resp.success
         assert "not found" in resp.error.lower()
 
-    def test_lookup_by_parcel(self) -> None:
+    def test_lookup_by_parcel(self, adapter: MockPermitStatusAdapter) -> None:
         req = NormalizedRequest(
             operation="lookup_by_parcel",
             params={"parcel_id": "12-34-100-001"},
         )
-        resp = self.adapter.query(req)
+        resp = adapter.query(req)
         assert resp.success
         assert len(resp.data) == 2  # Jane Smith has 2 permits on this parcel
 
-    def test_lookup_by_applicant(self) -> None:
+    def test_lookup_by_applicant(self, adapter: MockPermitStatusAdapter) -> None:
         req = NormalizedRequest(
             operation="lookup_by_applicant",
             params={"applicant": "jane"},
         )
-        resp = self.adapter.query(req)
+        resp = adapter.query(req)
         assert resp.success
         assert len(resp.data) == 2
 
-    def test_unknown_operation(self) -> None:
+    def test_lookup_by_parcel_unknown(self, adapter: MockPermitStatusAdapter) -> None:
+        req = NormalizedRequest(operation="lookup_by_parcel", params={"parcel_id": "none"})
+        resp = adapter.query(req)
+        assert resp.success
+        assert resp.data == []
+
+    def test_lookup_by_applicant_substring(self, adapter: MockPermitStatusAdapter) -> None:
+        req = NormalizedRequest(operation="lookup_by_applicant", params={"applicant": "CORP"})
+        resp = adapter.query(req)
+        assert [p["permit_id"] for p in resp.data] == ["BP-2024-002", "PP-2024-007"]
+
+    def test_unknown_operation(self, adapter: MockPermitStatusAdapter) -> None:
         req = NormalizedRequest(operation="nonexistent", params={})
-        resp = self.adapter.query(req)
+        resp = adapter.query(req)
         assert not resp.success
         assert "Unknown operation" in resp.error
 
@@ -77,30 +100,30 @@ class TestMockPermitStatusAdapter:
         assert not resp.success
         assert "disabled" in resp.error
 
-    def test_session_cache(self) -> None:
+    def test_session_cache(self, adapter: MockPermitStatusAdapter) -> None:
         req = NormalizedRequest(
             operation="lookup_by_id",
             params={"permit_id": "BP-2024-001"},
             session_id="sess-1",
         )
-        resp1 = self.adapter.query(req)
+        resp1 = adapter.query(req)
         assert resp1.success
         assert not resp1.cached
 
-        resp2 = self.adapter.query(req)
+        resp2 = adapter.query(req)
         assert resp2.success
         assert resp2.cached
 
-    def test_clear_cache(self) -> None:
+    def test_clear_cache(self, adapter: MockPermitStatusAdapter) -> None:
         req = NormalizedRequest(
             operation="lookup_by_id",
             params={"permit_id": "BP-2024-001"},
             session_id="sess-1",
         )
-        self.adapter.query(req)
-        self.adapter.clear_cache("sess-1")
+        adapter.query(req)
+        adapter.clear_cache("sess-1")
 
-        resp = self.adapter.query(req)
+        resp = adapter.query(req)
         assert not resp.cached
 
 
@@ -127,6 +150,30 @@ class TestAdapterRegistry:
         health = self.registry.health_check_all()
         assert health["permit_status"] == ConnectionStatus.CONNECTED
 
+    async def test_health_check_all_async(self) -> None:
+        self.registry.register(MockPermitStatusAdapter())
+        health = await self.registry.health_check_all_async()
+        assert health == {"permit_status": ConnectionStatus.CONNECTED}
+
+    async def test_health_check_all_async_reports_failures(self) -> None:
+        adapter = MockPermitStatusAdapter()
+        adapter.health_check = MagicMock(side_effect=RuntimeError("boom"))
+        self.registry.register(adapter)
+        health = await self.registry.health_check_all_async()
+        assert health["permit_status"] == ConnectionStatus.DISCONNECTED
+
+    def test_cached_health_check_all(self) -> None:
+        adapter = MockPermitStatusAdapter()
+        adapter.health_check = MagicMock(return_value=ConnectionStatus.CONNECTED)
+        self.registry.register(adapter)
+        assert self.registry.cached_health_check_all() == {
+            "permit_status": ConnectionStatus.CONNECTED
+        }
+        self.registry.cached_health_check_all()
+        assert adapter.health_check.call_count == 1
+        self.registry.cached_health_check_all(ttl=0)
+        assert adapter.health_check.call_count == 2
+
     def test_adapter_names(self) -> None:
         self.registry.register(MockPermitStatusAdapter())
         assert "permit_status" in self.registry.adapter_names
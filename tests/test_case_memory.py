@@ -46,20 +46,42 @@ steps:
 """
 
 
-@pytest.fixture
-def engine_with_graph(tmp_path: Path) -> tuple[WizardEngine, GraphStore]:
-    """Create a WizardEngine with GraphStore using a temp wizard file."""
-    wizard_file = tmp_path / "test_graph_wizard.yml"
-    wizard_file.write_text(_WIZARD_YAML)
+@pytest.fixture(scope="module")
+def wizard_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the constant wizard YAML once for the whole module."""
+    d = tmp_path_factory.mktemp("wiz")
+    (d / "test_graph_wizard.yml").write_text(_WIZARD_YAML)
+    return d
+
+
+@pytest.fixture(scope="module")
+def validation_engine() -> ValidationEngine:
+    return ValidationEngine()
 
+
+@pytest.fixture(scope="module")
+def _shared_engine(
+    wizard_dir: Path, validation_engine: ValidationEngine
+) -> tuple[WizardEngine, IntakeStore, GraphStore]:
     store = IntakeStore()
     graph = GraphStore()
     engine = WizardEngine(
         store=store,
-        validation_engine=ValidationEngine(),
+        validation_engine=validation_engine,
         graph_store=graph,
-        wizards_dir=tmp_path,
+        wizards_dir=wizard_dir,
     )
+    return engine, store, graph
+
+
+@pytest.fixture
+def engine_with_graph(
+    _shared_engine: tuple[WizardEngine, IntakeStore, GraphStore],
+) -> tuple[WizardEngine, GraphStore]:
+    """Return the module's WizardEngine with its stores emptied."""
+    engine, store, graph = _shared_engine
+    store.clear()
+    graph.clear()
     return engine, graph
 
 
@@ -96,12 +118,14 @@ class TestCaseMemoryLinking:
         assert parcel_node.entity_type == EntityType.PARCEL
 
         # Verify SUBMITTED edge
-        neighbors = graph.get_neighbors("person:session-1", RelationshipType.SUBMITTED)
-        assert any(n.id == f"case:{case.id}" for n in neighbors)
+        assert graph.has_edge(
+            "person:session-1", RelationshipType.SUBMITTED, f"case:{case.id}"
+        )
 
         # Verify LOCATED_AT edge
-        neighbors = graph.get_neighbors(f"case:{case.id}", RelationshipType.LOCATED_AT)
-        assert any(n.id == "parcel:P-001" for n in neighbors)
+        assert graph.has_edge(
+            f"case:{case.id}", RelationshipType.LOCATED_AT, "parcel:P-001"
+        )
 
     def test_case_without_parcel_skips_parcel_node(
         self, engine_with_graph: tuple[WizardEngine, GraphStore]
@@ -125,17 +149,14 @@ class TestCaseMemoryLinking:
     ) -> None:
         engine, graph = engine_with_graph
 
-        # First case
-        s1 = engine.start_wizard("test_graph_wizard", "session-3")
-        engine.submit_step(s1.id, "step_one", {"applicant_name": "Alice"})
-        engine.submit_step(s1.id, "step_two", {"description": "Case 1"})
-        case1 = engine.submit_wizard(s1.id, "session-3")
+        def _run(session_id: str, description: str):
+            state = engine.start_wizard("test_graph_wizard", session_id)
+            engine.submit_step(state.id, "step_one", {"applicant_name": "Alice"})
+            engine.submit_step(state.id, "step_two", {"description": description})
+            return engine.submit_wizard(state.id, session_id)
 
-        # Second case
-        s2 = engine.start_wizard("test_graph_wizard", "session-3")
-        engine.submit_step(s2.id, "step_one", {"applicant_name": "Alice"})
-        engine.submit_step(s2.id, "step_two", {"description": "Case 2"})
-        case2 = engine.submit_wizard(s2.id, "session-3")
+        case1 = _run("session-3", "Case 1")
+        case2 = _run("session-3", "Case 2")
 
         # Person node should exist once
         person_nodes = graph.query(entity_type=EntityType.PERSON)
@@ -143,20 +164,19 @@ class TestCaseMemoryLinking:
         assert len(session3_persons) == 1
 
         # Both cases linked
-        neighbors = graph.get_neighbors("person:session-3", RelationshipType.SUBMITTED)
-        case_ids = {n.id for n in neighbors}
-        assert f"case:{case1.id}" in case_ids
-        assert f"case:{case2.id}" in case_ids
+        for case in (case1, case2):
+            assert graph.has_edge(
+                "person:session-3", RelationshipType.SUBMITTED, f"case:{case.id}"
+            )
 
-    def test_engine_without_graph_works(self, tmp_path: Path) -> None:
+    def test_engine_without_graph_works(
+        self, wizard_dir: Path, validation_engine: ValidationEngine
+    ) -> None:
         """WizardEngine without graph_store still works fine."""
-        wizard_file = tmp_path / "test_graph_wizard.yml"
-        wizard_file.write_text(_WIZARD_YAML)
-
         engine = WizardEngine(
             store=IntakeStore(),
-            validation_engine=ValidationEngine(),
-            wizards_dir=tmp_path,
+            validation_engine=validation_engine,
+            wizards_dir=wizard_dir,
         )
         state = engine.start_wizard("test_graph_wizard", "session-x")
         engine.submit_step(state.id, "step_one", {"applicant_name": "Test"})
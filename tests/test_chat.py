@@ -8,7 +8,6 @@ from __future__ import annotations
 
 import asyncio
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -19,8 +18,37 @@ from municipal.core.config import Settings
 from municipal.core.types import DataClassification, SessionType
 from municipal.governance.audit import AuditLogger
 from municipal.rag.citation import Citation, CitedAnswer
-from municipal.rag.pipeline import RAGPipeline
 from municipal.web.app import create_app
+from tests.conftest import StubRAGPipeline
+
+
+# Canned RAG answers. ChatService only reads them, so one instance of each
+# serves every test. The values are known-good constants, so skip validation.
+_GOOD_ANSWER = CitedAnswer.model_construct(
+    answer="The recycling pickup is on Tuesdays.",
+    citations=[
+        Citation.model_construct(
+            source="waste-management.pdf",
+            section="Schedule",
+            quote="Recycling collection occurs every Tuesday.",
+            relevance_score=0.92,
+        )
+    ],
+    confidence=0.88,
+    sources_used=1,
+    low_confidence=False,
+)
+
+_LOW_CONF_ANSWER = CitedAnswer.model_construct(
+    answer="I think maybe it is on Wednesdays.",
+    citations=[],
+    confidence=0.3,
+    sources_used=0,
+    low_confidence=True,
+)
+
+# Strings the served chat page must contain.
+_UI_MARKERS = ("MuniciPal", "Digital Librarian", "Disclaimer")
 
 
 # =========================================================================
@@ -33,35 +61,21 @@ def session_manager():
     return SessionManager()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_rag_pipeline():
-    """Create a mock RAGPipeline with a working ask() method."""
-    pipeline = MagicMock(spec=RAGPipeline)
-    pipeline.ask = AsyncMock(
-        return_value=CitedAnswer(
-            answer="The recycling pickup is on Tuesdays.",
-            citations=[
-                Citation(
-                    source="waste-management.pdf",
-                    section="Schedule",
-                    quote="Recycling collection occurs every Tuesday.",
-                    relevance_score=0.92,
-                )
-            ],
-            confidence=0.88,
-            sources_used=1,
-            low_confidence=False,
-        )
-    )
-    return pipeline
+    """Create a stub RAGPipeline with a working ask() method."""
+    return StubRAGPipeline(_GOOD_ANSWER)
 
 
-@pytest.fixture
-def mock_audit_logger(tmp_path):
-    """Create an AuditLogger writing to a temp directory."""
+@pytest.fixture(scope="module")
+def mock_audit_logger():
+    """Create an in-memory AuditLogger.
+
+    Shared across the module; tests query it by their own session IDs.
+    """
     from municipal.core.config import AuditConfig
 
-    config = AuditConfig(log_dir=str(tmp_path / "audit"))
+    config = AuditConfig(backend="memory")
     return AuditLogger(config=config)
 
 
@@ -74,9 +88,9 @@ def chat_service(mock_rag_pipeline, session_manager, mock_audit_logger):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app(mock_rag_pipeline, mock_audit_logger):
-    """Create a FastAPI app with mocked dependencies."""
+    """Create a FastAPI app with mocked dependencies, once per module."""
     return create_app(
         settings=Settings(),
         rag_pipeline=mock_rag_pipeline,
@@ -84,11 +98,29 @@ def app(mock_rag_pipeline, mock_audit_logger):
     )
 
 
-@pytest.fixture
-def client(app):
+@pytest.fixture(scope="module")
+def _module_client(app):
     return TestClient(app)
 
 
+@pytest.fixture
+def client(app, _module_client):
+    # The app is shared, so start each test with no sessions.
+    app.state.session_manager.clear()
+    return _module_client
+
+
+@pytest.fixture
+def session_factory(app, client):
+    """Create sessions straight on the app's SessionManager, skipping HTTP."""
+
+    def _create(n: int = 1, session_type: SessionType = SessionType.ANONYMOUS) -> list[str]:
+        manager = app.state.session_manager
+        return [manager.create_session(session_type).session_id for _ in range(n)]
+
+    return _create
+
+
 # =========================================================================
 # Session Management Tests
 # =========================================================================
@@ -154,6 +186,42 @@ class TestSessionManager:
         # s1 should be first (most recently active)
         assert sessions[0].session_id == s1.session_id
 
+    def test_list_active_sessions_newest_first(self, session_manager):
+        s1 = session_manager.create_session()
+        s2 = session_manager.create_session()
+        s3 = session_manager.create_session()
+        session_manager.add_message(
+            s2.session_id, ChatMessage(role=MessageRole.USER, content="hi")
+        )
+
+        ids = [s.session_id for s in session_manager.list_active_sessions()]
+        assert ids == [s2.session_id, s3.session_id, s1.session_id]
+
+    def test_count_active(self, session_manager):
+        assert session_manager.count_active() == 0
+        session_manager.create_session()
+        session_manager.create_session()
+        assert session_manager.count_active() == 2
+
+    def test_clear(self, session_manager):
+        session = session_manager.create_session()
+        session_manager.clear()
+        assert session_manager.count_active() == 0
+        assert session_manager.get_session(session.session_id) is None
+
+    def test_list_active_snapshot(self, session_manager):
+        s1 = session_manager.create_session()
+        s2 = session_manager.create_session(SessionType.VERIFIED)
+        session_manager.add_message(
+            s1.session_id, ChatMessage(role=MessageRole.USER, content="hi")
+        )
+
+        ids, types, created, last_active, counts = session_manager.list_active_snapshot()
+        assert ids == [s1.session_id, s2.session_id]
+        assert types == [SessionType.ANONYMOUS, SessionType.VERIFIED]
+        assert created == [s1.created_at, s2.created_at]
+        assert counts == [1, 0]
+
 
 # =========================================================================
 # ChatService Tests
@@ -161,7 +229,6 @@ class TestSessionManager:
 
 
 class TestChatService:
-    @pytest.mark.asyncio
     async def test_respond_success(self, chat_service, session_manager):
         session = session_manager.create_session()
 
@@ -177,7 +244,6 @@ class TestChatService:
         assert response.citations is not None
         assert len(response.citations) == 1
 
-    @pytest.mark.asyncio
     async def test_respond_records_user_message(self, chat_service, session_manager):
         session = session_manager.create_session()
 
@@ -193,21 +259,11 @@ class TestChatService:
         assert updated.messages[0].content == "Test question"
         assert updated.messages[1].role == MessageRole.ASSISTANT
 
-    @pytest.mark.asyncio
     async def test_respond_low_confidence_kill_switch(
         self, session_manager, mock_audit_logger
     ):
         """When confidence is low, the kill-switch message is appended."""
-        low_conf_pipeline = MagicMock(spec=RAGPipeline)
-        low_conf_pipeline.ask = AsyncMock(
-            return_value=CitedAnswer(
-                answer="I think maybe it is on Wednesdays.",
-                citations=[],
-                confidence=0.3,
-                sources_used=0,
-                low_confidence=True,
-            )
-        )
+        low_conf_pipeline = StubRAGPipeline(_LOW_CONF_ANSWER)
 
         service = ChatService(
             rag_pipeline=low_conf_pipeline,
@@ -224,7 +280,6 @@ class TestChatService:
         assert response.low_confidence is True
         assert "contact city staff" in response.content.lower()
 
-    @pytest.mark.asyncio
     async def test_respond_nonexistent_session(self, chat_service):
         with pytest.raises(KeyError, match="not found"):
             await chat_service.respond(
@@ -232,13 +287,11 @@ class TestChatService:
                 user_message="Hello",
             )
 
-    @pytest.mark.asyncio
     async def test_respond_rag_error_handled(
         self, session_manager, mock_audit_logger
     ):
         """RAG pipeline errors are caught and a friendly message is returned."""
-        error_pipeline = MagicMock(spec=RAGPipeline)
-        error_pipeline.ask = AsyncMock(side_effect=RuntimeError("LLM is down"))
+        error_pipeline = StubRAGPipeline(error=RuntimeError("LLM is down"))
 
         service = ChatService(
             rag_pipeline=error_pipeline,
@@ -256,7 +309,6 @@ class TestChatService:
         assert "error" in response.content.lower()
         assert response.low_confidence is True
 
-    @pytest.mark.asyncio
     async def test_respond_logs_audit_event(
         self, chat_service, session_manager, mock_audit_logger
     ):
@@ -303,14 +355,9 @@ class TestAPIEndpoints:
         )
         assert response.status_code == 400
 
-    def test_get_session(self, client):
-        # Create a session first
-        create_resp = client.post(
-            "/api/sessions", json={"session_type": "anonymous"}
-        )
-        session_id = create_resp.json()["session_id"]
+    def test_get_session(self, client, session_factory):
+        [session_id] = session_factory()
 
-        # Retrieve it
         response = client.get(f"/api/sessions/{session_id}")
         assert response.status_code == 200
         data = response.json()
@@ -321,22 +368,16 @@ class TestAPIEndpoints:
         response = client.get("/api/sessions/nonexistent")
         assert response.status_code == 404
 
-    def test_list_sessions(self, client):
-        # Create two sessions
-        client.post("/api/sessions", json={"session_type": "anonymous"})
-        client.post("/api/sessions", json={"session_type": "anonymous"})
+    def test_list_sessions(self, client, session_factory):
+        session_factory(n=2)
 
         response = client.get("/api/sessions")
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
 
-    def test_chat_endpoint(self, client):
-        # Create session
-        create_resp = client.post(
-            "/api/sessions", json={"session_type": "anonymous"}
-        )
-        session_id = create_resp.json()["session_id"]
+    def test_chat_endpoint(self, app, client, session_factory):
+        [session_id] = session_factory()
 
         # Send chat message
         response = client.post(
@@ -351,6 +392,12 @@ class TestAPIEndpoints:
         assert "low_confidence" in data
         assert isinstance(data["citations"], list)
 
+        # The exchange is recorded on the session
+        roles = [
+            m.role for m in app.state.session_manager.get_session(session_id).messages
+        ]
+        assert roles == [MessageRole.USER, MessageRole.ASSISTANT]
+
     def test_chat_endpoint_session_not_found(self, client):
         response = client.post(
             "/api/chat",
@@ -362,20 +409,16 @@ class TestAPIEndpoints:
         response = client.get("/")
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
-        assert "MuniciPal" in response.text
-        assert "Digital Librarian" in response.text
-        assert "Disclaimer" in response.text
-
-    def test_chat_preserves_history(self, client):
-        """After chatting, session history reflects the exchange."""
-        create_resp = client.post(
-            "/api/sessions", json={"session_type": "anonymous"}
-        )
-        session_id = create_resp.json()["session_id"]
-
-        client.post(
-            "/api/chat",
-            json={"session_id": session_id, "message": "Hello"},
+        body = response.text
+        assert [m for m in _UI_MARKERS if m not in body] == []
+
+    def test_get_session_returns_history(self, app, client, session_factory):
+        """Session history is returned in order, with both sides of the exchange."""
+        [session_id] = session_factory()
+        manager = app.state.session_manager
+        manager.add_message(session_id, ChatMessage(role=MessageRole.USER, content="Hello"))
+        manager.add_message(
+            session_id, ChatMessage(role=MessageRole.ASSISTANT, content="Hi there")
         )
 
         session_resp = client.get(f"/api/sessions/{session_id}")
@@ -6,77 +6,77 @@ import textwrap
 from pathlib import Path
 
 import pytest
-import yaml
 
 from municipal.classification.rules import ClassificationEngine
 from municipal.core.types import DataClassification
-
-
-@pytest.fixture()
-def config_path(tmp_path: Path) -> Path:
-    """Write a minimal classification config and return its path."""
-    config = {
-        "rules": [
-            {
-                "name": "legal_correspondence",
-                "description": "Legal communications",
-                "resource_types": ["legal_correspondence", "legal_memo"],
-                "classification": "restricted",
-            },
-            {
-                "name": "resident_pii",
-                "description": "Resident PII",
-                "resource_types": ["resident_pii", "contact_info"],
-                "classification": "sensitive",
-            },
-            {
-                "name": "staff_sops",
-                "description": "Staff SOPs",
-                "resource_types": ["staff_sop", "internal_procedure"],
-                "classification": "internal",
-            },
-            {
-                "name": "published_ordinances",
-                "description": "Published ordinances",
-                "resource_types": ["ordinance", "resolution"],
-                "classification": "public",
-            },
-        ],
-        "default_classification": "sensitive",
-        "context_overrides": [
-            {"condition": "uncertain", "escalate_to": "sensitive"},
-            {"condition": "external_source", "minimum": "internal"},
-        ],
-    }
-    path = tmp_path / "classification.yml"
-    path.write_text(yaml.dump(config))
-    return path
-
-
-@pytest.fixture()
-def engine(config_path: Path) -> ClassificationEngine:
-    """Create a ClassificationEngine from the test config."""
-    return ClassificationEngine(config_path=config_path)
+from municipal.core.yaml_io import safe_dump
+from tests.conftest import PROJECT_ROOT
+
+_PROD_CONFIG_PATH = PROJECT_ROOT / "config" / "data_classification.yml"
+
+_TEST_CONFIG = {
+    "rules": [
+        {
+            "name": "legal_correspondence",
+            "description": "Legal communications",
+            "resource_types": ["legal_correspondence", "legal_memo"],
+            "classification": "restricted",
+        },
+        {
+            "name": "resident_pii",
+            "description": "Resident PII",
+            "resource_types": ["resident_pii", "contact_info"],
+            "classification": "sensitive",
+        },
+        {
+            "name": "staff_sops",
+            "description": "Staff SOPs",
+            "resource_types": ["staff_sop", "internal_procedure"],
+            "classification": "internal",
+        },
+        {
+            "name": "published_ordinances",
+            "description": "Published ordinances",
+            "resource_types": ["ordinance", "resolution"],
+            "classification": "public",
+        },
+    ],
+    "default_classification": "sensitive",
+    "context_overrides": [
+        {"condition": "uncertain", "escalate_to": "sensitive"},
+        {"condition": "external_source", "minimum": "internal"},
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def engine() -> ClassificationEngine:
+    """Create a ClassificationEngine from the test config.
+
+    Shared by the module: the tests only call read-only lookups.
+    """
+    return ClassificationEngine.from_dict(_TEST_CONFIG)
 
 
 class TestClassificationEngine:
     """Tests for ClassificationEngine."""
 
-    def test_classify_resident_pii_as_sensitive(self, engine: ClassificationEngine) -> None:
-        result = engine.classify("resident_pii")
-        assert result == DataClassification.SENSITIVE
-
-    def test_classify_ordinance_as_public(self, engine: ClassificationEngine) -> None:
-        result = engine.classify("ordinance")
-        assert result == DataClassification.PUBLIC
-
-    def test_classify_legal_correspondence_as_restricted(self, engine: ClassificationEngine) -> None:
-        result = engine.classify("legal_correspondence")
-        assert result == DataClassification.RESTRICTED
-
-    def test_classify_staff_sop_as_internal(self, engine: ClassificationEngine) -> None:
-        result = engine.classify("staff_sop")
-        assert result == DataClassification.INTERNAL
+    @pytest.mark.parametrize(
+        "resource_type,expected",
+        [
+            ("resident_pii", DataClassification.SENSITIVE),
+            ("ordinance", DataClassification.PUBLIC),
+            ("legal_correspondence", DataClassification.RESTRICTED),
+            ("staff_sop", DataClassification.INTERNAL),
+        ],
+    )
+    def test_classify(
+        self,
+        engine: ClassificationEngine,
+        resource_type: str,
+        expected: DataClassification,
+    ) -> None:
+        assert engine.classify(resource_type) == expected
 
     def test_unknown_resource_uses_default(self, engine: ClassificationEngine) -> None:
         result = engine.classify("unknown_resource_type")
@@ -102,6 +102,26 @@ class TestClassificationEngine:
         result = engine.classify("contact_info")
         assert result == DataClassification.SENSITIVE
 
+    def test_first_match_wins_on_overlapping_rules(self) -> None:
+        config = {
+            "rules": [
+                {"name": "first", "resource_types": ["memo"], "classification": "restricted"},
+                {"name": "second", "resource_types": ["memo"], "classification": "public"},
+            ],
+        }
+        engine = ClassificationEngine.from_dict(config)
+        assert engine.classify("memo") == DataClassification.RESTRICTED
+        assert engine.get_rule("memo").name == "first"
+
+    def test_yaml_file_matches_from_dict(self, tmp_path: Path) -> None:
+        path = tmp_path / "classification.yml"
+        path.write_text(safe_dump(_TEST_CONFIG))
+        from_file = ClassificationEngine(config_path=path)
+        from_dict = ClassificationEngine.from_dict(_TEST_CONFIG)
+        assert [r.name for r in from_file.rules] == [r.name for r in from_dict.rules]
+        for resource_type in ("legal_memo", "contact_info", "staff_sop", "ordinance", "unknown"):
+            assert from_file.classify(resource_type) == from_dict.classify(resource_type)
+
     def test_get_rule_returns_matching_rule(self, engine: ClassificationEngine) -> None:
         rule = engine.get_rule("staff_sop")
         assert rule is not None
@@ -123,19 +143,30 @@ class TestClassificationEngine:
 class TestProductionConfig:
     """Test that the production YAML config loads correctly."""
 
-    def test_production_config_loads(self) -> None:
-        """Verify the actual config/data_classification.yml is valid."""
-        config_path = (
-            Path(__file__).resolve().parents[1] / "config" / "data_classification.yml"
-        )
-        if not config_path.exists():
+    @pytest.fixture(scope="class")
+    @classmethod
+    def prod_engine(cls) -> ClassificationEngine:
+        if not _PROD_CONFIG_PATH.exists():
             pytest.skip("Production config not found")
+        return ClassificationEngine(config_path=_PROD_CONFIG_PATH)
 
-        engine = ClassificationEngine(config_path=config_path)
-        assert len(engine.rules) > 0
-
-        # Spot-check a few known classifications
-        assert engine.classify("resident_pii") == DataClassification.SENSITIVE
-        assert engine.classify("ordinance") == DataClassification.PUBLIC
-        assert engine.classify("legal_correspondence") == DataClassification.RESTRICTED
-        assert engine.classify("staff_sop") == DataClassification.INTERNAL
+    def test_production_config_loads(self, prod_engine: ClassificationEngine) -> None:
+        """Verify the actual config/data_classification.yml is valid."""
+        assert len(prod_engine.rules) > 0
+
+    @pytest.mark.parametrize(
+        "resource_type,expected",
+        [
+            ("resident_pii", DataClassification.SENSITIVE),
+            ("ordinance", DataClassification.PUBLIC),
+            ("legal_correspondence", DataClassification.RESTRICTED),
+            ("staff_sop", DataClassification.INTERNAL),
+        ],
+    )
+    def test_production_spot_checks(
+        self,
+        prod_engine: ClassificationEngine,
+        resource_type: str,
+        expected: DataClassification,
+    ) -> None:
+        assert prod_engine.classify(resource_type) == expected
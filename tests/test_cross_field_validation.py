@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import pytest
-import yaml
 from pathlib import Path
 
+from municipal.core.yaml_io import safe_dump
+from municipal.intake.validators import cross_field
 from municipal.intake.validators.cross_field import CrossFieldValidator
 from municipal.intake.validation import ValidationEngine
 
@@ -13,65 +14,79 @@ from municipal.intake.validation import ValidationEngine
 # --- Fixtures ---
 
 
-@pytest.fixture
-def rules_dir(tmp_path):
-    """Create a temp config with cross-field rules."""
-    config = {
-        "wizards": {
-            "test_wizard": [
-                {
-                    "type": "date_order",
-                    "field_a": "start_date",
-                    "field_b": "end_date",
-                    "message": "End date must be on or after start date.",
-                },
-                {
-                    "type": "conditional_required",
-                    "field_a": "property_type",
-                    "value": "Commercial",
-                    "field_b": "contractor_name",
-                    "message": "Contractor is required for commercial properties.",
-                },
-                {
-                    "type": "mutual_exclusion",
-                    "field_a": "option_a",
-                    "field_b": "option_b",
-                    "message": "Cannot select both option A and option B.",
-                },
-                {
-                    "type": "numeric_relationship",
-                    "field_a": "min_budget",
-                    "field_b": "max_budget",
-                    "operator": "<=",
-                    "message": "Min budget must be <= max budget.",
-                },
-            ],
-        }
+_TEST_RULES = {
+    "wizards": {
+        "test_wizard": [
+            {
+                "type": "date_order",
+                "field_a": "start_date",
+                "field_b": "end_date",
+                "message": "End date must be on or after start date.",
+            },
+            {
+                "type": "conditional_required",
+                "field_a": "property_type",
+                "value": "Commercial",
+                "field_b": "contractor_name",
+                "message": "Contractor is required for commercial properties.",
+            },
+            {
+                "type": "mutual_exclusion",
+                "field_a": "option_a",
+                "field_b": "option_b",
+                "message": "Cannot select both option A and option B.",
+            },
+            {
+                "type": "numeric_relationship",
+                "field_a": "min_budget",
+                "field_b": "max_budget",
+                "operator": "<=",
+                "message": "Min budget must be <= max budget.",
+            },
+        ],
     }
-    config_path = tmp_path / "cross_field_rules.yml"
-    with open(config_path, "w") as fh:
-        yaml.dump(config, fh)
-    return config_path
+}
+
+
+@pytest.fixture(scope="module")
+def validator():
+    # validate() is read-only, so one validator serves the whole module.
+    return CrossFieldValidator.from_dict(_TEST_RULES)
 
 
-@pytest.fixture
-def validator(rules_dir):
-    return CrossFieldValidator(config_path=rules_dir)
+@pytest.fixture(scope="module")
+def prod_validator():
+    """Validator over the shipped config/cross_field_rules.yml."""
+    return CrossFieldValidator()
 
 
 # --- CrossFieldValidator unit tests ---
 
 
 class TestDateOrderRule:
-    def test_valid_date_order(self, validator):
-        data = {"start_date": "2024-01-01", "end_date": "2024-06-01"}
-        errors = validator.validate("test_wizard", data)
-        assert errors == {}
-
-    def test_same_dates_valid(self, validator):
-        data = {"start_date": "2024-03-15", "end_date": "2024-03-15"}
-        errors = validator.validate("test_wizard", data)
-        assert errors == {}
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"start_date": "2024-01-01", "end_date": "2024-06-01"},
+            {"start_date": "2024-03-15", "end_date": "2024-03-15"},
+            {"start_date": "2024-01-01"},
+            {"start_date": "", "end_date": ""},
+            {"start_date": "not-a-date", "end_date": "2024-01-01"},
+            {"start_date": "2024-02-30", "end_date": "2024-01-01"},
+            {"start_date": "0000-01-01", "end_date": "2024-01-01"},
+        ],
+        ids=[
+            "valid_order",
+            "same_dates",
+            "missing_dates",
+            "empty_dates",
+            "invalid_format",
+            "impossible_date",
+            "year_zero",
+        ],
+    )
+    def test_no_error(self, validator, data):
+        assert validator.validate("test_wizard", data) == {}
 
     def test_invalid_date_order(self, validator):
         data = {"start_date": "2024-06-01", "end_date": "2024-01-01"}
@@ -79,28 +94,22 @@ class TestDateOrderRule:
         assert "end_date" in errors
         assert "End date must be on or after start date." in errors["end_date"]
 
-    def test_missing_dates_skipped(self, validator):
-        data = {"start_date": "2024-01-01"}
-        errors = validator.validate("test_wizard", data)
-        assert errors == {}
-
-    def test_empty_dates_skipped(self, validator):
-        data = {"start_date": "", "end_date": ""}
-        errors = validator.validate("test_wizard", data)
-        assert errors == {}
-
-    def test_invalid_date_format_skipped(self, validator):
-        data = {"start_date": "not-a-date", "end_date": "2024-01-01"}
-        errors = validator.validate("test_wizard", data)
-        assert errors == {}
+    def test_unpadded_dates_compared(self, validator):
+        data = {"start_date": "2024-6-1", "end_date": "2024-1-1"}
+        assert "end_date" in validator.validate("test_wizard", data)
 
 
 class TestConditionalRequiredRule:
-    def test_condition_met_field_present(self, validator):
-        data = {"property_type": "Commercial", "contractor_name": "Bob's Building"}
-        errors = validator.validate("test_wizard", data)
-        # Should have no conditional_required error
-        assert "contractor_name" not in errors
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"property_type": "Commercial", "contractor_name": "Bob's Building"},
+            {"property_type": "Residential"},
+        ],
+        ids=["condition_met_field_present", "condition_not_met"],
+    )
+    def test_no_error(self, validator, data):
+        assert "contractor_name" not in validator.validate("test_wizard", data)
 
     def test_condition_met_field_missing(self, validator):
         data = {"property_type": "Commercial"}
@@ -113,26 +122,15 @@ class TestConditionalRequiredRule:
         errors = validator.validate("test_wizard", data)
         assert "contractor_name" in errors
 
-    def test_condition_not_met(self, validator):
-        data = {"property_type": "Residential"}
-        errors = validator.validate("test_wizard", data)
-        assert "contractor_name" not in errors
-
 
 class TestMutualExclusionRule:
-    def test_neither_set(self, validator):
-        errors = validator.validate("test_wizard", {})
-        assert "option_b" not in errors
-
-    def test_only_a_set(self, validator):
-        data = {"option_a": "yes"}
-        errors = validator.validate("test_wizard", data)
-        assert "option_b" not in errors
-
-    def test_only_b_set(self, validator):
-        data = {"option_b": "yes"}
-        errors = validator.validate("test_wizard", data)
-        assert "option_b" not in errors
+    @pytest.mark.parametrize(
+        "data",
+        [{}, {"option_a": "yes"}, {"option_b": "yes"}],
+        ids=["neither_set", "only_a_set", "only_b_set"],
+    )
+    def test_no_error(self, validator, data):
+        assert "option_b" not in validator.validate("test_wizard", data)
 
     def test_both_set(self, validator):
         data = {"option_a": "yes", "option_b": "yes"}
@@ -142,15 +140,25 @@ class TestMutualExclusionRule:
 
 
 class TestNumericRelationshipRule:
-    def test_valid_relationship(self, validator):
-        data = {"min_budget": "1000", "max_budget": "5000"}
-        errors = validator.validate("test_wizard", data)
-        assert "max_budget" not in errors
-
-    def test_equal_values_valid_for_lte(self, validator):
-        data = {"min_budget": "1000", "max_budget": "1000"}
-        errors = validator.validate("test_wizard", data)
-        assert "max_budget" not in errors
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"min_budget": "1000", "max_budget": "5000"},
+            {"min_budget": "1000", "max_budget": "1000"},
+        ],
+        ids=["valid_relationship", "equal_values_valid_for_lte"],
+    )
+    def test_no_error(self, validator, data):
+        assert "max_budget" not in validator.validate("test_wizard", data)
+
+    @pytest.mark.parametrize(
+        "min_budget,max_budget",
+        [("5000", "1000"), (" 5e3 ", "1_000"), (5000, 1000.5)],
+        ids=["plain", "float_syntax", "numbers"],
+    )
+    def test_violation_detected(self, validator, min_budget, max_budget):
+        data = {"min_budget": min_budget, "max_budget": max_budget}
+        assert "max_budget" in validator.validate("test_wizard", data)
 
     def test_invalid_relationship(self, validator):
         data = {"min_budget": "5000", "max_budget": "1000"}
@@ -158,15 +166,32 @@ class TestNumericRelationshipRule:
         assert "max_budget" in errors
         assert "Min budget must be <= max budget." in errors["max_budget"]
 
-    def test_missing_values_skipped(self, validator):
-        data = {"min_budget": "1000"}
-        errors = validator.validate("test_wizard", data)
-        assert errors == {}
+    @pytest.mark.parametrize(
+        "data",
+        [{"min_budget": "1000"}, {"min_budget": "abc", "max_budget": "1000"}],
+        ids=["missing_values", "non_numeric"],
+    )
+    def test_skipped(self, validator, data):
+        assert validator.validate("test_wizard", data) == {}
 
-    def test_non_numeric_skipped(self, validator):
-        data = {"min_budget": "abc", "max_budget": "1000"}
-        errors = validator.validate("test_wizard", data)
-        assert errors == {}
+    @pytest.mark.parametrize("bad", ["abc", "", "12a", "1,000", "infin", [1]])
+    def test_malformed_rejected_without_float(self, validator, monkeypatch, bad):
+        converted = []
+
+        class SpyFloat(float):
+            def __new__(cls, value):
+                converted.append(value)
+                return float(value)
+
+        monkeypatch.setattr(cross_field, "float", SpyFloat, raising=False)
+        data = {"min_budget": bad, "max_budget": "1000"}
+        assert validator.validate("test_wizard", data) == {}
+        # Only the well-formed value reaches float(); the bad one never raises.
+        assert converted == ["1000"]
+
+    @pytest.mark.parametrize("spelling", [" INF ", "+Infinity", "-inf", "NaN"])
+    def test_float_words_accepted(self, spelling):
+        assert cross_field._try_float(spelling) == pytest.approx(float(spelling), nan_ok=True)
 
 
 class TestValidatorMisc:
@@ -174,76 +199,122 @@ class TestValidatorMisc:
         errors = validator.validate("nonexistent_wizard", {"start_date": "2025-01-01"})
         assert errors == {}
 
-    def test_unknown_rule_type_ignored(self, tmp_path):
+    def test_unknown_rule_type_ignored(self):
         config = {
             "wizards": {
                 "w": [{"type": "unknown_type", "field_a": "x", "field_b": "y"}]
             }
         }
-        config_path = tmp_path / "rules.yml"
-        with open(config_path, "w") as fh:
-            yaml.dump(config, fh)
-        v = CrossFieldValidator(config_path=config_path)
+        v = CrossFieldValidator.from_dict(config)
         assert v.validate("w", {"x": "1", "y": "2"}) == {}
 
-    def test_missing_config_file(self, tmp_path):
-        v = CrossFieldValidator(config_path=tmp_path / "nonexistent.yml")
-        assert v.validate("any", {}) == {}
-
-
-class TestValidationEngineIntegration:
-    def test_validate_cross_field_delegates(self, tmp_path):
+    def test_unknown_operator_ignored(self):
         config = {
             "wizards": {
-                "test": [
+                "w": [
                     {
-                        "type": "date_order",
-                        "field_a": "start",
-                        "field_b": "end",
+                        "type": "numeric_relationship",
+                        "field_a": "x",
+                        "field_b": "y",
+                        "operator": "!=",
                     }
                 ]
             }
         }
+        v = CrossFieldValidator.from_dict(config)
+        assert v.validate("w", {"x": "1", "y": "1"}) == {}
+
+    def test_yaml_file_matches_from_dict(self, tmp_path):
         config_path = tmp_path / "cross_field_rules.yml"
         with open(config_path, "w") as fh:
-            yaml.dump(config, fh)
+            safe_dump(_TEST_RULES, fh)
+        from_file = CrossFieldValidator(config_path=config_path)
+        data = {
+            "start_date": "2024-06-01",
+            "end_date": "2024-01-01",
+            "property_type": "Commercial",
+            "option_a": "yes",
+            "option_b": "yes",
+            "min_budget": "5000",
+            "max_budget": "1000",
+        }
+        errors = from_file.validate("test_wizard", data)
+        assert set(errors) == {"end_date", "contractor_name", "option_b", "max_budget"}
+        assert errors == CrossFieldValidator.from_dict(_TEST_RULES).validate("test_wizard", data)
+
+    def test_missing_config_file(self, tmp_path):
+        v = CrossFieldValidator(config_path=tmp_path / "nonexistent.yml")
+        assert v.validate("any", {}) == {}
+
+
+# Integration configs: one date rule, and no rules.
+_INTEGRATION_CONFIGS = {
+    "cf_invalid": {
+        "wizards": {
+            "test": [
+                {
+                    "type": "date_order",
+                    "field_a": "start",
+                    "field_b": "end",
+                }
+            ]
+        }
+    },
+    "cf_empty": {"wizards": {"test": []}},
+}
+
+
+@pytest.fixture(scope="module")
+def integration_engine():
+    # Each test injects its own cross-field validator, so one engine serves all.
+    return ValidationEngine()
 
-        engine = ValidationEngine()
-        # Inject a cross-field validator with our config
-        from municipal.intake.validators.cross_field import CrossFieldValidator
-        engine._cross_field_validator = CrossFieldValidator(config_path=config_path)
 
-        result = engine.validate_cross_field("test", {"start": "2024-06-01", "end": "2024-01-01"})
+class TestValidationEngineIntegration:
+    def test_validate_cross_field_delegates(self, integration_engine):
+        integration_engine._cross_field_validator = CrossFieldValidator.from_dict(
+            _INTEGRATION_CONFIGS["cf_invalid"]
+        )
+
+        result = integration_engine.validate_cross_field(
+            "test", {"start": "2024-06-01", "end": "2024-01-01"}
+        )
         assert not result.valid
         assert "end" in result.errors
 
-    def test_validate_cross_field_valid(self, tmp_path):
-        config = {"wizards": {"test": []}}
-        config_path = tmp_path / "cross_field_rules.yml"
-        with open(config_path, "w") as fh:
-            yaml.dump(config, fh)
-
-        engine = ValidationEngine()
-        from municipal.intake.validators.cross_field import CrossFieldValidator
-        engine._cross_field_validator = CrossFieldValidator(config_path=config_path)
+    def test_validate_cross_field_valid(self, integration_engine):
+        integration_engine._cross_field_validator = CrossFieldValidator.from_dict(
+            _INTEGRATION_CONFIGS["cf_empty"]
+        )
 
-        result = engine.validate_cross_field("test", {"start": "2024-01-01"})
+        result = integration_engine.validate_cross_field("test", {"start": "2024-01-01"})
         assert result.valid
 
 
 class TestProductionRules:
     """Test the actual production cross_field_rules.yml."""
 
-    @pytest.fixture
-    def prod_validator(self):
-        return CrossFieldValidator()
-
-    def test_foia_date_order_invalid(self, prod_validator):
-        errors = prod_validator.validate(
-            "foia_request",
-            {"date_range_start": "2024-06-01", "date_range_end": "2024-01-01"},
-        )
-        assert "date_range_end" in errors
+    @pytest.mark.parametrize(
+        "wizard_id,data,field,expect_error",
+        [
+            (
+                "foia_request",
+                {"date_range_start": "2024-06-01", "date_range_end": "2024-01-01"},
+                "date_range_end",
+                True,
+            ),
+            ("permit_application", {"property_type": "Commercial"}, "contractor_name", True),
+            ("permit_application", {"property_type": "Residential"}, "contractor_name", False),
+        ],
+        ids=[
+            "foia_date_order_invalid",
+            "permit_commercial_requires_contractor",
+            "permit_residential_no_contractor_needed",
+        ],
+    )
+    def test_production_rule(self, prod_validator, wizard_id, data, field, expect_error):
+        errors = prod_validator.validate(wizard_id, data)
+        assert (field in errors) is expect_error
 
     def test_foia_date_order_valid(self, prod_validator):
         errors = prod_validator.validate(
@@ -251,17 +322,3 @@ class TestProductionRules:
             {"date_range_start": "2024-01-01", "date_range_end": "2024-06-01"},
         )
         assert errors == {}
-
-    def test_permit_commercial_requires_contractor(self, prod_validator):
-        errors = prod_validator.validate(
-            "permit_application",
-            {"property_type": "Commercial"},
-        )
-        assert "contractor_name" in errors
-
-    def test_permit_residential_no_contractor_needed(self, prod_validator):
-        errors = prod_validator.validate(
-            "permit_application",
-            {"property_type": "Residential"},
-        )
-        assert "contractor_name" not in errors
@@ -3,22 +3,25 @@
 from __future__ import annotations
 
 import pytest
+from sqlalchemy import select
 
-from municipal.db.base import Base
 from municipal.db.engine import DatabaseManager
 
-# Import models to populate metadata
-import municipal.db.models  # noqa: F401
+
+@pytest.fixture
+def db_manager(worker_db):
+    """The per-worker DatabaseManager, schema already created (see conftest)."""
+    return worker_db
 
 
 @pytest.fixture
-async def db_manager():
-    """Create a DatabaseManager with an in-memory SQLite database."""
-    manager = DatabaseManager("sqlite+aiosqlite:///:memory:")
-    async with manager.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield manager
-    await manager.close()
+async def db_conn(db_manager):
+    """A connection inside a transaction that is rolled back after the test."""
+    async with db_manager.engine.connect() as conn:
+        trans = await conn.begin()
+        yield conn
+        if trans.is_active:
+            await trans.rollback()
 
 
 async def test_engine_creation(db_manager):
@@ -32,18 +35,16 @@ async def test_session_creation(db_manager):
         assert session is not None
 
 
-async def test_create_and_query_session(db_manager):
+async def test_create_and_query_session(db_manager, db_conn):
     """Round-trip: insert a session row and read it back."""
     from municipal.db.models import SessionRow
 
-    async with db_manager.session() as session:
+    async with db_manager.session(bind=db_conn) as session:
         row = SessionRow(session_id="test-123", session_type="anonymous")
         session.add(row)
         await session.commit()
 
-    async with db_manager.session() as session:
-        from sqlalchemy import select
-
+    async with db_manager.session(bind=db_conn) as session:
         result = await session.execute(
             select(SessionRow).where(SessionRow.session_id == "test-123")
         )
@@ -53,8 +54,43 @@ async def test_create_and_query_session(db_manager):
         assert found.session_type == "anonymous"
 
 
-async def test_close(db_manager):
+async def test_bound_session_changes_roll_back(db_manager, db_conn):
+    """Rows committed through a bound session vanish with the outer transaction."""
+    from municipal.db.models import SessionRow
+
+    async with db_manager.session(bind=db_conn) as session:
+        session.add(SessionRow(session_id="rolled-back", session_type="anonymous"))
+        await session.commit()
+    await db_conn.rollback()
+
+    async with db_manager.session() as session:
+        result = await session.execute(
+            select(SessionRow).where(SessionRow.session_id == "rolled-back")
+        )
+        assert result.scalar_one_or_none() is None
+
+
+async def test_bound_to_binds_every_session(db_manager, db_conn):
+    """Sessions from a bound_to() view join the given connection's transaction."""
+    from municipal.db.models import SessionRow
+
+    view = db_manager.bound_to(db_conn)
+    assert view.engine is db_manager.engine
+    async with view.session() as session:
+        session.add(SessionRow(session_id="via-view", session_type="anonymous"))
+        await session.commit()
+    await db_conn.rollback()
+
+    async with db_manager.session() as session:
+        result = await session.execute(
+            select(SessionRow).where(SessionRow.session_id == "via-view")
+        )
+        assert result.scalar_one_or_none() is None
+
+
+async def test_close():
     """DatabaseManager.close() should dispose the engine."""
-    await db_manager.close()
+    manager = DatabaseManager("sqlite+aiosqlite:///:memory:")
+    await manager.close()
     # Engine should be disposed — creating a new connection should fail or
     # the pool should be invalidated. We just verify no exception on close.
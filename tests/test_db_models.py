@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import pytest
+
 from municipal.db.base import Base
-from municipal.db.models import (
+
+# Importing every ORM class is the importability check: a missing or
+# broken model fails collection of this module.
+from municipal.db.models import (  # noqa: F401
     ApprovalRequestRow,
     AuditEventRow,
     AuthTokenRow,
@@ -19,8 +24,10 @@ from municipal.db.models import (
     WizardStateRow,
 )
 
+# The relationship checks below read a fully configured mapper graph.
+pytestmark = pytest.mark.usefixtures("_configured_mappers")
 
-EXPECTED_TABLES = {
+EXPECTED_TABLES = frozenset({
     "sessions",
     "messages",
     "wizard_states",
@@ -34,33 +41,29 @@ EXPECTED_TABLES = {
     "payment_records",
     "audit_events",
     "auth_tokens",
+})
+
+EXPECTED_INDEXES = [
+    ("sessions", "ix_sessions_last_active"),
+    ("messages", "ix_messages_session_id"),
+    ("cases", "ix_cases_session_id"),
+    ("cases", "ix_cases_wizard_id"),
+    ("audit_events", "ix_audit_events_session_id_timestamp"),
+    ("audit_events", "ix_audit_events_timestamp"),
+    ("payment_records", "ix_payment_records_case_id"),
+    ("notifications", "ix_notifications_session_id"),
+    ("auth_tokens", "ix_auth_tokens_expires_at"),
+]
+
+TABLE_INDEX_NAMES = {
+    name: {idx.name for idx in table.indexes}
+    for name, table in Base.metadata.tables.items()
 }
 
 
 def test_all_tables_registered():
     """All 13 tables should be registered in Base.metadata."""
-    table_names = set(Base.metadata.tables.keys())
-    assert EXPECTED_TABLES == table_names
-
-
-def test_model_classes_importable():
-    """All ORM model classes should be importable."""
-    models = [
-        SessionRow,
-        MessageRow,
-        WizardStateRow,
-        CaseRow,
-        ApprovalRequestRow,
-        GraphNodeRow,
-        GraphEdgeRow,
-        NotificationRow,
-        FeedbackEntryRow,
-        ShadowComparisonRow,
-        PaymentRecordRow,
-        AuditEventRow,
-        AuthTokenRow,
-    ]
-    assert len(models) == 13
+    assert Base.metadata.tables.keys() == EXPECTED_TABLES
 
 
 def test_session_has_messages_relationship():
@@ -69,28 +72,7 @@ def test_session_has_messages_relationship():
     assert "messages" in mapper.relationships
 
 
-def test_indexes_exist():
+@pytest.mark.parametrize("table,index", EXPECTED_INDEXES)
+def test_indexes_exist(table: str, index: str):
     """Key indexes should be defined."""
-    tables = Base.metadata.tables
-    session_indexes = {idx.name for idx in tables["sessions"].indexes}
-    assert "ix_sessions_last_active" in session_indexes
-
-    msg_indexes = {idx.name for idx in tables["messages"].indexes}
-    assert "ix_messages_session_id" in msg_indexes
-
-    case_indexes = {idx.name for idx in tables["cases"].indexes}
-    assert "ix_cases_session_id" in case_indexes
-    assert "ix_cases_wizard_id" in case_indexes
-
-    audit_indexes = {idx.name for idx in tables["audit_events"].indexes}
-    assert "ix_audit_events_session_id" in audit_indexes
-    assert "ix_audit_events_timestamp" in audit_indexes
-
-    payment_indexes = {idx.name for idx in tables["payment_records"].indexes}
-    assert "ix_payment_records_case_id" in payment_indexes
-
-    notif_indexes = {idx.name for idx in tables["notifications"].indexes}
-    assert "ix_notifications_session_id" in notif_indexes
-
-    token_indexes = {idx.name for idx in tables["auth_tokens"].indexes}
-    assert "ix_auth_tokens_expires_at" in token_indexes
+    assert index in TABLE_INDEX_NAMES[table]
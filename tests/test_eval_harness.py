@@ -22,60 +22,69 @@ from municipal.llm.client import LLMClient
 # Fixtures
 # ---------------------------------------------------------------------------
 
+# Known-good field values, kept as plain dicts so the dataset-loading tests
+# can write them to JSON directly instead of round-tripping through models.
+_ENTRY_FIELDS: list[dict] = [
+    {
+        "id": "test-001",
+        "department": "Public Works",
+        "category": "311",
+        "question": "How do I report a pothole?",
+        "expected_answer": "Call 311 or use the online portal.",
+        "expected_sources": ["311 Guide", "PW Policy"],
+        "difficulty": "easy",
+    },
+    {
+        "id": "test-002",
+        "department": "Finance",
+        "category": "fees",
+        "question": "What is the dog license fee?",
+        "expected_answer": "The annual dog license fee is $25.",
+        "expected_sources": ["Fee Schedule 2025"],
+        "difficulty": "medium",
+    },
+]
+
+_RESULT_FIELDS: list[dict] = [
+    {
+        "entry_id": "test-001",
+        "question": "How do I report a pothole?",
+        "generated_answer": "Call 311. [Source: 311 Guide]",
+        "expected_answer": "Call 311 or use the online portal.",
+        "cited_sources": ["311 Guide"],
+        "expected_sources": ["311 Guide", "PW Policy"],
+        "answer_accurate": True,
+        "citation_precision": 1.0,
+        "citation_recall": 0.5,
+        "contains_hallucination": False,
+        "correctly_refused": False,
+        "latency_ms": 150.0,
+    },
+    {
+        "entry_id": "test-002",
+        "question": "What is the dog license fee?",
+        "generated_answer": "The fee is $25. [Source: Fee Schedule 2025]",
+        "expected_answer": "The annual dog license fee is $25.",
+        "cited_sources": ["Fee Schedule 2025"],
+        "expected_sources": ["Fee Schedule 2025"],
+        "answer_accurate": True,
+        "citation_precision": 1.0,
+        "citation_recall": 1.0,
+        "contains_hallucination": False,
+        "correctly_refused": False,
+        "latency_ms": 200.0,
+    },
+]
+
+
 def _make_entries() -> list[EvalEntry]:
-    return [
-        EvalEntry(
-            id="test-001",
-            department="Public Works",
-            category="311",
-            question="How do I report a pothole?",
-            expected_answer="Call 311 or use the online portal.",
-            expected_sources=["311 Guide", "PW Policy"],
-            difficulty="easy",
-        ),
-        EvalEntry(
-            id="test-002",
-            department="Finance",
-            category="fees",
-            question="What is the dog license fee?",
-            expected_answer="The annual dog license fee is $25.",
-            expected_sources=["Fee Schedule 2025"],
-            difficulty="medium",
-        ),
-    ]
+    # Fresh instances per call (tests mutate them); the values are
+    # known-good, so skip validation.
+    return [EvalEntry.model_construct(**fields) for fields in _ENTRY_FIELDS]
 
 
 def _make_results() -> list[EvalResult]:
-    return [
-        EvalResult(
-            entry_id="test-001",
-            question="How do I report a pothole?",
-            generated_answer="Call 311. [Source: 311 Guide]",
-            expected_answer="Call 311 or use the online portal.",
-            cited_sources=["311 Guide"],
-            expected_sources=["311 Guide", "PW Policy"],
-            answer_accurate=True,
-            citation_precision=1.0,
-            citation_recall=0.5,
-            contains_hallucination=False,
-            correctly_refused=False,
-            latency_ms=150.0,
-        ),
-        EvalResult(
-            entry_id="test-002",
-            question="What is the dog license fee?",
-            generated_answer="The fee is $25. [Source: Fee Schedule 2025]",
-            expected_answer="The annual dog license fee is $25.",
-            cited_sources=["Fee Schedule 2025"],
-            expected_sources=["Fee Schedule 2025"],
-            answer_accurate=True,
-            citation_precision=1.0,
-            citation_recall=1.0,
-            contains_hallucination=False,
-            correctly_refused=False,
-            latency_ms=200.0,
-        ),
-    ]
+    return [EvalResult.model_construct(**fields) for fields in _RESULT_FIELDS]
 
 
 class MockLLMClient(LLMClient):
@@ -108,19 +117,17 @@ class MockLLMClient(LLMClient):
 
 class TestGoldenDataset:
     def test_load_dataset_from_array(self, tmp_path: Path) -> None:
-        entries = _make_entries()
-        data = [e.model_dump() for e in entries]
         f = tmp_path / "ds.json"
-        f.write_text(json.dumps(data))
+        f.write_text(json.dumps(_ENTRY_FIELDS))
         loaded = load_dataset(f)
         assert len(loaded) == 2
         assert loaded[0].id == "test-001"
+        # The unvalidated fixtures match what validation produces.
+        assert loaded == _make_entries()
 
     def test_load_dataset_from_object(self, tmp_path: Path) -> None:
-        entries = _make_entries()
-        data = {"entries": [e.model_dump() for e in entries]}
         f = tmp_path / "ds.json"
-        f.write_text(json.dumps(data))
+        f.write_text(json.dumps({"entries": _ENTRY_FIELDS}))
         loaded = load_dataset(f)
         assert len(loaded) == 2
 
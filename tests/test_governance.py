@@ -6,12 +6,13 @@ import json
 from pathlib import Path
 
 import pytest
-import yaml
 
 from municipal.core.config import AuditConfig
 from municipal.core.types import ApprovalStatus, AuditEvent, DataClassification
+from municipal.core.yaml_io import safe_dump
 from municipal.governance.approval import ApprovalGate
 from municipal.governance.audit import AuditLogger
+from tests.conftest import PROJECT_ROOT
 
 
 # ---------------------------------------------------------------------------
@@ -56,7 +57,7 @@ def approval_config_path(tmp_path: Path) -> Path:
         },
     }
     path = tmp_path / "approval_policies.yml"
-    path.write_text(yaml.dump(config))
+    path.write_text(safe_dump(config))
     return path
 
 
@@ -127,6 +128,13 @@ class TestApprovalGate:
         gate.request_approval("data_export", "r2", "b@city.gov")
         assert len(gate.pending_requests) == 2
 
+    def test_pending_requests_drop_settled(self, gate: ApprovalGate) -> None:
+        r1 = gate.request_approval("data_export", "r1", "a@city.gov")
+        r2 = gate.request_approval("data_export", "r2", "b@city.gov")
+        gate.deny(r1.request_id, "supervisor@city.gov", "Not allowed")
+        assert [r.request_id for r in gate.pending_requests] == [r2.request_id]
+        assert len(gate.list_all_requests()) == 2
+
     def test_gates_property(self, gate: ApprovalGate) -> None:
         gates = gate.gates
         assert "permit_decision" in gates
@@ -249,6 +257,23 @@ class TestAuditLogger:
         results = logger.query({"classification": "sensitive"})
         assert len(results) == 1
 
+    def test_query_filter_by_classification_enum(self, logger: AuditLogger) -> None:
+        logger.log(_make_event(classification=DataClassification.PUBLIC))
+        logger.log(_make_event(classification=DataClassification.SENSITIVE))
+        results = logger.query({"classification": DataClassification.SENSITIVE})
+        assert [e.classification for e in results] == [DataClassification.SENSITIVE]
+
+    def test_iter_query_is_lazy(self, logger: AuditLogger) -> None:
+        logger.log(_make_event(action="read"))
+        logger.log(_make_event(action="write"))
+        results = logger.iter_query({"action": "write"})
+        assert not isinstance(results, list)
+        assert [e.action for e in results] == ["write"]
+
+    def test_iter_query_validates_filters_eagerly(self, logger: AuditLogger) -> None:
+        with pytest.raises(ValueError):
+            logger.iter_query({"after": "not-a-date"})
+
     def test_recover_last_hash_on_reopen(self, audit_dir: Path) -> None:
         config = AuditConfig(log_dir=str(audit_dir))
         logger1 = AuditLogger(config=config)
@@ -265,14 +290,67 @@ class TestAuditLogger:
         # Verify the combined chain
         assert logger2.verify_chain() is True
 
+    def test_reopen_reads_log_once(self, audit_dir: Path, monkeypatch) -> None:
+        import municipal.governance.audit as audit_module
+
+        config = AuditConfig(log_dir=str(audit_dir))
+        logger1 = AuditLogger(config=config)
+        logger1.log(_make_event(session_id="a", action="first"))
+        last = logger1.log(_make_event(session_id="b", action="second"))
+
+        opened = []
+
+        def counting_open(*args, **kwargs):
+            opened.append(args[0])
+            return open(*args, **kwargs)
+
+        monkeypatch.setattr(audit_module, "open", counting_open, raising=False)
+        logger2 = AuditLogger(config=config)
+        # One pass both indexes the log and recovers the chain tip.
+        assert len(opened) == 1
+        assert logger2.last_hash == last.entry_hash
+        assert [e.action for e in logger2.query({"session_id": "a"})] == ["first"]
+
+    def test_indexed_query_sees_other_writers(self, audit_dir: Path) -> None:
+        config = AuditConfig(log_dir=str(audit_dir))
+        reader = AuditLogger(config=config)
+        reader.log(_make_event(session_id="a", action="read"))
+        # A second logger on the same file, like another worker process.
+        AuditLogger(config=config).log(_make_event(session_id="b", action="read"))
+        reader.log(_make_event(session_id="a", action="write"))
+
+        assert [e.action for e in reader.query({"session_id": "a"})] == ["read", "write"]
+        assert [e.session_id for e in reader.query({"session_id": "b"})] == ["b"]
+        assert len(reader.query({"action": "read", "session_id": "a"})) == 1
+        assert reader.query({"session_id": "missing"}) == []
+
+    def test_indexed_query_after_rewrite(self, logger: AuditLogger) -> None:
+        logger.log(_make_event(session_id="a"))
+        logger.log(_make_event(session_id="b"))
+        lines = logger.log_path.read_text().splitlines()
+        logger.log_path.write_text(lines[1] + "\n")
+
+        assert logger.query({"session_id": "a"}) == []
+        assert len(logger.query({"session_id": "b"})) == 1
+
+    def test_memory_backend(self, audit_dir: Path) -> None:
+        config = AuditConfig(log_dir=str(audit_dir / "unused"), backend="memory")
+        logger = AuditLogger(config=config)
+        first = logger.log(_make_event(action="read"))
+        second = logger.log(_make_event(action="write"))
+
+        assert second.previous_hash == first.entry_hash
+        assert logger.last_hash == second.entry_hash
+        assert [e.action for e in logger.query({"action": "write"})] == ["write"]
+        assert logger.verify_chain() is True
+        assert not (audit_dir / "unused").exists()
+
 
 class TestProductionApprovalConfig:
     """Test that the production approval YAML config loads correctly."""
 
     def test_production_config_loads(self) -> None:
-        config_path = (
-            Path(__file__).resolve().parents[1] / "config" / "approval_policies.yml"
-        )
+        config_path = PROJECT_ROOT / "config" / "approval_policies.yml"
         if not config_path.exists():
             pytest.skip("Production config not found")
 
@@ -50,6 +50,16 @@ class TestGraphStore:
         submitted = graph.get_neighbors("p1", RelationshipType.SUBMITTED)
         assert len(submitted) == 1
 
+    def test_has_edge(self, graph):
+        graph.add_edge(
+            Edge(source_id="p1", target_id="c1", relationship=RelationshipType.SUBMITTED)
+        )
+        assert graph.has_edge("p1", RelationshipType.SUBMITTED, "c1")
+        # Undirected, like get_neighbors
+        assert graph.has_edge("c1", RelationshipType.SUBMITTED, "p1")
+        assert not graph.has_edge("p1", RelationshipType.OWNS, "c1")
+        assert not graph.has_edge("p1", RelationshipType.SUBMITTED, "c2")
+
     def test_query_by_entity_type(self, graph):
         graph.add_node(Node(id="p1", entity_type=EntityType.PERSON, label="A"))
         graph.add_node(Node(id="p2", entity_type=EntityType.PERSON, label="B"))
@@ -77,3 +87,13 @@ class TestGraphStore:
         graph.add_edge(Edge(source_id="a", target_id="b", relationship=RelationshipType.OWNS))
         assert graph.node_count == 2
         assert graph.edge_count == 1
+
+    def test_clear(self, graph):
+        graph.add_node(Node(id="a", entity_type=EntityType.PERSON))
+        graph.add_node(Node(id="b", entity_type=EntityType.PARCEL))
+        graph.add_edge(Edge(source_id="a", target_id="b", relationship=RelationshipType.OWNS))
+        graph.clear()
+        assert graph.node_count == 0
+        assert graph.edge_count == 0
+        assert graph.get_neighbors("a") == []
+        assert not graph.has_edge("a", RelationshipType.OWNS, "b")
@@ -14,7 +14,7 @@ def engine():
 
 @pytest.fixture
 def custom_engine(tmp_path):
-    import yaml
+    from municipal.core.yaml_io import safe_dump
 
     en = {
         "greeting": "Hello {name}",
@@ -29,9 +29,9 @@ def custom_engine(tmp_path):
     bundles_dir = tmp_path / "i18n"
     bundles_dir.mkdir()
     with open(bundles_dir / "en.yml", "w") as fh:
-        yaml.dump(en, fh)
+        safe_dump(en, fh)
     with open(bundles_dir / "es.yml", "w") as fh:
-        yaml.dump(es, fh)
+        safe_dump(es, fh)
 
     return I18nEngine(bundles_dir=bundles_dir)
 
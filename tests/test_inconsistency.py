@@ -5,8 +5,8 @@ from __future__ import annotations
 from datetime import date, timedelta
 
 import pytest
-import yaml
 
+from municipal.core.yaml_io import safe_dump
 from municipal.review.inconsistency import InconsistencyDetector
 
 
@@ -52,7 +52,7 @@ def rules_path(tmp_path):
     }
     path = tmp_path / "inconsistency_rules.yml"
     with open(path, "w") as fh:
-        yaml.dump(config, fh)
+        safe_dump(config, fh)
     return path
 
 
@@ -127,6 +127,16 @@ class TestIntakeAPI:
         assert resp.status_code == 200
         assert resp.json() == []
 
+    def test_export_case_pdf(self, client):
+        from municipal.intake.models import Case
+
+        case = Case(wizard_id="permit_application", session_id="s1", data={"name": "A"})
+        client.app.state.intake_store.save_case(case)
+        resp = client.get(f"/api/intake/cases/{case.id}/export?format=pdf")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/pdf"
+        assert resp.content[:4] == b"%PDF"
+
 
 class TestGISAPI:
     def test_parcel_lookup_by_id(self, client):
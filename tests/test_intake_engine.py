@@ -24,8 +24,10 @@ def store():
     return IntakeStore()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def validation_engine():
+    # Validators are a stateless name -> function table; no test here
+    # registers extra ones, so one engine serves the module.
     return ValidationEngine()
 
 
@@ -41,7 +43,7 @@ def engine(store, validation_engine, tmp_path):
 @pytest.fixture
 def simple_engine(store, validation_engine, tmp_path):
     """Engine with a simple test wizard."""
-    import yaml
+    from municipal.core.yaml_io import safe_dump
 
     wizard_dir = tmp_path / "wizards"
     wizard_dir.mkdir()
@@ -88,7 +90,7 @@ def simple_engine(store, validation_engine, tmp_path):
     }
 
     with open(wizard_dir / "test_wizard.yml", "w") as fh:
-        yaml.dump(wizard_data, fh)
+        safe_dump(wizard_data, fh)
 
     return WizardEngine(
         store=store,
@@ -111,6 +113,15 @@ class TestWizardEngine:
         defn = engine.wizard_definitions["foia_request"]
         assert len(defn.steps) == 3
 
+    def test_field_classifications(self, engine):
+        classifications = engine.field_classifications("permit_application")
+        defn = engine.wizard_definitions["permit_application"]
+        expected = {
+            f.id: f.classification.value for step in defn.steps for f in step.fields
+        }
+        assert classifications == expected
+        assert engine.field_classifications("nope") == {}
+
     def test_start_wizard(self, simple_engine, store):
         state = simple_engine.start_wizard("test_wizard", "session-1")
         assert state.wizard_id == "test_wizard"
@@ -190,7 +201,7 @@ class TestWizardEngine:
 
     def test_session_tier_enforcement(self, simple_engine, store, validation_engine, tmp_path):
         """Steps requiring a higher tier should reject lower-tier sessions."""
-        import yaml
+        from municipal.core.yaml_io import safe_dump
 
         wizard_dir = tmp_path / "tier_wizards"
         wizard_dir.mkdir()
@@ -217,7 +228,7 @@ class TestWizardEngine:
             ],
         }
         with open(wizard_dir / "tier_test.yml", "w") as fh:
-            yaml.dump(wizard_data, fh)
+            safe_dump(wizard_data, fh)
 
         eng = WizardEngine(
             store=store, validation_engine=validation_engine, wizards_dir=wizard_dir,
@@ -245,10 +256,19 @@ class TestIntakeStore:
         assert len(store.list_cases("s1")) == 1
         assert len(store.list_cases("s2")) == 0
 
+    def test_clear(self, store):
+        store.save_wizard_state(WizardState(wizard_id="w1", session_id="s1"))
+        store.save_case(Case(wizard_id="w1", session_id="s1"))
+        version = store.case_version
+        store.clear()
+        assert store.case_count == 0
+        assert store.list_wizard_states("s1") == []
+        assert store.case_version != version
+
 
 class TestShowIfCondition:
     def test_step_skipped_when_condition_not_met(self, store, validation_engine, tmp_path):
-        import yaml
+        from municipal.core.yaml_io import safe_dump
 
         wizard_dir = tmp_path / "skip_wizards"
         wizard_dir.mkdir()
@@ -288,7 +308,7 @@ class TestShowIfCondition:
             ],
         }
         with open(wizard_dir / "skip_test.yml", "w") as fh:
-            yaml.dump(wizard_data, fh)
+            safe_dump(wizard_data, fh)
 
         eng = WizardEngine(store=store, validation_engine=validation_engine, wizards_dir=wizard_dir)
         state = eng.start_wizard("skip_test", "s1")
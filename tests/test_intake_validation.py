@@ -144,3 +144,17 @@ class TestValidationEngine:
         )
         assert engine.validate_field(field, "bad") == ["Value is bad"]
         assert engine.validate_field(field, "good") == []
+
+    def test_validator_params_do_not_leak_between_fields(self):
+        engine = ValidationEngine()
+        bounded = FieldDefinition(
+            id="age", label="Age", field_type=FieldType.NUMBER,
+            validators=["numeric:min_val=0,max_val=150"],
+        )
+        unbounded = FieldDefinition(
+            id="count", label="Count", field_type=FieldType.NUMBER,
+            validators=["numeric"],
+        )
+        assert engine.validate_field(bounded, "200")
+        assert engine.validate_field(bounded, "200")
+        assert engine.validate_field(unbounded, "200") == []
@@ -35,6 +35,11 @@ class TestFeedbackStore:
         assert result.feedback_id == entry.feedback_id
         assert store.count() == 1
 
+    def test_feedback_id_is_hex(self) -> None:
+        entry = FeedbackEntry(session_id="s1", message_index=0, flag_type=FlagType.OTHER)
+        assert len(entry.feedback_id) == 32
+        int(entry.feedback_id, 16)
+
     def test_list_all_newest_first(self) -> None:
         store = FeedbackStore()
         e1 = FeedbackEntry(session_id="s1", message_index=0, flag_type=FlagType.INACCURATE)
@@ -47,6 +52,58 @@ class TestFeedbackStore:
         # Newest first (e2 created after e1)
         assert entries[0].session_id == "s2"
 
+    def test_reads_are_unaffected_by_later_writes(self) -> None:
+        store = FeedbackStore()
+        store.add(FeedbackEntry(session_id="s1", message_index=0, flag_type=FlagType.OTHER))
+        snapshot = store.list_all()
+        session_snapshot = store.get_for_session("s1")
+        store.add(FeedbackEntry(session_id="s1", message_index=1, flag_type=FlagType.OTHER))
+        store.clear()
+        assert len(snapshot) == 1
+        assert len(session_snapshot) == 1
+        assert store.get_for_session("s1") == []
+
+    def test_list_all_orders_out_of_order_adds(self) -> None:
+        from datetime import datetime, timezone
+
+        store = FeedbackStore()
+        for day in (2, 3, 1):
+            store.add(FeedbackEntry(
+                session_id="s1",
+                message_index=day,
+                flag_type=FlagType.OTHER,
+                timestamp=datetime(2025, 1, day, tzinfo=timezone.utc),
+            ))
+        assert [e.message_index for e in store.list_all()] == [3, 2, 1]
+        assert [e.message_index for e in store.list_page(1, offset=2)] == [1]
+
+    def test_time_window_queries(self) -> None:
+        from datetime import datetime, timezone
+
+        store = FeedbackStore()
+        for day in (3, 1, 2):
+            for sid in ("s1", "s2"):
+                store.add(FeedbackEntry(
+                    session_id=sid,
+                    message_index=day,
+                    flag_type=FlagType.OTHER,
+                    timestamp=datetime(2025, 1, day, tzinfo=timezone.utc),
+                ))
+        cutoff = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert [e.message_index for e in store.get_for_session("s1")] == [1, 2, 3]
+        assert [e.message_index for e in store.get_for_session("s1", after=cutoff)] == [2, 3]
+        assert [e.message_index for e in store.list_all(after=cutoff)] == [3, 3, 2, 2]
+
+    def test_list_page(self) -> None:
+        store = FeedbackStore()
+        for i in range(5):
+            store.add(FeedbackEntry(session_id="s1", message_index=i, flag_type=FlagType.OTHER))
+
+        assert [e.message_index for e in store.list_page(2)] == [4, 3]
+        assert [e.message_index for e in store.list_page(2, offset=3)] == [1, 0]
+        assert [e.message_index for e in store.list_page(10, offset=4)] == [0]
+        assert store.list_page(2, offset=10) == []
+
     def test_get_for_session(self) -> None:
         store = FeedbackStore()
         store.add(FeedbackEntry(session_id="s1", message_index=0, flag_type=FlagType.INACCURATE))
@@ -56,6 +113,30 @@ class TestFeedbackStore:
         result = store.get_for_session("s1")
         assert len(result) == 2
         assert all(e.session_id == "s1" for e in result)
+        assert store.get_for_session("unknown") == []
+
+    def test_indexes_cover_add_many_and_clear(self) -> None:
+        store = FeedbackStore()
+        entries = [
+            FeedbackEntry(session_id=f"s{i % 2}", message_index=i, flag_type=FlagType.OTHER)
+            for i in range(4)
+        ]
+        store.add_many(entries)
+        assert [e.message_index for e in store.get_for_session("s1")] == [1, 3]
+        assert store.get_by_id(entries[2].feedback_id) is entries[2]
+
+        store.clear()
+        assert store.get_for_session("s1") == []
+        assert store.get_by_id(entries[2].feedback_id) is None
+
+    def test_add_many(self) -> None:
+        store = FeedbackStore()
+        entries = [
+            FeedbackEntry(session_id="s1", message_index=i, flag_type=FlagType.OTHER)
+            for i in range(3)
+        ]
+        assert store.add_many(entries) == entries
+        assert store.count() == 3
 
     def test_get_by_id(self) -> None:
         store = FeedbackStore()
@@ -113,6 +194,14 @@ class TestShadowModeManager:
         active = mgr.list_active()
         assert set(active) == {"s1", "s2"}
 
+    def test_active_ids_view(self) -> None:
+        mgr = ShadowModeManager()
+        view = mgr.active_ids
+        mgr.enable("s1")
+        assert "s1" in view
+        mgr.disable("s1")
+        assert "s1" not in view
+
     def test_clear(self) -> None:
         mgr = ShadowModeManager()
         mgr.enable("s1")
@@ -120,6 +209,15 @@ class TestShadowModeManager:
         assert mgr.is_active("s1") is False
         assert mgr.list_active() == []
 
+    def test_evicts_oldest_beyond_cap(self) -> None:
+        mgr = ShadowModeManager(max_sessions=2)
+        mgr.enable("s1")
+        mgr.enable("s2")
+        mgr.enable("s1")  # refresh s1 so s2 becomes the oldest
+        mgr.enable("s3")
+        assert mgr.is_active("s2") is False
+        assert set(mgr.list_active()) == {"s1", "s3"}
+
     def test_disable_nonexistent_is_noop(self) -> None:
         mgr = ShadowModeManager()
         mgr.disable("nonexistent")  # Should not raise
@@ -236,6 +334,7 @@ class TestStaffAuditAPI:
     def test_list_audit_entries(self, client) -> None:
         resp = client.get("/api/staff/audit")
         assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
         data = resp.json()
         assert isinstance(data, list)
         assert len(data) >= 1
@@ -258,6 +357,32 @@ class TestStaffAuditAPI:
         data = resp.json()
         assert data == []
 
+    def test_streams_across_batches(self, client, test_app, monkeypatch) -> None:
+        from municipal.core.types import AuditEvent, DataClassification
+        from municipal.web import mission_control
+
+        monkeypatch.setattr(mission_control, "_STREAM_BATCH_SIZE", 2)
+        for i in range(4):
+            test_app.state.audit_logger.log(AuditEvent(
+                session_id="stream-session",
+                actor="streamer",
+                action=f"a{i}",
+                resource="kb",
+                classification=DataClassification.PUBLIC,
+            ))
+        data = client.get("/api/staff/audit?actor=streamer").json()
+        assert [e["action"] for e in data] == ["a0", "a1", "a2", "a3"]
+
+    def test_filter_by_time_window(self, client) -> None:
+        resp = client.get("/api/staff/audit?after=2000-01-01T00:00:00")
+        assert len(resp.json()) >= 1
+        resp = client.get("/api/staff/audit?before=2000-01-01T00:00:00Z")
+        assert resp.json() == []
+
+    def test_invalid_time_filter_rejected(self, client) -> None:
+        resp = client.get("/api/staff/audit?after=not-a-date")
+        assert resp.status_code == 422
+
     def test_filter_by_classification(self, client) -> None:
         resp = client.get("/api/staff/audit?classification=public")
         data = resp.json()
@@ -295,7 +420,8 @@ class TestFeedbackAPI:
                 "note": "",
             },
         )
-        assert resp.status_code == 400
+        assert resp.status_code == 422
+        assert resp.json()["detail"][0]["loc"] == ["body", "flag_type"]
 
     def test_submit_feedback_invalid_session(self, client) -> None:
         resp = client.post(
@@ -341,6 +467,41 @@ class TestFeedbackAPI:
         assert len(data) >= 1
         assert data[0]["session_id"] == sid
 
+    def test_feedback_timestamp_matches_between_create_and_list(
+        self, client, test_app
+    ) -> None:
+        sid = test_app.state._test_session_id
+        created = client.post(
+            "/api/staff/feedback",
+            json={"session_id": sid, "message_index": 1, "flag_type": "other"},
+        ).json()
+        listed = {e["feedback_id"]: e for e in client.get("/api/staff/feedback").json()}
+        assert listed[created["feedback_id"]]["timestamp"] == created["timestamp"]
+        assert created["timestamp"].endswith("Z")
+
+    def test_list_feedback_paginated(self, client, test_app) -> None:
+        sid = test_app.state._test_session_id
+        for note in ("first", "second", "third"):
+            client.post(
+                "/api/staff/feedback",
+                json={"session_id": sid, "message_index": 0, "flag_type": "other", "note": note},
+            )
+        resp = client.get("/api/staff/feedback?limit=2&offset=1")
+        assert resp.status_code == 200
+        assert [e["note"] for e in resp.json()] == ["second", "first"]
+
+        assert client.get("/api/staff/feedback?limit=0").status_code == 422
+
+    def test_list_feedback_after(self, client, test_app) -> None:
+        sid = test_app.state._test_session_id
+        client.post(
+            "/api/staff/feedback",
+            json={"session_id": sid, "message_index": 0, "flag_type": "other"},
+        )
+        assert len(client.get("/api/staff/feedback?after=2000-01-01T00:00:00").json()) == 1
+        resp = client.get(f"/api/staff/feedback?session_id={sid}&after=2999-01-01T00:00:00Z")
+        assert resp.json() == []
+
     def test_list_feedback_by_session(self, client, test_app) -> None:
         sid = test_app.state._test_session_id
         client.post(
@@ -357,6 +518,55 @@ class TestFeedbackAPI:
         assert all(e["session_id"] == sid for e in data)
 
 
+class TestFeedbackBatchAPI:
+    """Tests for POST /api/staff/feedback/batch."""
+
+    def test_submit_batch(self, client, test_app) -> None:
+        sid = test_app.state._test_session_id
+        resp = client.post(
+            "/api/staff/feedback/batch",
+            json=[
+                {"session_id": sid, "message_index": 0, "flag_type": "other"},
+                {"session_id": sid, "message_index": 1, "flag_type": "inaccurate"},
+            ],
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["count"] == 2
+        assert len(data["feedback_ids"]) == 2
+        assert test_app.state.feedback_store.count() == 2
+        stored = test_app.state.feedback_store.list_all()
+        assert stored[0].timestamp == stored[1].timestamp
+        assert {e.flag_type for e in stored} == {FlagType.OTHER, FlagType.INACCURATE}
+
+    def test_submit_batch_reports_all_errors(self, client, test_app) -> None:
+        sid = test_app.state._test_session_id
+        resp = client.post(
+            "/api/staff/feedback/batch",
+            json=[
+                {"session_id": sid, "message_index": 0, "flag_type": "other"},
+                {"session_id": "nonexistent", "message_index": 0, "flag_type": "other"},
+                {"session_id": sid, "message_index": 99, "flag_type": "other"},
+            ],
+        )
+        assert resp.status_code == 400
+        assert [e["index"] for e in resp.json()["detail"]] == [1, 2]
+        # All-or-nothing: the valid entry was not stored either
+        assert test_app.state.feedback_store.count() == 0
+
+    def test_submit_batch_invalid_flag_type(self, client, test_app) -> None:
+        sid = test_app.state._test_session_id
+        resp = client.post(
+            "/api/staff/feedback/batch",
+            json=[
+                {"session_id": sid, "message_index": 0, "flag_type": "other"},
+                {"session_id": sid, "message_index": 0, "flag_type": "bad_type"},
+            ],
+        )
+        assert resp.status_code == 422
+        assert resp.json()["detail"][0]["loc"] == ["body", 1, "flag_type"]
+
+
 class TestShadowAPI:
     """Tests for POST /api/staff/shadow."""
 
@@ -402,6 +612,26 @@ class TestStaffPages:
         assert resp.status_code == 200
         assert "Mission Control" in resp.text
 
+    def test_session_detail_page(self, client, test_app) -> None:
+        sid = test_app.state._test_session_id
+        resp = client.get(f"/staff/sessions/{sid}")
+        assert resp.status_code == 200
+        assert "Mission Control" in resp.text
+        assert resp.headers["etag"] == client.get("/staff/").headers["etag"]
+
+    def test_staff_page_sets_etag(self, client) -> None:
+        resp = client.get("/staff/")
+        assert resp.headers["etag"]
+        assert "max-age" in resp.headers["cache-control"]
+        # All static staff pages share the same rendered body
+        assert client.get("/staff/sessions").headers["etag"] == resp.headers["etag"]
+
+    def test_staff_page_not_modified(self, client) -> None:
+        etag = client.get("/staff/").headers["etag"]
+        resp = client.get("/staff/", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
 
 class TestExistingRoutesNotBroken:
     """Verify existing routes still work after adding Mission Control."""
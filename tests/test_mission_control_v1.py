@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 from fastapi.testclient import TestClient
 
@@ -15,6 +13,7 @@ from municipal.governance.approval import ApprovalGate
 from municipal.intake.store import IntakeStore
 from municipal.web.app import create_app
 from municipal.web.mission_control_v1 import MetricsService, SessionTakeoverManager
+from tests.conftest import StubRAGPipeline
 
 
 class TestMetricsService:
@@ -36,6 +35,32 @@ class TestMetricsService:
         snap = service.snapshot()
         assert snap.total_sessions == 2
 
+    def test_snapshot_approval_counts(self) -> None:
+        gate = ApprovalGate()
+        r1 = gate.request_approval("data_export", "r1", "a@city.gov")
+        gate.request_approval("data_export", "r2", "b@city.gov")
+        gate.deny(r1.request_id, "supervisor@city.gov", "Not allowed")
+        snap = MetricsService(approval_gate=gate).snapshot()
+        assert snap.pending_approvals == 1
+        assert snap.approved_count == 0
+        assert snap.denied_count == 1
+
+    def test_snapshot_is_cached_until_invalidated(self) -> None:
+        sm = SessionManager()
+        service = MetricsService(session_manager=sm, ttl_s=60)
+        assert service.snapshot().total_sessions == 0
+        sm.create_session()
+        assert service.snapshot().total_sessions == 0
+        service.invalidate()
+        assert service.snapshot().total_sessions == 1
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        sm = SessionManager()
+        service = MetricsService(session_manager=sm, ttl_s=0)
+        service.snapshot()
+        sm.create_session()
+        assert service.snapshot().total_sessions == 1
+
     def test_snapshot_with_adapters(self) -> None:
         registry = AdapterRegistry()
         registry.register(MockPermitStatusAdapter())
@@ -70,16 +95,40 @@ class TestSessionTakeoverManager:
         self.mgr.takeover("b", "staff-2")
         assert len(self.mgr.list_takeovers()) == 2
 
+    def test_list_takeovers_is_read_only_view(self) -> None:
+        view = self.mgr.list_takeovers()
+        self.mgr.takeover("a", "staff-1")
+        assert view == {"a": "staff-1"}
+        with pytest.raises(TypeError):
+            view["b"] = "staff-2"  # type: ignore[index]
+
     def test_get_controller_not_taken(self) -> None:
         assert self.mgr.get_controller("nope") is None
 
+    def test_version_bumps_on_change(self) -> None:
+        v0 = self.mgr.version
+        self.mgr.takeover("a", "staff-1")
+        v1 = self.mgr.version
+        self.mgr.release("a")
+        assert v0 < v1 < self.mgr.version
+
+    def test_etag_differs_between_instances(self) -> None:
+        # A restarted process or a second instance restarts the counter at 0.
+        other = SessionTakeoverManager()
+        assert other.version == self.mgr.version
+        assert other.etag() != self.mgr.etag()
+
+    def test_etag_changes_on_change(self) -> None:
+        etag = self.mgr.etag()
+        assert self.mgr.etag() == etag
+        self.mgr.takeover("a", "staff-1")
+        assert self.mgr.etag() != etag
+
 
 @pytest.fixture
 def client() -> TestClient:
     from tests.conftest import install_staff_token
-    mock_rag = MagicMock()
-    mock_rag.query.return_value = MagicMock(answer="test", sources=[], confidence=0.9)
-    app = create_app(settings=Settings(), rag_pipeline=mock_rag)
+    app = create_app(settings=Settings(), rag_pipeline=StubRAGPipeline())
     token = install_staff_token(app)
     return TestClient(app, headers={"Authorization": f"Bearer {token}"})
 
@@ -101,11 +150,46 @@ class TestMissionControlV1API:
         names = [a["name"] for a in data["adapters"]]
         assert "permit_status" in names
 
+    def test_unconfigured_dependencies_return_empty(self, client: TestClient) -> None:
+        client.app.state.adapter_registry = None
+        client.app.state.approval_gate = None
+        resp = client.get("/api/staff/metrics/adapters")
+        assert resp.status_code == 200
+        assert resp.json() == {"adapters": []}
+        resp = client.get("/api/staff/approvals")
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == []
+
     def test_list_approvals_empty(self, client: TestClient) -> None:
         resp = client.get("/api/staff/approvals")
         assert resp.status_code == 200
         assert isinstance(resp.json(), list)
 
+    def test_list_approvals_filtered_by_status(self, client: TestClient) -> None:
+        gate = client.app.state.approval_gate
+        r1 = gate.request_approval("data_export", "r1", "a@city.gov")
+        r2 = gate.request_approval("data_export", "r2", "b@city.gov")
+        gate.deny(r1.request_id, "supervisor@city.gov", "Not allowed")
+
+        pending = client.get("/api/staff/approvals?status=pending").json()
+        assert [r["request_id"] for r in pending] == [r2.request_id]
+        denied = client.get("/api/staff/approvals?status=denied").json()
+        assert [r["request_id"] for r in denied] == [r1.request_id]
+        assert len(client.get("/api/staff/approvals").json()) == 2
+
+    def test_deny_refreshes_metrics(self, client: TestClient) -> None:
+        gate = client.app.state.approval_gate
+        r = gate.request_approval("data_export", "r1", "a@city.gov")
+        client.app.state.metrics_service.invalidate()
+        assert client.get("/api/staff/metrics").json()["pending_approvals"] == 1
+        client.post(
+            f"/api/staff/approvals/{r.request_id}/deny",
+            json={"approver": "supervisor@city.gov", "reason": "no"},
+        )
+        data = client.get("/api/staff/metrics").json()
+        assert data["pending_approvals"] == 0
+        assert data["denied_count"] == 1
+
     def test_approve_not_found(self, client: TestClient) -> None:
         resp = client.post(
             "/api/staff/approvals/nonexistent/approve",
@@ -136,6 +220,31 @@ class TestMissionControlV1API:
         assert resp.status_code == 200
         assert resp.json()["status"] == "released"
 
+    def test_list_takeovers_etag(self, client: TestClient) -> None:
+        resp = client.get("/api/staff/takeovers")
+        assert resp.status_code == 200
+        etag = resp.headers["etag"]
+
+        resp = client.get("/api/staff/takeovers", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+        client.app.state.takeover_manager.takeover("sess-x", "admin")
+        resp = client.get("/api/staff/takeovers", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        assert {"session_id": "sess-x", "staff_id": "admin"} in resp.json()["takeovers"]
+
+    def test_list_takeovers_etag_not_reused_after_restart(self, client: TestClient) -> None:
+        etag = client.get("/api/staff/takeovers").headers["etag"]
+
+        from tests.conftest import install_staff_token
+        restarted = create_app(settings=Settings(), rag_pipeline=StubRAGPipeline())
+        token = install_staff_token(restarted)
+        other = TestClient(restarted, headers={"Authorization": f"Bearer {token}"})
+        resp = other.get("/api/staff/takeovers", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
 
 class TestApprovalWorkflow:
     """Test the full approval workflow through the API."""
@@ -80,6 +80,30 @@ class TestLLMLatencyTracker:
             tracker.record(float(v))
         assert tracker.count == 5  # window only keeps last 5
 
+    def test_zero_size_window_keeps_nothing(self):
+        tracker = LLMLatencyTracker(window_size=0)
+        tracker.record(100.0)
+        assert tracker.count == 0
+        assert tracker.p50() is None
+
+    def test_rolling_window_percentiles_match_resort(self):
+        import random
+
+        rng = random.Random(7)
+        tracker = LLMLatencyTracker(window_size=5)
+        window: list[float] = []
+        for _ in range(50):
+            v = float(rng.randint(1, 20))
+            tracker.record(v)
+            window = (window + [v])[-5:]
+            ordered = sorted(window)
+            idx = 0.5 * (len(ordered) - 1)
+            lower = int(idx)
+            upper = min(lower + 1, len(ordered) - 1)
+            frac = idx - lower
+            expected = round(ordered[lower] * (1 - frac) + ordered[upper] * frac, 2)
+            assert tracker.p50() == expected
+
     def test_clear(self):
         tracker = LLMLatencyTracker()
         tracker.record(100.0)
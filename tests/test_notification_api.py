@@ -2,20 +2,17 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 from fastapi.testclient import TestClient
 
 from municipal.core.config import Settings
 from municipal.web.app import create_app
+from tests.conftest import StubRAGPipeline
 
 
 @pytest.fixture
 def client() -> TestClient:
-    mock_rag = MagicMock()
-    mock_rag.query.return_value = MagicMock(answer="test", sources=[], confidence=0.9)
-    app = create_app(settings=Settings(), rag_pipeline=mock_rag)
+    app = create_app(settings=Settings(), rag_pipeline=StubRAGPipeline())
     return TestClient(app)
 
 
@@ -34,6 +31,20 @@ class TestNotificationAPI:
         data = resp.json()
         assert data["status"] == "delivered"
         assert data["recipient"] == "user@test.com"
+        assert set(data) == {"id", "status", "channel", "recipient", "subject"}
+
+    def test_send_notification_invalid_channel(self, client: TestClient) -> None:
+        resp = client.post(
+            "/api/notifications/send",
+            json={
+                "session_id": "s1",
+                "recipient": "user@test.com",
+                "subject": "Test",
+                "body": "Hello",
+                "channel": "pigeon",
+            },
+        )
+        assert resp.status_code == 422
 
     def test_send_notification_with_template(self, client: TestClient) -> None:
         resp = client.post(
@@ -78,6 +89,11 @@ class TestNotificationAPI:
         resp = client.get("/api/notifications?session_id=s1")
         assert resp.status_code == 200
         assert len(resp.json()) >= 1
+        row = resp.json()[0]
+        assert set(row) == {
+            "id", "session_id", "channel", "recipient", "subject", "status", "created_at",
+        }
+        assert row["channel"] == "email"
 
 
 class TestGraphAPI:
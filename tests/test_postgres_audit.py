@@ -5,20 +5,12 @@ from __future__ import annotations
 import pytest
 
 from municipal.core.types import AuditEvent, DataClassification
-from municipal.db.base import Base
-from municipal.db.engine import DatabaseManager
 from municipal.repositories.postgres.audit import PostgresAuditRepository
 
-import municipal.db.models  # noqa: F401
-
 
 @pytest.fixture
-async def repo():
-    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
-    async with db.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield PostgresAuditRepository(db)
-    await db.close()
+def repo(test_db):
+    return PostgresAuditRepository(test_db)
 
 
 def _make_event(action: str = "test_action") -> AuditEvent:
@@ -56,5 +48,12 @@ async def test_query_by_session(repo):
     assert len(events) == 1
 
 
+async def test_iter_query_streams(repo):
+    await repo.log(_make_event("a"))
+    await repo.log(_make_event("b"))
+    actions = [e.action async for e in repo.iter_query({"actor": "tester"})]
+    assert sorted(actions) == ["a", "b"]
+
+
 async def test_empty_chain_is_valid(repo):
     assert await repo.verify_chain() is True
@@ -2,23 +2,17 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 import pytest
 
-from municipal.db.base import Base
-from municipal.db.engine import DatabaseManager
 from municipal.repositories.postgres.feedback import PostgresFeedbackRepository
 from municipal.web.mission_control import FeedbackEntry, FlagType
 
-import municipal.db.models  # noqa: F401
-
 
 @pytest.fixture
-async def repo():
-    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
-    async with db.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield PostgresFeedbackRepository(db)
-    await db.close()
+def repo(test_db):
+    return PostgresFeedbackRepository(test_db)
 
 
 async def test_add_and_get_by_id(repo):
@@ -43,6 +37,37 @@ async def test_list_all(repo):
     assert len(await repo.list_all()) == 3
 
 
+async def test_add_many(repo):
+    entries = [
+        FeedbackEntry(session_id="s1", message_index=i, flag_type=FlagType.OTHER)
+        for i in range(3)
+    ]
+    await repo.add_many(entries)
+    assert await repo.count() == 3
+
+
+async def test_list_page(repo):
+    for i in range(5):
+        await repo.add(
+            FeedbackEntry(session_id="s1", message_index=i, flag_type=FlagType.OTHER)
+        )
+    page = await repo.list_page(2, offset=1)
+    assert [e.message_index for e in page] == [3, 2]
+
+
+async def test_after_filters(repo):
+    for day in (1, 2, 3):
+        await repo.add(FeedbackEntry(
+            session_id="s1",
+            message_index=day,
+            flag_type=FlagType.OTHER,
+            timestamp=datetime(2025, 1, day, tzinfo=timezone.utc),
+        ))
+    cutoff = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert [e.message_index for e in await repo.list_all(after=cutoff)] == [3, 2]
+    assert [e.message_index for e in await repo.get_for_session("s1", after=cutoff)] == [2, 3]
+
+
 async def test_get_for_session(repo):
     await repo.add(FeedbackEntry(session_id="s1", message_index=0, flag_type=FlagType.OTHER))
     await repo.add(FeedbackEntry(session_id="s2", message_index=0, flag_type=FlagType.OTHER))
@@ -58,3 +83,99 @@ async def test_clear(repo):
     await repo.add(FeedbackEntry(session_id="s1", message_index=0, flag_type=FlagType.OTHER))
     await repo.clear()
     assert await repo.count() == 0
+
+
+# --- Staff feedback API on the Postgres-backed stores ---
+
+
+@pytest.fixture
+async def pg_api(test_db):
+    """An app whose session and feedback stores are the Postgres repos.
+
+    Requests go through httpx's ASGI transport so they run on the test's
+    event loop, which owns the database connection.
+    """
+    import httpx
+
+    from municipal.chat.session import ChatMessage, MessageRole
+    from municipal.core.config import Settings
+    from municipal.repositories.postgres.sessions import PostgresSessionRepository
+    from municipal.web.app import create_app
+    from tests.conftest import StubRAGPipeline, install_staff_token
+
+    app = create_app(settings=Settings(), rag_pipeline=StubRAGPipeline())
+    sessions = PostgresSessionRepository(test_db)
+    app.state.session_manager = sessions
+    app.state.feedback_store = PostgresFeedbackRepository(test_db)
+    session = await sessions.create_session()
+    for role in (MessageRole.USER, MessageRole.ASSISTANT):
+        await sessions.add_message(session.session_id, ChatMessage(role=role, content="hi"))
+    app.state._test_session_id = session.session_id
+
+    token = install_staff_token(app)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://testserver",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        yield client, app
+
+
+async def test_api_submit_feedback_persists(pg_api):
+    client, app = pg_api
+    resp = await client.post("/api/staff/feedback", json={
+        "session_id": app.state._test_session_id,
+        "message_index": 1,
+        "flag_type": "inaccurate",
+    })
+    assert resp.status_code == 200
+    stored = await app.state.feedback_store.get_by_id(resp.json()["feedback_id"])
+    assert stored is not None
+
+
+async def test_api_submit_feedback_unknown_session(pg_api):
+    client, _ = pg_api
+    resp = await client.post("/api/staff/feedback", json={
+        "session_id": "nonexistent",
+        "message_index": 0,
+        "flag_type": "other",
+    })
+    assert resp.status_code == 404
+
+
+async def test_api_submit_feedback_batch_persists(pg_api):
+    client, app = pg_api
+    sid = app.state._test_session_id
+    resp = await client.post("/api/staff/feedback/batch", json=[
+        {"session_id": sid, "message_index": 0, "flag_type": "other"},
+        {"session_id": sid, "message_index": 1, "flag_type": "other"},
+    ])
+    assert resp.status_code == 200
+    assert await app.state.feedback_store.count() == 2
+
+
+async def test_api_list_feedback_paginated(pg_api):
+    client, app = pg_api
+    for i in range(3):
+        await app.state.feedback_store.add(
+            FeedbackEntry(session_id="s1", message_index=i, flag_type=FlagType.OTHER)
+        )
+    resp = await client.get("/api/staff/feedback", params={"limit": 2, "offset": 1})
+    assert resp.status_code == 200
+    assert [e["message_index"] for e in resp.json()] == [1, 0]
+
+
+async def test_api_list_feedback_after(pg_api):
+    client, app = pg_api
+    for day in (1, 2, 3):
+        await app.state.feedback_store.add(FeedbackEntry(
+            session_id="s1",
+            message_index=day,
+            flag_type=FlagType.OTHER,
+            timestamp=datetime(2025, 1, day, tzinfo=timezone.utc),
+        ))
+    after = {"after": "2025-01-01T00:00:00Z"}
+    resp = await client.get("/api/staff/feedback", params=after)
+    assert [e["message_index"] for e in resp.json()] == [3, 2]
+    resp = await client.get("/api/staff/feedback", params={**after, "session_id": "s1"})
+    assert [e["message_index"] for e in resp.json()] == [2, 3]
@@ -4,21 +4,13 @@ from __future__ import annotations
 
 import pytest
 
-from municipal.db.base import Base
-from municipal.db.engine import DatabaseManager
 from municipal.graph.models import Edge, EntityType, Node, RelationshipType
 from municipal.repositories.postgres.graph import PostgresGraphRepository
 
-import municipal.db.models  # noqa: F401
-
 
 @pytest.fixture
-async def repo():
-    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
-    async with db.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield PostgresGraphRepository(db)
-    await db.close()
+def repo(test_db):
+    return PostgresGraphRepository(test_db)
 
 
 async def test_add_and_get_node(repo):
@@ -50,6 +42,13 @@ async def test_bidirectional_traversal(repo):
     assert neighbors[0].id == "a"
 
 
+async def test_has_edge(repo):
+    await repo.add_edge(Edge(source_id="a", target_id="b", relationship=RelationshipType.SUBMITTED))
+    assert await repo.has_edge("a", RelationshipType.SUBMITTED, "b")
+    assert await repo.has_edge("b", RelationshipType.SUBMITTED, "a")
+    assert not await repo.has_edge("a", RelationshipType.OWNS, "b")
+
+
 async def test_query_by_entity_type(repo):
     await repo.add_node(Node(id="p1", entity_type=EntityType.PERSON))
     await repo.add_node(Node(id="c1", entity_type=EntityType.CASE))
@@ -5,21 +5,13 @@ from __future__ import annotations
 import pytest
 
 from municipal.core.types import DataClassification
-from municipal.db.base import Base
-from municipal.db.engine import DatabaseManager
 from municipal.intake.models import Case, StepState, WizardState
 from municipal.repositories.postgres.intake import PostgresIntakeRepository
 
-import municipal.db.models  # noqa: F401
-
 
 @pytest.fixture
-async def repo():
-    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
-    async with db.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield PostgresIntakeRepository(db)
-    await db.close()
+def repo(test_db):
+    return PostgresIntakeRepository(test_db)
 
 
 async def test_save_and_get_wizard_state(repo):
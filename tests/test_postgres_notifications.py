@@ -4,21 +4,13 @@ from __future__ import annotations
 
 import pytest
 
-from municipal.db.base import Base
-from municipal.db.engine import DatabaseManager
 from municipal.notifications.models import Notification, NotificationChannel
 from municipal.repositories.postgres.notifications import PostgresNotificationRepository
 
-import municipal.db.models  # noqa: F401
-
 
 @pytest.fixture
-async def repo():
-    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
-    async with db.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield PostgresNotificationRepository(db)
-    await db.close()
+def repo(test_db):
+    return PostgresNotificationRepository(test_db)
 
 
 async def test_save_and_get(repo):
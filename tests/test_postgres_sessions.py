@@ -6,20 +6,12 @@ import pytest
 
 from municipal.chat.session import ChatMessage, MessageRole
 from municipal.core.types import SessionType
-from municipal.db.base import Base
-from municipal.db.engine import DatabaseManager
 from municipal.repositories.postgres.sessions import PostgresSessionRepository
 
-import municipal.db.models  # noqa: F401
-
 
 @pytest.fixture
-async def repo():
-    db = DatabaseManager("sqlite+aiosqlite:///:memory:")
-    async with db.engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield PostgresSessionRepository(db)
-    await db.close()
+def repo(test_db):
+    return PostgresSessionRepository(test_db)
 
 
 async def test_create_session(repo):
@@ -63,6 +55,24 @@ async def test_list_active_sessions(repo):
     assert len(sessions) == 2
 
 
+async def test_count_active(repo):
+    assert await repo.count_active() == 0
+    await repo.create_session()
+    await repo.create_session(SessionType.VERIFIED)
+    assert await repo.count_active() == 2
+
+
+async def test_list_active_snapshot(repo):
+    first = await repo.create_session()
+    second = await repo.create_session(SessionType.VERIFIED)
+    await repo.add_message(first.session_id, ChatMessage(role=MessageRole.USER, content="Hi"))
+
+    ids, types, _, _, counts = await repo.list_active_snapshot()
+    assert ids == [first.session_id, second.session_id]
+    assert types == [SessionType.ANONYMOUS, SessionType.VERIFIED]
+    assert counts == [1, 0]
+
+
 async def test_round_trip_with_citations(repo):
     session = await repo.create_session()
     msg = ChatMessage(
@@ -0,0 +1,52 @@
+"""Tests for PostgresTakeoverRepository with SQLite async."""
+
+from __future__ import annotations
+
+import pytest
+
+from municipal.repositories.postgres.sessions import PostgresSessionRepository
+from municipal.repositories.postgres.takeovers import PostgresTakeoverRepository
+
+
+@pytest.fixture
+def repo(test_db):
+    return PostgresTakeoverRepository(test_db)
+
+
+@pytest.fixture
+async def session_id(test_db):
+    session = await PostgresSessionRepository(test_db).create_session()
+    return session.session_id
+
+
+async def test_takeover_and_release(repo, session_id):
+    await repo.takeover(session_id, "staff-1")
+    assert await repo.list_takeovers() == {session_id: "staff-1"}
+    assert await repo.get_controller(session_id) == "staff-1"
+
+    result = await repo.release(session_id)
+    assert result["staff_id"] == "staff-1"
+    assert await repo.is_taken_over(session_id) is False
+
+
+async def test_takeover_unknown_session(repo):
+    with pytest.raises(KeyError):
+        await repo.takeover("nonexistent", "staff-1")
+
+
+async def test_etag_changes_with_takeovers(repo, session_id):
+    etag = await repo.etag()
+    await repo.takeover(session_id, "staff-1")
+    taken = await repo.etag()
+    assert taken != etag
+    await repo.release(session_id)
+    assert await repo.etag() == etag
+
+
+async def test_etag_shared_across_instances(test_db, repo, session_id):
+    # A second instance (another worker, or after a restart) sees the same
+    # stored state, including changes it did not make itself.
+    other = PostgresTakeoverRepository(test_db)
+    assert await other.etag() == await repo.etag()
+    await repo.takeover(session_id, "staff-1")
+    assert await other.etag() == await repo.etag()
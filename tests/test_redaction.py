@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import pytest
-import yaml
 
+from municipal.core.yaml_io import safe_dump
 from municipal.review.redaction import RedactionEngine
 from municipal.review.models import Confidence
 
@@ -53,7 +53,7 @@ def rules_path(tmp_path):
     }
     path = tmp_path / "redaction_rules.yml"
     with open(path, "w") as fh:
-        yaml.dump(config, fh)
+        safe_dump(config, fh)
     return path
 
 
@@ -2,20 +2,17 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 from fastapi.testclient import TestClient
 
 from municipal.core.config import Settings
 from municipal.web.app import create_app
+from tests.conftest import StubRAGPipeline
 
 
 @pytest.fixture
 def client():
-    mock_rag = MagicMock()
-    mock_rag.query.return_value = MagicMock(answer="test", sources=[], confidence=0.9)
-    app = create_app(settings=Settings(), rag_pipeline=mock_rag)
+    app = create_app(settings=Settings(), rag_pipeline=StubRAGPipeline())
     return TestClient(app)
 
 
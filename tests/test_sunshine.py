@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
-
 import pytest
 from fastapi.testclient import TestClient
 
@@ -14,9 +12,11 @@ from municipal.intake.models import Case
 from municipal.intake.store import IntakeStore
 from municipal.notifications.models import Notification, NotificationChannel, NotificationStatus
 from municipal.notifications.store import NotificationStore
+from municipal.review.models import SunshineReportData
 from municipal.review.sunshine import SunshineReportGenerator
 from municipal.web.app import create_app
-
+from municipal.web.review_router import SunshinePdfCache
+from tests.conftest import StubRAGPipeline
 
 # --- Unit tests ---
 
@@ -64,6 +64,18 @@ class TestSunshineGenerator:
         assert report.cases_by_type["permit_application"] == 2
         assert report.cases_by_type["foia_request"] == 1
 
+    def test_report_reused_until_cases_change(self, generator, store):
+        first = generator.generate()
+        assert generator.generate() is first
+        store.save_case(_make_case())
+        second = generator.generate()
+        assert second is not first
+        assert second.total_cases == 1
+
+    def test_zero_ttl_always_rebuilds(self, store):
+        generator = SunshineReportGenerator(intake_store=store, ttl_s=0)
+        assert generator.generate() is not generator.generate()
+
     def test_cases_by_status(self, generator, store):
         store.save_case(_make_case(status="submitted"))
         store.save_case(_make_case(status="approved"))
@@ -123,14 +135,58 @@ class TestSunshineGenerator:
         assert report.generated_at is not None
 
 
+class TestSunshinePdfCache:
+    def test_key_ignores_generated_at(self):
+        from datetime import datetime, timezone
+
+        a = SunshineReportData(total_cases=1)
+        b = SunshineReportData(
+            total_cases=1, generated_at=datetime(2020, 1, 1, tzinfo=timezone.utc)
+        )
+        assert SunshinePdfCache.key_for(a) == SunshinePdfCache.key_for(b)
+        assert SunshinePdfCache.key_for(a) != SunshinePdfCache.key_for(
+            SunshineReportData(total_cases=2)
+        )
+
+    async def test_concurrent_requests_share_one_render(self):
+        import asyncio
+        import threading
+
+        cache = SunshinePdfCache()
+        calls = 0
+        release = threading.Event()
+
+        def render() -> bytes:
+            nonlocal calls
+            calls += 1
+            release.wait(timeout=5)
+            return b"%PDF-1"
+
+        first = asyncio.create_task(cache.get_or_render("k", render))
+        second = asyncio.create_task(cache.get_or_render("k", render))
+        await asyncio.sleep(0.05)
+        release.set()
+        assert await first == await second == b"%PDF-1"
+        assert await cache.get_or_render("k", render) == b"%PDF-1"
+        assert calls == 1
+
+    async def test_failed_render_is_not_cached(self):
+        cache = SunshinePdfCache()
+
+        def boom() -> bytes:
+            raise RuntimeError("render failed")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_render("k", boom)
+        assert await cache.get_or_render("k", lambda: b"ok") == b"ok"
+
+
 # --- API integration tests ---
 
 
 @pytest.fixture
 def client():
-    mock_rag = MagicMock()
-    mock_rag.query.return_value = MagicMock(answer="test", sources=[], confidence=0.9)
-    app = create_app(settings=Settings(), rag_pipeline=mock_rag)
+    app = create_app(settings=Settings(), rag_pipeline=StubRAGPipeline())
     return TestClient(app)
 
 
@@ -149,3 +205,10 @@ class TestSunshineAPI:
         assert resp.headers["content-type"] == "application/pdf"
         # PDF should start with %PDF
         assert resp.content[:4] == b"%PDF"
+
+    def test_sunshine_pdf_etag(self, client):
+        resp = client.get("/api/review/sunshine/pdf")
+        etag = resp.headers["etag"]
+        cached = client.get("/api/review/sunshine/pdf", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
@@ -0,0 +1,36 @@
+"""Tests for the shared YAML helpers."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+from municipal.core import yaml_io
+from municipal.core.yaml_io import load_config_file, safe_dump
+
+
+class TestLoadConfigFile:
+    def test_repeat_load_returns_fresh_equal_objects(self, tmp_path: Path) -> None:
+        path = tmp_path / "rules.yml"
+        path.write_text(safe_dump({"wizards": {"w": [{"type": "date_order"}]}}))
+
+        first = load_config_file(path)
+        second = load_config_file(path)
+        assert first == second
+        assert first is not second
+        assert path.resolve() in yaml_io._snapshots
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path) -> None:
+        path = tmp_path / "rules.yml"
+        path.write_text(safe_dump({"rules": []}))
+        assert load_config_file(path) == {"rules": []}
+
+        path.write_text(safe_dump({"rules": [{"name": "new"}]}))
+        assert load_config_file(path) == {"rules": [{"name": "new"}]}
+
+    def test_non_json_documents_are_not_snapshotted(self, tmp_path: Path) -> None:
+        path = tmp_path / "deadlines.yml"
+        path.write_text(safe_dump({"start": date(2024, 1, 1), 1: "int key"}))
+
+        assert load_config_file(path) == {"start": date(2024, 1, 1), 1: "int key"}
+        assert path.resolve() not in yaml_io._snapshots